@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⚡ Another Eden 동시 이미지 다운로드 엔진
+호스트별 토큰 버킷으로 요청 속도를 제한하면서 스레드 풀로 이미지를 병렬 다운로드합니다.
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+from http_fetcher import HttpFetcher
+
+
+# 기본 설정 (위키 서버 부하를 고려한 값)
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_RATE_PER_HOST = 4.0   # 호스트당 초당 요청 수
+DEFAULT_BURST = 4             # 호스트당 순간 최대 요청 수
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (초당 rate개 충전, 최대 capacity개 보관)"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self):
+        """토큰 1개를 얻을 때까지 대기 (대기한 시간 반환)"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 관리 (같은 서버에는 정해진 속도 이상 요청하지 않음)"""
+
+    def __init__(self, rate=DEFAULT_RATE_PER_HOST, burst=DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self.buckets[host] = bucket
+        return bucket.acquire()
+
+
+class DownloadStats:
+    """다운로드 처리량 통계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = None  # 첫 요청 시점부터 측정
+        self.files = 0
+        self.bytes = 0
+        self.skipped = 0
+        self.failed = 0
+        self.requests = 0
+        self.throttled_seconds = 0.0
+
+    def add(self, field, amount=1):
+        with self.lock:
+            if self.started_at is None:
+                self.started_at = time.monotonic()
+            setattr(self, field, getattr(self, field) + amount)
+
+    def summary(self):
+        started_at = self.started_at if self.started_at is not None else time.monotonic()
+        elapsed = max(time.monotonic() - started_at, 1e-6)
+        return {
+            'files': self.files,
+            'bytes': self.bytes,
+            'skipped': self.skipped,
+            'failed': self.failed,
+            'requests': self.requests,
+            'elapsed': elapsed,
+            'files_per_sec': self.files / elapsed,
+            'bytes_per_sec': self.bytes / elapsed,
+            'throttled_seconds': self.throttled_seconds,
+        }
+
+    def print_report(self):
+        s = self.summary()
+        print("⚡ 다운로드 처리량")
+        print(f"   새 파일: {s['files']}개, 스킵: {s['skipped']}개, 실패: {s['failed']}개 (요청 {s['requests']}회)")
+        print(f"   전송량: {s['bytes'] / 1024:.1f} KB, 소요 시간: {s['elapsed']:.1f}초")
+        print(f"   처리량: {s['files_per_sec']:.2f} files/s, {s['bytes_per_sec'] / 1024:.1f} KB/s")
+        print(f"   속도 제한 대기: {s['throttled_seconds']:.1f}초 (스레드 합계)")
+
+
+class DownloadEngine:
+    """스레드 풀 + 호스트별 속도 제한 다운로드 엔진"""
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, rate_per_host=DEFAULT_RATE_PER_HOST,
+                 burst=DEFAULT_BURST, headers=None, timeout=30, fetcher=None, cache=None, store=None):
+        self.max_workers = max_workers
+        self.store = store  # ImageStore가 있으면 같은 바이트는 blob 하나로 저장
+        self.cache = cache  # HttpCache가 있으면 기존 파일도 조건부 요청으로 변경 여부 확인
+        self.timeout = timeout
+        self.limiter = HostRateLimiter(rate_per_host, burst)
+        self.stats = DownloadStats()
+        # 커넥션 풀은 작업자 수 이상이어야 keep-alive 연결이 재사용됨
+        self.fetcher = fetcher or HttpFetcher(headers=headers, pool_size=max_workers, timeout=timeout)
+        # 같은 파일을 여러 캐릭터가 동시에 받지 않도록 저장 경로별 잠금
+        self._path_locks = {}
+        self._path_locks_guard = threading.Lock()
+
+    def _throttle(self, url):
+        waited = self.limiter.wait(url)
+        if waited:
+            self.stats.add('throttled_seconds', waited)
+        self.stats.add('requests')
+
+    def head(self, url, timeout=5):
+        """속도 제한을 적용한 HEAD 요청"""
+        self._throttle(url)
+        return self.fetcher.head(url, timeout=timeout)
+
+    def get(self, url, timeout=None, headers=None):
+        """속도 제한을 적용한 GET 요청"""
+        self._throttle(url)
+        response = self.fetcher.get(url, timeout=timeout or self.timeout, headers=headers)
+        response.raise_for_status()
+        return response
+
+    def _lock_for(self, path):
+        key = os.path.normcase(os.path.abspath(str(path)))
+        with self._path_locks_guard:
+            lock = self._path_locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._path_locks[key] = lock
+        return lock
+
+    def fetch_to_file(self, url, save_path):
+        """URL을 save_path로 저장 ('downloaded' 또는 'skipped' 반환, 실패 시 예외)"""
+        with self._lock_for(save_path):
+            exists = os.path.exists(save_path)
+            if exists and self.cache is None:
+                self.stats.add('skipped')
+                return 'skipped'
+
+            # 기존 파일은 저장된 ETag/Last-Modified(없으면 파일 수정 시각)로 변경 여부만 확인
+            headers = None
+            if exists:
+                headers = self.cache.conditional_headers(url, fallback_mtime=os.path.getmtime(save_path))
+
+            try:
+                response = self.get(url, headers=headers)
+            except Exception:
+                self.stats.add('failed')
+                raise
+
+            if exists and response.status_code == 304:
+                self.cache.record_hit(os.path.getsize(save_path))
+                self.stats.add('skipped')
+                return 'skipped'
+
+            content = response.content
+
+            if self.store is not None:
+                self.store.put_bytes(content, save_path)
+            else:
+                # 중간에 중단되어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+                tmp_path = f"{save_path}.part"
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(tmp_path, save_path)
+
+            if self.cache is not None:
+                # 이미지 본문은 저장 파일 자체가 캐시이므로 검증자만 기록
+                self.cache.store(url, response)
+                self.cache.record_miss(len(content))
+
+            self.stats.add('files')
+            self.stats.add('bytes', len(content))
+            return 'downloaded'
+
+    def run(self, tasks, on_done=None):
+        """
+        작업 목록을 스레드 풀에서 실행합니다.
+
+        Args:
+            tasks: (key, callable) 튜플 리스트. callable은 인자 없이 호출됩니다.
+            on_done: 작업 하나가 끝날 때마다 메인 스레드에서 호출되는 콜백 (key, result, error).
+
+        Returns:
+            {key: result} 딕셔너리 (실패한 작업은 None)
+        """
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {executor.submit(fn): key for key, fn in tasks}
+            for future in as_completed(futures):
+                key = futures[future]
+                error = None
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result, error = None, e
+                results[key] = result
+                if on_done:
+                    on_done(key, result, error)
+        except KeyboardInterrupt:
+            # 대기 중인 작업은 취소하고, 실행 중인 작업만 마무리
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+        return results
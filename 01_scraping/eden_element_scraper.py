@@ -8,7 +8,6 @@
 import os
 import sys
 import time
-import requests
 import pandas as pd
 from pathlib import Path
 from bs4 import BeautifulSoup
@@ -17,6 +16,9 @@ import re
 import unicodedata
 import json
 
+sys.path.insert(0, str(Path(__file__).parent.resolve()))
+from http_fetcher import HttpFetcher
+
 # 프로젝트 루트 설정
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
 DATA_DIR = PROJECT_ROOT / "04_data"
@@ -34,6 +36,7 @@ class ElementScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
+        self.fetcher = HttpFetcher(headers=self.headers)
         self.element_mapping = {
             'Fire': '불',
             'Water': '물', 
@@ -66,7 +69,7 @@ class ElementScraper:
     def scrape_character_elements(self, character_url, character_name):
         """캐릭터의 속성 정보 스크래핑"""
         try:
-            response = requests.get(character_url, headers=self.headers, timeout=30)
+            response = self.fetcher.get(character_url, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -111,7 +114,7 @@ class ElementScraper:
         print("🔥 모든 캐릭터 속성 정보 스크래핑 중...")
         
         try:
-            response = requests.get(TARGET_URL, headers=self.headers, timeout=30)
+            response = self.fetcher.get(TARGET_URL, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -207,6 +210,7 @@ class ElementScraper:
         else:
             print("❌ 속성 정보를 가져올 수 없습니다.")
         
+        self.fetcher.stats.print_report()
         print("=" * 50)
         print("✅ 속성 정보 스크래핑 완료!")
 
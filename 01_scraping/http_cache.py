@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗄️ Another Eden 조건부 HTTP 캐시
+URL별로 ETag/Last-Modified 검증자와 본문을 디스크에 저장하고,
+다음 실행부터 If-None-Match/If-Modified-Since 조건부 요청으로 변경 여부만 확인합니다.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from email.utils import formatdate
+
+import requests
+
+
+class HttpCache:
+    """URL 키 기반 디스크 캐시 (메타데이터 JSON + 본문 파일)"""
+
+    def __init__(self, cache_dir, fetcher):
+        self.cache_dir = str(cache_dir)
+        self.fetcher = fetcher
+        self.lock = threading.Lock()
+        self.hits = 0            # 304 Not Modified
+        self.misses = 0          # 새로 받았거나 변경된 응답
+        self.bytes_saved = 0     # 304 덕분에 받지 않은 본문 크기
+        self.bytes_fetched = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # --- 저장소 ---
+
+    def _key(self, url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+
+    def _meta_path(self, url):
+        return os.path.join(self.cache_dir, self._key(url) + '.json')
+
+    def _body_path(self, url):
+        return os.path.join(self.cache_dir, self._key(url) + '.body')
+
+    def load_meta(self, url):
+        try:
+            with open(self._meta_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_atomic(self, path, data, mode='wb'):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, mode) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def store(self, url, response, body=None):
+        """응답의 검증자(와 선택적으로 본문)를 저장"""
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+            'encoding': response.encoding,
+            'has_body': body is not None,
+            'size': len(body) if body is not None else None,
+            'stored_at': time.time(),
+        }
+        if body is not None:
+            self._write_atomic(self._body_path(url), body)
+        self._write_atomic(self._meta_path(url),
+                           json.dumps(meta, ensure_ascii=False, indent=2), mode='w')
+
+    def conditional_headers(self, url, fallback_mtime=None):
+        """저장된 검증자로 조건부 요청 헤더 생성 (검증자가 없으면 파일 수정 시각 사용)"""
+        meta = self.load_meta(url) or {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        elif fallback_mtime is not None and 'If-None-Match' not in headers:
+            headers['If-Modified-Since'] = formatdate(fallback_mtime, usegmt=True)
+        return headers
+
+    # --- 통계 ---
+
+    def record_hit(self, size=0):
+        with self.lock:
+            self.hits += 1
+            self.bytes_saved += size or 0
+
+    def record_miss(self, size=0):
+        with self.lock:
+            self.misses += 1
+            self.bytes_fetched += size or 0
+
+    def print_report(self):
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        print("🗄️ HTTP 캐시")
+        print(f"   적중(304): {self.hits}회, 미스: {self.misses}회 (적중률 {rate:.1f}%)")
+        print(f"   절약한 전송량: {self.bytes_saved / 1024:.1f} KB, 새로 받은 양: {self.bytes_fetched / 1024:.1f} KB")
+
+    # --- 페이지 요청 ---
+
+    def _response_from_cache(self, url, meta):
+        with open(self._body_path(url), 'rb') as f:
+            body = f.read()
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        if meta.get('content_type'):
+            response.headers['Content-Type'] = meta['content_type']
+        response.encoding = meta.get('encoding')
+        response.from_cache = True
+        return response
+
+    def get(self, url, **kwargs):
+        """
+        캐시를 거친 GET 요청
+
+        본문이 저장된 URL은 조건부 요청을 보내고, 304이면 저장된 본문으로 만든 응답을 반환합니다.
+        """
+        meta = self.load_meta(url)
+        has_body = bool(meta and meta.get('has_body') and os.path.exists(self._body_path(url)))
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if has_body:
+            headers.update(self.conditional_headers(url))
+
+        response = self.fetcher.get(url, headers=headers, **kwargs)
+        if response.status_code == 304 and has_body:
+            self.record_hit(meta.get('size'))
+            return self._response_from_cache(url, meta)
+
+        if response.status_code == 200:
+            self.store(url, response, body=response.content)
+            self.record_miss(len(response.content))
+        response.from_cache = False
+        return response
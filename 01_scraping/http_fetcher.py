@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🌐 Another Eden 공용 HTTP 요청 레이어
+커넥션 풀(keep-alive)을 공유하는 Session, 429/5xx 지수 백오프 재시도, 요청별 시간 통계를 제공합니다.
+모든 스크래퍼(master_scraper, eden_element_scraper, create_complete_unified_data)가 이 모듈을 통해 요청합니다.
+"""
+
+import time
+import random
+import threading
+from collections import Counter
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+DEFAULT_POOL_SIZE = 16       # 호스트당 유지할 커넥션 수
+DEFAULT_TIMEOUT = 30
+DEFAULT_MAX_RETRIES = 4
+DEFAULT_BACKOFF_BASE = 0.5   # 첫 재시도 대기 (초), 시도마다 2배
+DEFAULT_BACKOFF_MAX = 30.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchStats:
+    """요청 시간/재시도 통계 (스레드 안전)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_url = ''
+        self.status_counts = Counter()
+        self.host_counts = Counter()
+
+    def record(self, url, seconds, status=None):
+        with self.lock:
+            self.requests += 1
+            self.total_seconds += seconds
+            self.host_counts[urlparse(url).netloc] += 1
+            if status is not None:
+                self.status_counts[status] += 1
+            if seconds > self.slowest_seconds:
+                self.slowest_seconds = seconds
+                self.slowest_url = url
+
+    def add_retry(self):
+        with self.lock:
+            self.retries += 1
+
+    def add_failure(self):
+        with self.lock:
+            self.failures += 1
+
+    def summary(self):
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'retries': self.retries,
+                'failures': self.failures,
+                'total_seconds': self.total_seconds,
+                'avg_ms': (self.total_seconds / self.requests * 1000) if self.requests else 0.0,
+                'slowest_ms': self.slowest_seconds * 1000,
+                'slowest_url': self.slowest_url,
+                'status_counts': dict(self.status_counts),
+                'host_counts': dict(self.host_counts),
+            }
+
+    def print_report(self):
+        s = self.summary()
+        print("🌐 HTTP 요청 통계")
+        print(f"   요청: {s['requests']}회, 재시도: {s['retries']}회, 실패: {s['failures']}회")
+        print(f"   평균 응답 시간: {s['avg_ms']:.0f}ms, 최장: {s['slowest_ms']:.0f}ms")
+        if s['status_counts']:
+            codes = ', '.join(f"{code}: {count}" for code, count in sorted(s['status_counts'].items()))
+            print(f"   상태 코드: {codes}")
+
+
+class HttpFetcher:
+    """커넥션 풀 Session + 재시도/백오프 래퍼"""
+
+    def __init__(self, headers=None, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT,
+                 max_retries=DEFAULT_MAX_RETRIES, backoff_base=DEFAULT_BACKOFF_BASE,
+                 backoff_max=DEFAULT_BACKOFF_MAX):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.stats = FetchStats()
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        # 재시도는 직접 처리하므로 어댑터 재시도는 끔
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _backoff_delay(self, attempt, response=None):
+        """지수 백오프 + full jitter (429의 Retry-After 헤더가 있으면 우선)"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        cap = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def request(self, method, url, **kwargs):
+        """
+        재시도를 포함한 HTTP 요청
+
+        429/5xx 응답과 연결 오류/타임아웃은 최대 max_retries회 재시도합니다.
+        재시도 후에도 실패한 응답은 그대로 반환하므로 호출 측에서 raise_for_status()로 처리합니다.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.stats.record(url, time.perf_counter() - started)
+                if attempt >= self.max_retries:
+                    self.stats.add_failure()
+                    raise
+                delay = self._backoff_delay(attempt)
+            else:
+                self.stats.record(url, time.perf_counter() - started, response.status_code)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    if response.status_code >= 400:
+                        self.stats.add_failure()
+                    return response
+                delay = self._backoff_delay(attempt, response)
+                response.close()
+
+            attempt += 1
+            self.stats.add_retry()
+            time.sleep(delay)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('HEAD', url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_default_fetcher = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_fetcher():
+    """프로세스 공용 HttpFetcher (모듈 함수 기반 스크립트용)"""
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = HttpFetcher()
+        return _default_fetcher
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧱 Another Eden 콘텐츠 주소 이미지 저장소
+이미지 바이트는 SHA-256 해시 이름의 blob으로 한 번만 저장하고,
+기존 경로(영문명/한글명/정리용 번호 복사본 등)는 blob을 가리키는 하드 링크 + 이름→해시 인덱스로 관리합니다.
+같은 아이콘이 여러 이름으로 저장되어도 로컬 디스크에는 한 벌만 남습니다.
+
+하드 링크는 로컬 디스크 사용량만 줄입니다. git은 이미 같은 내용을 한 blob으로 저장하지만,
+체크아웃/압축/배포 번들에는 추적 중인 경로마다 파일이 하나씩 들어가므로 중복 경로 자체는 그대로 남습니다.
+인덱스 키는 프로젝트 루트 기준 상대 경로라 다른 컴퓨터에서도 그대로 쓸 수 있습니다.
+
+사용법:
+    python image_store.py           # 04_data/images 아래 기존 파일을 저장소로 옮기고 중복 제거
+    python image_store.py --verify  # 인덱스와 실제 파일 일치 여부 확인
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+IMAGE_ROOT = PROJECT_ROOT / "04_data" / "images"
+BLOB_DIR_NAME = "blobs"
+INDEX_FILE_NAME = "image_index.json"
+INDEX_KEY_BASE = "project"  # 인덱스 키 기준 (이전 버전은 저장소 루트 기준 상대 경로 + 바깥은 절대 경로)
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
+
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ImageStore:
+    """해시 이름 blob + 이름→해시 인덱스 (스레드 안전)"""
+
+    def __init__(self, root=IMAGE_ROOT):
+        self.root = Path(root).resolve()
+        self.blob_dir = self.root / BLOB_DIR_NAME
+        self.index_path = self.root / INDEX_FILE_NAME
+        self.lock = threading.RLock()
+        self.names = {}       # 이름(프로젝트 기준 상대 경로) → 해시
+        self.dirty = False
+        self.load_index()
+
+    # --- 인덱스 ---
+
+    def load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.names = data.get('names', {})
+        if self.names and data.get('key_base') != INDEX_KEY_BASE:
+            # 이전 형식의 키(저장소 기준 상대 경로/절대 경로)를 프로젝트 기준으로 변환
+            self.names = {self._name_for(name if os.path.isabs(name) else self.root / name): digest
+                          for name, digest in self.names.items()}
+            self.dirty = True
+
+    def flush(self):
+        """변경된 인덱스를 디스크에 저장 (원자적 교체)"""
+        with self.lock:
+            if not self.dirty:
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{self.index_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'updated_at': time.strftime('%Y-%m-%d %H:%M:%S'), 'key_base': INDEX_KEY_BASE,
+                           'names': self.names},
+                          f, ensure_ascii=False, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+            self.dirty = False
+
+    def _name_for(self, path):
+        """인덱스 키: 프로젝트 기준 상대 경로 (프로젝트 밖의 파일만 절대 경로, 항상 / 구분자)"""
+        path = Path(path).resolve()
+        try:
+            return path.relative_to(PROJECT_ROOT).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def lookup(self, path):
+        """경로에 연결된 해시 (인덱스에 없으면 None)"""
+        return self.names.get(self._name_for(path))
+
+    # --- blob ---
+
+    def blob_path(self, digest, ext='.png'):
+        return self.blob_dir / digest[:2] / f"{digest}{ext.lower()}"
+
+    def _link(self, src, dest):
+        """dest를 src의 하드 링크로 원자적 교체 (링크 불가 시 복사)"""
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = dest.with_name(f".{dest.name}.{threading.get_ident()}.tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        try:
+            os.link(src, tmp_path)
+        except OSError:
+            shutil.copy2(src, tmp_path)
+        # 기존 파일 내용을 덮어쓰지 않고 디렉터리 항목만 교체하므로 다른 이름의 blob은 안전함
+        os.replace(tmp_path, dest)
+
+    def _ensure_blob(self, digest, ext, data=None, src=None):
+        blob = self.blob_path(digest, ext)
+        if blob.exists():
+            return blob
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        if data is not None:
+            tmp_path = f"{blob}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, blob)
+        else:
+            self._link(src, blob)
+        return blob
+
+    def _register(self, dest, digest):
+        with self.lock:
+            name = self._name_for(dest)
+            if self.names.get(name) != digest:
+                self.names[name] = digest
+                self.dirty = True
+
+    # --- 쓰기 API ---
+
+    def put_bytes(self, data, dest):
+        """바이트를 저장하고 dest 경로를 blob에 연결 (해시 반환)"""
+        digest = hash_bytes(data)
+        ext = os.path.splitext(str(dest))[1] or '.png'
+        with self.lock:
+            blob = self._ensure_blob(digest, ext, data=data)
+        self._link(blob, dest)
+        self._register(dest, digest)
+        return digest
+
+    def put_file(self, src, dest=None):
+        """
+        기존 파일을 저장소에 넣고 dest(없으면 src 자체)를 blob에 연결
+
+        shutil.copy2 대신 사용하면 복사본이 실제 바이트 대신 인덱스 항목이 됩니다.
+        """
+        src = Path(src)
+        dest = Path(dest) if dest is not None else src
+        digest = hash_file(src)
+        ext = src.suffix or '.png'
+        with self.lock:
+            blob = self._ensure_blob(digest, ext, src=src)
+        if not os.path.exists(dest) or not os.path.samefile(blob, dest):
+            self._link(blob, dest)
+        self._register(dest, digest)
+        return digest
+
+    def rename(self, old, new):
+        """파일 이름 변경 + 인덱스 갱신 (os.rename 대신 사용)"""
+        os.rename(old, new)
+        with self.lock:
+            digest = self.names.pop(self._name_for(old), None)
+            if digest is not None:
+                self.names[self._name_for(new)] = digest
+                self.dirty = True
+
+    # --- 유지보수 ---
+
+    def iter_image_files(self, directory=None):
+        directory = Path(directory) if directory is not None else self.root
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames[:] = [d for d in dirnames if (Path(dirpath) / d).resolve() != self.blob_dir]
+            for filename in filenames:
+                if os.path.splitext(filename)[1].lower() in IMAGE_EXTENSIONS:
+                    yield Path(dirpath) / filename
+
+    def dedupe(self, directory=None):
+        """디렉터리의 기존 이미지를 모두 저장소에 넣고 같은 바이트는 하나의 blob으로 합침"""
+        files = 0
+        bytes_before = 0
+        for path in self.iter_image_files(directory):
+            bytes_before += path.stat().st_size
+            self.put_file(path)
+            files += 1
+        self.flush()
+        blob_bytes = sum(p.stat().st_size for p in self.blob_dir.rglob('*') if p.is_file())
+        blob_count = sum(1 for p in self.blob_dir.rglob('*') if p.is_file())
+        return {'files': files, 'blobs': blob_count, 'bytes_before': bytes_before, 'bytes_after': blob_bytes}
+
+    def verify(self):
+        """인덱스의 각 이름이 존재하고 해시가 일치하는지 확인 (문제 목록 반환)"""
+        problems = []
+        for name, digest in sorted(self.names.items()):
+            path = Path(name) if os.path.isabs(name) else PROJECT_ROOT / name
+            if not path.exists():
+                problems.append((name, 'missing'))
+            elif hash_file(path) != digest:
+                problems.append((name, 'hash mismatch'))
+        return problems
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_image_store():
+    """프로세스 공용 ImageStore (04_data/images)"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ImageStore()
+        return _default_store
+
+
+if __name__ == "__main__":
+    store = ImageStore()
+    if len(sys.argv) > 1 and sys.argv[1] == "--verify":
+        problems = store.verify()
+        for name, reason in problems:
+            print(f"  ✗ {name}: {reason}")
+        print(f"✅ 인덱스 {len(store.names)}개 확인, 문제 {len(problems)}개")
+        sys.exit(1 if problems else 0)
+
+    print(f"🧱 이미지 저장소 정리 중: {store.root}")
+    result = store.dedupe()
+    saved = result['bytes_before'] - result['bytes_after']
+    print(f"   파일: {result['files']}개 → 고유 blob: {result['blobs']}개")
+    print(f"   용량: {result['bytes_before'] / 1024 / 1024:.1f} MB → {result['bytes_after'] / 1024 / 1024:.1f} MB "
+          f"(로컬 디스크 {saved / 1024 / 1024:.1f} MB 절약, 추적 중인 경로 수는 그대로)")
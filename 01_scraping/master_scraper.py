@@ -14,6 +14,8 @@ from pathlib import Path
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, unquote, parse_qs, urlparse
 import re
+import json
+import hashlib
 import unicodedata
 import mimetypes
 from openpyxl import Workbook
@@ -21,6 +23,15 @@ import traceback
 import urllib3
 import ssl
 
+sys.path.insert(0, str(Path(__file__).parent.resolve()))
+from http_fetcher import HttpFetcher
+from http_cache import HttpCache
+from download_engine import DownloadEngine
+from scrape_journal import ScrapeJournal
+from image_store import ImageStore
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve() / "03_apps" / "shared"))
+from character_ids import assign_character_ids, character_id, parse_character_id
+from image_assets import build_image_assets
 
 # 프로젝트 루트 설정
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
@@ -28,12 +39,37 @@ SCRAPING_DIR = PROJECT_ROOT / "01_scraping"
 DATA_DIR = PROJECT_ROOT / "04_data"
 CSV_DIR = DATA_DIR / "csv"
 IMAGE_DIR = DATA_DIR / "images" / "character_art"
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+SCRAPE_MANIFEST_PATH = CSV_DIR / "scrape_manifest.json"  # 캐릭터별 목록 데이터 지문 (증분 모드용)
+SCRAPE_JOURNAL_PATH = DATA_DIR / "scrape_journal.jsonl"  # 캐릭터별 완료 기록 (--resume용)
 
 # 스크래핑 설정
 BASE_URL = "https://anothereden.wiki"
 TARGET_URL = "https://anothereden.wiki/w/Characters"
 PERSONALITY_URL = "https://anothereden.wiki/w/Characters/Personality"
 
+# 다운로드 설정 (호스트당 초당 요청 수로 서버 부하 제한)
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_RATE_PER_HOST = 4.0
+DOWNLOAD_BURST = 4
+HTTP_POOL_SIZE = 16  # 공유 Session 커넥션 풀 크기 (DOWNLOAD_WORKERS 이상 권장)
+
+
+def wiki_page_key(url):
+    """위키 링크(/w/Raven_(Another_Style) 또는 전체 URL)의 문서 이름 ('Raven (Another Style)')"""
+    path = urlparse(url).path if url else ''
+    if not path.startswith('/w/'):
+        return ''
+    return unquote(path[len('/w/'):]).replace('_', ' ').strip()
+
+
+def row_character_id(char):
+    """캐릭터 dict/CSV 행의 캐릭터 ID (기록된 값이 없으면 아이콘 에셋 → 영문명 순으로 생성)"""
+    char_id = parse_character_id(char.get('character_id'))
+    if char_id is None:
+        char_id = character_id(char.get('image_url') or char.get('image_path', ''), char.get('english_name', ''))
+    return char_id
+
 
 class MasterScraper:
     """통합 마스터 스크래퍼"""
@@ -45,6 +81,20 @@ class MasterScraper:
         self.character_data = []
         self.name_mapping = {}
         self.personality_mapping = {}
+        # 목록/상세/퍼스널리티/이미지 요청이 모두 같은 커넥션 풀을 사용
+        self.fetcher = HttpFetcher(headers=self.headers, pool_size=HTTP_POOL_SIZE)
+        # 위키 페이지/이미지의 ETag·Last-Modified를 저장해 변경된 것만 다시 받음
+        self.http_cache = HttpCache(HTTP_CACHE_DIR, self.fetcher)
+        # 같은 아이콘을 여러 이름으로 받아도 바이트는 한 번만 저장 (해시 blob + 하드 링크)
+        self.image_store = ImageStore(DATA_DIR / "images")
+        self.download_engine = DownloadEngine(
+            max_workers=DOWNLOAD_WORKERS,
+            rate_per_host=DOWNLOAD_RATE_PER_HOST,
+            burst=DOWNLOAD_BURST,
+            fetcher=self.fetcher,
+            cache=self.http_cache,
+            store=self.image_store
+        )
         self.setup_directories()
         
     def setup_directories(self):
@@ -162,7 +212,7 @@ class MasterScraper:
             # 확장자가 불분명할 경우, HTTP 헤더를 통해 추측
             if not ext or len(ext) > 5:
                 try:
-                    head_resp = requests.head(full_image_url, timeout=5, allow_redirects=True)
+                    head_resp = self.download_engine.head(full_image_url, timeout=5)
                     head_resp.raise_for_status()
                     content_type = head_resp.headers.get('Content-Type')
                     if content_type:
@@ -181,24 +231,17 @@ class MasterScraper:
             
             save_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # 중복 파일 체크 (이미 존재하면 스킵)
-            if self.check_file_exists(str(save_path)) is None:
-                # 파일이 이미 존재하는 경우
-                relative_path = save_path.relative_to(PROJECT_ROOT).as_posix()
-                print(f"  ⏭️ 파일이 이미 존재하여 스킵: {relative_path}")
-                return str(relative_path)
-            
-            # 3. 실제 다운로드 및 저장
-            response = requests.get(full_image_url, headers=self.headers, timeout=30)
-            response.raise_for_status()  # 4xx, 5xx 에러 발생 시 예외 처리
-            
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
+            # 3. 실제 다운로드 및 저장 (속도 제한 적용, 4xx/5xx는 예외 처리)
+            #    이미 있는 파일은 조건부 요청으로 변경 여부만 확인하고, 304이면 스킵
+            status = self.download_engine.fetch_to_file(full_image_url, save_path)
             
             # 4. 성공 처리
             # 프로젝트 루트에서의 상대 경로로 저장 (앱에서 사용하는 형식)
             relative_path = save_path.relative_to(PROJECT_ROOT).as_posix()
-            print(f"  ✔ 다운로드 성공: {relative_path}")
+            if status == 'skipped':
+                print(f"  ⏭️ 변경 없음 (캐시 적중), 스킵: {relative_path}")
+            else:
+                print(f"  ✔ 다운로드 성공: {relative_path}")
             return str(relative_path)
             
         except Exception as e:
@@ -246,13 +289,40 @@ class MasterScraper:
         
         return downloaded_files
 
+    def download_character_images(self, char):
+        """캐릭터 한 명의 아이콘과 element/equipment 이미지 다운로드 (작업 스레드에서 실행)"""
+        eng_name = char['english_name']
+
+        # 이미지 다운로드 (메인 리스트에서 가져온 URL 사용)
+        image_url = char.get('image_url', '')
+        image_path = ''
+
+        if image_url:
+            image_path = self.download_image(image_url, subfolder="", eng_name=eng_name)
+            if not image_path:
+                print(f"  ⚠️ 이미지 다운로드 실패: {eng_name}")
+        else:
+            print(f"  ❌ 이미지 URL 없음: {eng_name}")
+
+        char['image_path'] = image_path or ''
+
+        # Element & Equipment 이미지 다운로드
+        element_equipment_files = self.download_element_equipment_images(char)
+        element_count = len(element_equipment_files['elements'])
+        equipment_count = len(element_equipment_files['equipment'])
+
+        if element_count > 0 or equipment_count > 0:
+            print(f"  📦 {eng_name} Element/Equipment: {element_count}개 속성, {equipment_count}개 장비 이미지 다운로드")
+
+        return bool(image_path) and os.path.exists(PROJECT_ROOT / image_path)
+
 # ⬇️ 이 코드로 scrape_character_list 함수 전체를 교체해주세요.
 
     def scrape_character_list(self):
         """캐릭터 목록 페이지 스크래핑 (최종 필터링)"""
         print("캐릭터 목록 스크래핑 중...")
         try:
-            response = requests.get(TARGET_URL, headers=self.headers, timeout=30)
+            response = self.http_cache.get(TARGET_URL, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -339,6 +409,12 @@ class MasterScraper:
                         'equipment_images': equipment_images
                     })
             
+            # 표시 이름 대신 쓰는 안정적인 조인 키 (아이콘 에셋 ID 기반, 재스크래핑해도 동일)
+            char_ids = assign_character_ids([char['image_url'] for char in characters],
+                                            [char['english_name'] for char in characters])
+            for char, char_id in zip(characters, char_ids):
+                char['character_id'] = char_id
+            
             print(f"캐릭터 목록 스크래핑 완료: 필터링 후 {len(characters)}개")
             return characters
             
@@ -349,7 +425,7 @@ class MasterScraper:
     def scrape_character_details(self, detail_url, eng_name):
         """캐릭터 상세 페이지 스크래핑"""
         try:
-            response = requests.get(detail_url, headers=self.headers, timeout=30)
+            response = self.http_cache.get(detail_url, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -393,10 +469,15 @@ class MasterScraper:
             return {}
     
     def scrape_all_personalities(self):
-        """전체 퍼스널리티 데이터 스크래핑"""
+        """
+        전체 퍼스널리티 데이터 스크래핑
+
+        Returns:
+            {위키 문서 이름: [퍼스널리티, ...]} (링크 표시 텍스트는 줄임말일 수 있어 링크 대상 문서로 키를 만듦)
+        """
         print("퍼스널리티 데이터 스크래핑 중...")
         try:
-            response = requests.get(PERSONALITY_URL, headers=self.headers, timeout=30)
+            response = self.http_cache.get(PERSONALITY_URL, timeout=30)
             response.raise_for_status()
             soup = BeautifulSoup(response.content, 'html.parser')
             
@@ -429,8 +510,9 @@ class MasterScraper:
                                 'Category:' not in href):
                                 
                                 char_name = link.get_text(strip=True)
-                                if char_name and len(char_name) > 1:
-                                    characters_found.append(char_name)
+                                page_key = wiki_page_key(href)
+                                if char_name and len(char_name) > 1 and page_key:
+                                    characters_found.append(page_key)
                         
                         # 각 캐릭터에 퍼스널리티 추가
                         for char_name in characters_found:
@@ -501,6 +583,7 @@ class MasterScraper:
         quiz_data = []
         for char in characters:
             quiz_data.append({
+                '캐릭터ID': row_character_id(char),
                 '캐릭터명': char.get('korean_name', ''),
                 '영문명': char.get('english_name', ''),
                 '캐릭터아이콘경로': char.get('image_path', ''),
@@ -519,6 +602,7 @@ class MasterScraper:
         roulette_data = []
         for char in characters:
             roulette_data.append({
+                'character_id': row_character_id(char),
                 'english_name': char.get('english_name', ''),
                 'korean_name': char.get('korean_name', ''),
                 'image_path': char.get('image_path', ''),
@@ -533,11 +617,14 @@ class MasterScraper:
         roulette_df.to_csv(roulette_csv_path, index=False, encoding='utf-8-sig')
         print(f"룰렛 데이터 저장: {roulette_csv_path}")
         
-        # 3. 퍼스널리티 데이터 (character_personalities.csv)
+        # 3. 퍼스널리티 데이터 (character_personalities.csv, 문서 이름 → 캐릭터 ID)
+        page_ids = {wiki_page_key(char.get('detail_url', '')) or char.get('english_name', ''): row_character_id(char)
+                    for char in characters}
         personality_list = []
         for eng_name, personalities in personality_data.items():
             kor_name = self.name_mapping.get(eng_name.lower(), eng_name)
             personality_list.append({
+                'Character_ID': page_ids.get(eng_name, ''),
                 'English_Name': eng_name,
                 'Korean_Name': kor_name,
                 'Personalities_Korean': ', '.join(personalities),
@@ -569,6 +656,7 @@ class MasterScraper:
             quiz_data = []
             for char in processed_chars:
                 quiz_data.append({
+                    '캐릭터ID': row_character_id(char),
                     '캐릭터명': char.get('korean_name', ''),
                     '영문명': char.get('english_name', ''),
                     '캐릭터아이콘경로': char.get('image_path', ''),
@@ -586,9 +674,71 @@ class MasterScraper:
         except Exception as e:
             print(f"  ⚠️ 백업 저장 실패: {e}")
     
-    def run_full_scraping(self, test_mode=False):
-        """전체 스크래핑 실행"""
-        print("Another Eden 통합 스크래퍼 시작")
+    def character_fingerprint(self, char):
+        """목록 페이지에서 얻은 캐릭터 정보의 지문 (바뀌면 다시 처리)"""
+        payload = {
+            'detail_url': char.get('detail_url', ''),
+            'image_url': char.get('image_url', ''),
+            'korean_name': char.get('korean_name', ''),
+            'personalities': char.get('personalities', ''),
+            'element_images': [img['src'] for img in char.get('element_images', [])],
+            'equipment_images': [img['src'] for img in char.get('equipment_images', [])],
+        }
+        raw = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def load_scrape_manifest(self):
+        """이전 실행의 캐릭터 지문 로드 ({english_name: fingerprint})"""
+        try:
+            with open(SCRAPE_MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                return json.load(f).get('characters', {})
+        except (OSError, ValueError):
+            return {}
+
+    def save_scrape_manifest(self, characters, skip_names=()):
+        """처리에 성공한 캐릭터들의 지문 저장 (실패한 캐릭터는 다음 증분 실행에서 재시도)"""
+        manifest = self.load_scrape_manifest()
+        for char in characters:
+            if char['english_name'] in skip_names or 'fingerprint' not in char:
+                continue
+            manifest[char['english_name']] = char['fingerprint']
+        tmp_path = f"{SCRAPE_MANIFEST_PATH}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'updated_at': time.strftime('%Y-%m-%d %H:%M:%S'), 'characters': manifest},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, SCRAPE_MANIFEST_PATH)
+
+    def load_existing_rows(self):
+        """기존 룰렛 CSV를 영문명 기준으로 로드 (증분 병합용)"""
+        roulette_csv_path = CSV_DIR / "eden_roulette_data.csv"
+        if not roulette_csv_path.exists():
+            return {}
+        df = pd.read_csv(roulette_csv_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+        return {row['english_name']: row for row in df.to_dict('records') if row.get('english_name')}
+
+    def is_unchanged(self, char, existing_row, manifest):
+        """기존 CSV 행을 그대로 재사용해도 되는지 판단"""
+        if existing_row is None:
+            return False
+        image_path = existing_row.get('image_path', '')
+        if char.get('image_url') and not (image_path and (PROJECT_ROOT / image_path).exists()):
+            return False  # 이미지가 빠져 있으면 다시 받기
+        previous = manifest.get(char['english_name'])
+        if previous is not None:
+            return previous == char['fingerprint']
+        # 지문이 없는 (증분 모드 이전) 데이터는 퍼스널리티가 같으면 변경 없음으로 간주
+        return existing_row.get('personalities', '') == char.get('personalities', '')
+
+    def run_full_scraping(self, test_mode=False, incremental=False, resume=False):
+        """
+        전체 스크래핑 실행
+
+        incremental=True이면 기존 CSV/지문과 비교해 새로 추가되거나 바뀐 캐릭터만
+        이미지를 받고, 나머지는 기존 행을 그대로 병합합니다.
+        resume=True이면 저널에 완료로 기록된 캐릭터를 건너뛰고 중단된 지점부터 이어갑니다.
+        """
+        print("Another Eden 통합 스크래퍼 시작" + (" (증분 모드)" if incremental else "")
+              + (" (이어하기)" if resume else ""))
         print("=" * 60)
         
         # SSL 인증서 검증 활성화
@@ -612,85 +762,118 @@ class MasterScraper:
         # 2. 퍼스널리티 데이터 스크래핑
         personality_data = self.scrape_all_personalities()
         
-        # 3. 각 캐릭터 상세 정보 스크래핑
+        # 3. 각 캐릭터 기본 정보 정리 (네트워크 요청 없음)
         print("캐릭터 상세 정보 스크래핑 중...")
         processed_count = 0
         downloaded_count = 0
-        skipped_count = 0
+        completed = set()
         
-        try:
+        for char in characters:
+            eng_name = char['english_name']
+            # 한글명은 이미 목록에서 변환됨
+            if 'korean_name' not in char:
+                char['korean_name'] = self.convert_to_korean(eng_name)
+            
+            # 퍼스널리티 정보 (가장 먼저 처리, 상세 페이지 문서 이름으로 조인)
+            personalities = personality_data.get(wiki_page_key(char.get('detail_url', '')),
+                                                 personality_data.get(eng_name, []))
+            char['personalities'] = ', '.join(personalities)
+            
+            # 상세 정보는 필요시에만 (희귀도, 속성, 무기가 중요한 경우만)
+            # 현재는 퍼스널리티만 사용하므로 상세 페이지 접근 생략
+            char['rarity'] = ''  # 필요시 상세 페이지에서 가져오기
+            char['elements'] = ''
+            char['weapons'] = ''
+            char.setdefault('image_path', '')
+            char['fingerprint'] = self.character_fingerprint(char)
+        
+        # 증분 모드: 변경 없는 캐릭터는 기존 CSV 행을 재사용하고 처리 대상에서 제외
+        pending = list(range(1, len(characters) + 1))
+        retained_rows = []
+        if incremental:
+            existing_rows = self.load_existing_rows()
+            manifest = self.load_scrape_manifest()
+            pending = []
             for i, char in enumerate(characters, 1):
-                eng_name = char['english_name']
-                print(f"[{i}/{len(characters)}] {eng_name} 처리 중...")
-                
-                try:
-                    # 한글명은 이미 목록에서 변환됨
-                    if 'korean_name' not in char:
-                        char['korean_name'] = self.convert_to_korean(eng_name)
-                    
-                    # 퍼스널리티 정보 (가장 먼저 처리)
-                    personalities = personality_data.get(eng_name, [])
-                    char['personalities'] = ', '.join(personalities)
-                    
-                    # 이미지 다운로드 (메인 리스트에서 가져온 URL 사용)
-                    image_url = char.get('image_url', '')
-                    image_path = ''
-                    
-                    if image_url:
-                        image_path = self.download_image(image_url, subfolder="", eng_name=eng_name)
-                        if image_path:
-                            # 스킵된 것인지 새로 다운로드된 것인지는 download_image에서 출력됨
-                            if "스킵" in str(image_path) or os.path.exists(PROJECT_ROOT / image_path):
-                                downloaded_count += 1  # 기존 파일이든 새 파일이든 성공
-                        else:
-                            print(f"  ⚠️ 이미지 다운로드 실패: {eng_name}")
-                    else:
-                        print(f"  ❌ 이미지 URL 없음: {eng_name}")
-                    
-                    char['image_path'] = image_path or ''
-                    
-                    # Element & Equipment 이미지 다운로드
-                    element_equipment_files = self.download_element_equipment_images(char)
-                    element_count = len(element_equipment_files['elements'])
-                    equipment_count = len(element_equipment_files['equipment'])
-                    
-                    if element_count > 0 or equipment_count > 0:
-                        print(f"  📦 Element/Equipment: {element_count}개 속성, {equipment_count}개 장비 이미지 다운로드")
-                    
-                    # 상세 정보는 필요시에만 (희귀도, 속성, 무기가 중요한 경우만)
-                    # 현재는 퍼스널리티만 사용하므로 상세 페이지 접근 생략
-                    char['rarity'] = ''  # 필요시 상세 페이지에서 가져오기
-                    char['elements'] = ''
-                    char['weapons'] = ''
-                    
-                    processed_count += 1
-                    
-                    # 매 50개마다 중간 저장
-                    if processed_count % 50 == 0:
-                        print(f"\n💾 중간 저장 중... ({processed_count}개 처리됨)")
-                        self.save_progress(characters[:i], personality_data, suffix=f"_backup_{processed_count}")
-                    
-                    time.sleep(0.5)  # 서버 부하 방지
-                    
-                except Exception as e:
-                    print(f"⚠️ {eng_name} 처리 중 오류 발생: {e}")
-                    # 오류가 있어도 기본값으로라도 데이터를 유지
-                    char['korean_name'] = self.convert_to_korean(eng_name) if 'korean_name' not in char else char['korean_name']
-                    char['rarity'] = char.get('rarity', '')
-                    char['elements'] = char.get('elements', '')  
-                    char['weapons'] = char.get('weapons', '')
-                    char['personalities'] = char.get('personalities', '')
-                    char['image_path'] = char.get('image_path', '')
-                    continue
-                    
+                row = existing_rows.get(char['english_name'])
+                if self.is_unchanged(char, row, manifest):
+                    for field in ('image_path', 'rarity', 'elements', 'weapons'):
+                        char[field] = row.get(field, '')
+                else:
+                    pending.append(i)
+            # 목록에서 빠진 (또는 테스트 모드로 제외된) 기존 캐릭터는 그대로 유지
+            scraped_names = {char['english_name'] for char in characters}
+            retained_rows = [row for name, row in existing_rows.items() if name not in scraped_names]
+            new_count = sum(1 for i in pending if characters[i - 1]['english_name'] not in existing_rows)
+            print(f"🔁 증분 모드: 신규 {new_count}개, 변경 {len(pending) - new_count}개, "
+                  f"변경 없음 {len(characters) - len(pending)}개, 기존 유지 {len(retained_rows)}개")
+        
+        # 이어하기: 저널에 같은 지문으로 완료 기록된 캐릭터는 기록된 결과를 그대로 사용
+        journal = ScrapeJournal(SCRAPE_JOURNAL_PATH)
+        if resume:
+            journaled = journal.load()
+            remaining = []
+            for i in pending:
+                char = characters[i - 1]
+                entry = journaled.get(char['english_name'])
+                if entry and entry.get('fingerprint') == char['fingerprint']:
+                    for field in ('image_path', 'rarity', 'elements', 'weapons'):
+                        char[field] = entry.get(field, '')
+                else:
+                    remaining.append(i)
+            print(f"⏯️ 이어하기: 저널에서 {len(pending) - len(remaining)}개 복원, 남은 캐릭터 {len(remaining)}개")
+            pending = remaining
+        journal.open(resume=resume)
+        
+        # 4. 이미지 다운로드 (스레드 풀 + 호스트별 토큰 버킷으로 서버 부하 제한)
+        print(f"이미지 다운로드 중... (작업자 {DOWNLOAD_WORKERS}개, 호스트당 초당 {DOWNLOAD_RATE_PER_HOST:g}회)")
+        failed_names = set()
+        
+        def on_character_done(i, image_ok, error):
+            nonlocal processed_count, downloaded_count
+            char = characters[i - 1]
+            completed.add(i)
+            if error is not None:
+                failed_names.add(char['english_name'])
+                print(f"⚠️ {char['english_name']} 처리 중 오류 발생: {error}")
+                return
+            processed_count += 1
+            journal.record(char)  # 완료 즉시 저널에 기록 (비정상 종료 대비)
+            if image_ok:
+                downloaded_count += 1  # 기존 파일이든 새 파일이든 성공
+            print(f"[{len(completed)}/{len(pending)}] {char['english_name']} 완료")
+            
+            # 매 50개마다 중간 저장
+            if processed_count % 50 == 0:
+                print(f"\n💾 중간 저장 중... ({processed_count}개 처리됨)")
+                done_chars = [characters[k - 1] for k in sorted(completed)]
+                self.save_progress(done_chars, personality_data, suffix=f"_backup_{processed_count}")
+        
+        tasks = [
+            (i, (lambda c=characters[i - 1]: self.download_character_images(c)))
+            for i in pending
+        ]
+        # 이번에 처리하지 않은 캐릭터는 결과 파일에 합쳐서 저장
+        output_characters = characters + retained_rows
+        
+        try:
+            self.download_engine.run(tasks, on_done=on_character_done)
         except KeyboardInterrupt:
+            journal.close()
             print(f"\n\n🛑 사용자에 의해 중단됨! 지금까지 처리된 {processed_count}개 캐릭터 데이터를 저장합니다...")
             # 중단되어도 지금까지의 데이터는 저장
-            excel_path = self.create_excel_with_images(characters)
-            csv_paths = self.generate_csv_files(characters, personality_data)
+            excel_path = self.create_excel_with_images(output_characters)
+            csv_paths = self.generate_csv_files(output_characters, personality_data)
+            self.image_store.flush()
+            unfinished = {characters[i - 1]['english_name'] for i in pending if i not in completed}
+            self.save_scrape_manifest(characters, skip_names=failed_names | unfinished)
             
             print(f"\n✅ 중단 시점 데이터 저장 완료!")
-            print(f"처리된 캐릭터: {processed_count}/{len(characters)}")
+            print(f"처리된 캐릭터: {processed_count}/{len(pending)}")
+            print("⏯️ --resume 옵션으로 다시 실행하면 중단된 지점부터 이어서 진행합니다.")
+            self.download_engine.stats.print_report()
+            self.fetcher.stats.print_report()
+            self.http_cache.print_report()
             if excel_path:
                 print(f"엑셀 파일: {excel_path}")
             if csv_paths:
@@ -699,15 +882,25 @@ class MasterScraper:
                         print(f"  ✓ {csv_path}")
             return True
         
-        # 4. 엑셀 및 CSV 파일 생성
-        excel_path = self.create_excel_with_images(characters)
-        csv_paths = self.generate_csv_files(characters, personality_data)
+        # 5. 엑셀 및 CSV 파일 생성
+        excel_path = self.create_excel_with_images(output_characters)
+        csv_paths = self.generate_csv_files(output_characters, personality_data)
+        self.save_scrape_manifest(characters, skip_names=failed_names)
+        self.image_store.flush()
+        
+        # 6. 앱용 이미지 산출물 (파생본, 아이콘 아틀라스, 실루엣 공개 단계 - 변경된 이미지만 처리)
+        build_image_assets()
+        if failed_names:
+            journal.close()  # 실패한 캐릭터가 있으면 --resume으로 재시도할 수 있도록 저널 유지
+        else:
+            journal.discard()
         
         print("\n통합 스크래핑 완료!")
         print("=" * 60)
-        print(f"총 캐릭터 수: {len(characters)}")
-        print(f"성공적으로 처리된 캐릭터: {processed_count}")
-        print(f"이미지 처리 성공: {downloaded_count}/{len(characters)} ({downloaded_count/len(characters)*100:.1f}%)")
+        print(f"총 캐릭터 수: {len(output_characters)}")
+        print(f"성공적으로 처리된 캐릭터: {processed_count}/{len(pending)}")
+        if pending:
+            print(f"이미지 처리 성공: {downloaded_count}/{len(pending)} ({downloaded_count/len(pending)*100:.1f}%)")
         if excel_path:
             print(f"엑셀 파일: {excel_path}")
         if csv_paths:
@@ -717,17 +910,22 @@ class MasterScraper:
                     print(f"  ✓ {csv_path}")
                 else:
                     print(f"  ✗ {csv_path} (생성 실패)")
+        self.download_engine.stats.print_report()
+        self.fetcher.stats.print_report()
+        self.http_cache.print_report()
         
         return True
 
 
-def main(test_mode=False):
+def main(test_mode=False, incremental=False, resume=False):
     """메인 실행 함수"""
     scraper = MasterScraper()
-    success = scraper.run_full_scraping(test_mode=test_mode)
+    success = scraper.run_full_scraping(test_mode=test_mode, incremental=incremental, resume=resume)
     return success
 
 
 if __name__ == "__main__":
-    success = main()
+    # --incremental: 새로 추가되거나 바뀐 캐릭터만 처리하고 기존 CSV에 병합
+    # --resume: 저널에 완료 기록된 캐릭터를 건너뛰고 중단된 지점부터 이어서 진행
+    success = main(incremental="--incremental" in sys.argv[1:], resume="--resume" in sys.argv[1:])
     sys.exit(0 if success else 1)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📓 Another Eden 스크래핑 저널
+캐릭터 하나가 끝날 때마다 결과를 JSONL 한 줄로 추가 기록(append-only)합니다.
+프로세스가 죽거나 네트워크가 끊겨도 --resume으로 완료된 캐릭터를 건너뛰고 이어서 진행할 수 있습니다.
+"""
+
+import os
+import json
+import time
+
+
+JOURNAL_FIELDS = ('english_name', 'korean_name', 'image_path', 'rarity', 'elements', 'weapons',
+                  'personalities', 'fingerprint')
+
+
+class ScrapeJournal:
+    """캐릭터 단위 완료 기록 (JSONL, 한 줄 = 캐릭터 하나)"""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.file = None
+
+    def load(self):
+        """기록된 캐릭터 로드 ({english_name: entry}, 같은 캐릭터는 마지막 기록 우선)"""
+        entries = {}
+        if not os.path.exists(self.path):
+            return entries
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 기록 도중 종료되어 잘린 마지막 줄은 무시
+                    continue
+                if entry.get('english_name'):
+                    entries[entry['english_name']] = entry
+        return entries
+
+    def open(self, resume=False):
+        """저널 열기 (resume이 아니면 이전 기록을 비우고 새로 시작)"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        if resume and self.file.tell() > 0:
+            # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄을 끊어 둠
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self.file.write('\n')
+
+    def record(self, char):
+        """캐릭터 하나의 결과를 한 줄로 기록하고 디스크에 즉시 반영"""
+        entry = {field: char.get(field, '') for field in JOURNAL_FIELDS}
+        entry['completed_at'] = time.time()
+        self.file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def discard(self):
+        """모든 결과 파일이 생성된 뒤 저널 삭제"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
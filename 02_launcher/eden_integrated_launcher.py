@@ -4,12 +4,11 @@
 """
 
 import streamlit as st
-import os
+import sys
+import numpy as np
 import pandas as pd
-import random
 import time
 import re
-import base64
 import html
 from pathlib import Path
 import unicodedata
@@ -18,9 +17,17 @@ from typing import List, Dict, Any
 
 # 전역 설정
 BASE_DIR = Path(__file__).parent.resolve()
+PROJECT_ROOT = BASE_DIR.parent
 
-# 이미지 캐시
-_image_cache = {}
+# 공용 아이콘 캐시 (메모리 LRU + 디스크, 앱 간 공유)
+sys.path.insert(0, str(PROJECT_ROOT / "03_apps" / "shared"))
+from icon_cache import icon_to_data_uri
+from character_repository import get_character_repository
+from answer_index import AnswerIndex
+from reveal_images import reveal_stage_paths
+from image_lookup import get_image_index
+
+ICONS_DIR = PROJECT_ROOT / "04_data" / "images" / "character_art" / "icons"
 
 # 페이지 설정
 st.set_page_config(
@@ -34,8 +41,8 @@ st.set_page_config(
 # 유틸리티 함수들
 # ===============================================
 
-def safe_icon_to_data_uri(path: str) -> str:
-    """아이콘 경로를 data URI로 안전하게 변환 (캐싱 포함)"""
+def safe_icon_to_data_uri(path: str, display_px: int = None) -> str:
+    """아이콘 경로를 data URI로 안전하게 변환 (캐싱 포함, display_px를 주면 표시 크기에 맞는 파생본 사용)"""
     placeholder = "data:image/gif;base64,R0lGODlhEAAQAIABAP///wAAACH5BAEKAAEALAAAAAAQABAAAAIijI+py+0Po5yUFQA7"
     
     def normalize_path(p: str) -> str:
@@ -51,153 +58,120 @@ def safe_icon_to_data_uri(path: str) -> str:
     if path.startswith(("http://", "https://", "data:image")):
         return path
     
-    # 캐시 확인
-    if path in _image_cache:
-        return _image_cache[path]
-    
-    abs_path = BASE_DIR / path
-    try:
-        if abs_path.exists() and abs_path.is_file():
-            with open(abs_path, "rb") as f:
-                data = base64.b64encode(f.read()).decode()
-                ext = abs_path.suffix.lower()
-                if ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']:
-                    mime_type = f"image/{ext[1:]}" if ext != '.jpg' else "image/jpeg"
-                    result = f"data:{mime_type};base64,{data}"
-                    # 캐시에 저장
-                    _image_cache[path] = result
-                    return result
-    except:
-        pass
-    return placeholder
+    # 캐릭터 데이터의 아이콘 경로는 프로젝트 기준 상대 경로
+    return icon_to_data_uri(PROJECT_ROOT / path, default=placeholder, display_px=display_px)
 
-def get_character_image(char_name: str, char_index: int = None) -> str:
-    """캐릭터 이름으로 이미지 경로 찾기 (개선된 버전)"""
-    icons_dir = BASE_DIR / "character_art" / "icons"
-    if not icons_dir.exists():
+def get_character_image(char_name: str, char_index: int = None, char_id: int = None) -> str:
+    """캐릭터 ID/이름으로 이미지 경로 찾기 (이미지 인덱스 조회, 호출마다 폴더를 훑지 않음)"""
+    image_index = get_image_index(ICONS_DIR)
+    if not len(image_index):
         return ""
     
-    image_files = list(icons_dir.glob("*.png"))
-    if not image_files:
-        return ""
+    # 1. 캐릭터 ID(에셋 ID) 매칭 (가장 우선)
+    # 2. 이름 매칭 (정확한 이름 → 공백/특수문자 무시 → ES/AS/NS 스타일별 → 스타일 제거)
+    image_path = image_index.get(char_id) or image_index.find(char_name)
+    if image_path:
+        return image_path
     
-    # 1. 정확한 이름 매칭 (가장 우선)
-    search_name = char_name.replace(" ", "").lower()
-    for file in image_files:
-        file_name = file.stem.lower()
-        if search_name == file_name:
-            return str(file)
-    
-    # 2. 부분 매칭 (포함 관계)
-    for file in image_files:
-        file_name = file.stem.lower()
-        if search_name in file_name or file_name in search_name:
-            return str(file)
-    
-    # 3. 단어별 매칭 (2글자 이상)
-    char_words = [word for word in search_name.split() if len(word) >= 2]
-    for file in image_files:
-        file_name = file.stem.lower()
-        for word in char_words:
-            if word in file_name:
-                return str(file)
-    
-    # 4. 특수 케이스 매칭 (ES, AS, NS 등)
-    if "ES" in char_name or "AS" in char_name or "NS" in char_name:
-        base_name = char_name.replace(" ES", "").replace(" AS", "").replace(" NS", "").replace(" ", "").lower()
-        for file in image_files:
-            file_name = file.stem.lower()
-            if base_name in file_name:
-                return str(file)
-    
-    # 5. char_index 기반 할당 (fallback)
+    # 3. char_index 기반 할당 (fallback)
     if char_index is not None:
-        image_index = char_index % len(image_files)
-        return str(image_files[image_index])
+        image_index_pos = char_index % len(image_index)
+        return str(image_index.root / image_index.files[image_index_pos])
     
-    # 6. 해시 기반 할당 (최종 fallback)
+    # 4. 해시 기반 할당 (최종 fallback)
     import hashlib
     char_hash = hashlib.md5(char_name.encode()).hexdigest()
     hash_int = int(char_hash[:8], 16)
-    image_index = hash_int % len(image_files)
-    return str(image_files[image_index])
+    image_index_pos = hash_int % len(image_index)
+    return str(image_index.root / image_index.files[image_index_pos])
+
+# 퀴즈 모드별 정답 필드 (컬럼, 여러 값 여부)
+QUIZ_ANSWER_FIELDS = {
+    '캐릭터명': ('캐릭터명', False),
+    '희귀도': ('희귀도', False),
+    '속성명리스트': ('속성명리스트', True),
+    '무기명리스트': ('무기명리스트', True),
+}
+QUIZ_MODE_FIELDS = {
+    "이름 맞히기": '캐릭터명',
+    "실루엣 맞히기": '캐릭터명',
+    "희귀도 맞히기": '희귀도',
+    "속성 맞히기": '속성명리스트',
+    "무기 맞히기": '무기명리스트',
+}
+QUIZ_RNG = np.random.default_rng()
+
+def character_image_path(char) -> str:
+    """캐릭터 행의 아이콘 경로 (데이터에 없으면 이름으로 찾음)"""
+    return char.get('캐릭터아이콘경로', '') or get_character_image(char['캐릭터명'], char_id=char.get('캐릭터ID'))
+
+@st.cache_resource(max_entries=2)
+def _quiz_answer_index(_repository, version: str):
+    """저장소 버전별 퀴즈 정답/보기 인덱스"""
+    return AnswerIndex(_repository.df, QUIZ_ANSWER_FIELDS)
 
 def load_quiz_data():
-    """퀴즈용 데이터 로드"""
-    csv_file = "eden_roulette_data_with_personalities.csv"
-    if not os.path.exists(csv_file):
-        csv_file = "eden_roulette_data.csv"
-    
-    if not os.path.exists(csv_file):
-        return None
-    
+    """퀴즈용 데이터 로드 (공유 캐릭터 저장소의 데이터프레임, 정답/보기 인덱스)"""
     try:
-        df = pd.read_csv(csv_file, encoding='utf-8-sig')
-        for col in df.columns:
-            df[col] = df[col].fillna('').astype(str)
-        
-        df['이미지경로'] = df.apply(lambda row: get_character_image(row['캐릭터명'], row.name), axis=1)
-        return df
+        repository = get_character_repository()
     except Exception as e:
         st.error(f"데이터 로드 오류: {e}")
-        return None
-
-def load_roulette_data():
-    """룰렛용 데이터 로드"""
-    csv_file = "eden_roulette_data_with_personalities.csv"
-    if not os.path.exists(csv_file):
-        st.error("룰렛 데이터 파일이 없습니다.")
         return None, None
     
+    if repository is None:
+        return None, None
+    return repository.df, _quiz_answer_index(repository, repository.version)
+
+def load_roulette_data():
+    """룰렛용 데이터 로드 (공유 캐릭터 저장소의 데이터프레임, 읽기 전용)"""
     try:
-        df = pd.read_csv(csv_file, encoding='utf-8-sig')
-        
-        for col in df.columns:
-            df[col] = df[col].fillna('').astype(str)
-        
-        df['이미지경로'] = df.apply(lambda row: get_character_image(row['캐릭터명'], row.name), axis=1)
-        
-        column_map = {
-            '이름': '캐릭터명',
-            '캐릭터아이콘경로': '이미지경로', 
-            '희귀도': '희귀도',
-            '속성명': '속성명리스트',
-            '속성아이콘': '속성_아이콘경로리스트',
-            '무기명': '무기명리스트', 
-            '무기아이콘': '무기_아이콘경로리스트',
-            '방어구명': '',
-            '방어구아이콘': ''
-        }
-        
-        for k_kor, v_eng in column_map.items():
-            if v_eng and v_eng not in df.columns:
-                st.error(f"필요한 컬럼 '{v_eng}'이 없습니다.")
-                return None, None
-                
-        return df, column_map
+        repository = get_character_repository()
     except Exception as e:
         st.error(f"룰렛 데이터 로드 오류: {e}")
         return None, None
+    
+    if repository is None:
+        st.error("룰렛 데이터 파일이 없습니다.")
+        return None, None
+    
+    column_map = {
+        '이름': '캐릭터명',
+        '캐릭터아이콘경로': '캐릭터아이콘경로', 
+        '희귀도': '희귀도',
+        '속성명': '속성명리스트',
+        '속성아이콘': '속성_아이콘경로리스트',
+        '무기명': '무기명리스트', 
+        '무기아이콘': '무기_아이콘경로리스트',
+        '방어구명': '',
+        '방어구아이콘': ''
+    }
+    return repository.df, column_map
 
 # ===============================================
 # 퀴즈쇼 함수들
 # ===============================================
 
 def create_silhouette_html_fullscreen(image_path: str, char_name: str = "") -> str:
-    """캐릭터 실루엣 HTML 생성"""
-    icon_data = safe_icon_to_data_uri(image_path)
+    """캐릭터 실루엣 HTML 생성 (미리 생성된 실루엣이 있으면 원본 대신 사용)"""
+    stages = reveal_stage_paths(PROJECT_ROOT / image_path) if image_path else []
+    if stages:
+        icon_data = safe_icon_to_data_uri(stages[0])
+        image_filter = ""
+    else:
+        icon_data = safe_icon_to_data_uri(image_path, display_px=300)
+        image_filter = " filter: brightness(0) contrast(1.5) opacity(0.9);"
     return f'''
     <div style="text-align: center; margin: 2rem 0;">
         <div style="width: 300px; height: 300px; margin: 0 auto; position: relative; background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%); border-radius: 20px; overflow: hidden; box-shadow: 0 12px 48px rgba(0,0,0,0.4);">
             <img src="{icon_data}" 
-                 style="width: 100%; height: 100%; object-fit: contain; filter: brightness(0) contrast(1.5) opacity(0.9);" 
-                 alt="{char_name} 실루엣">
+                 style="width: 100%; height: 100%; object-fit: contain;{image_filter}" 
+                 alt="실루엣">
         </div>
         <p style="margin-top: 1.5rem; font-style: italic; color: #666; font-size: 1.2rem; font-weight: 500;">실루엣을 보고 캐릭터를 맞춰보세요!</p>
     </div>
     '''
 
-def run_quiz_mode_fullscreen(df: pd.DataFrame, mode: str):
+def run_quiz_mode_fullscreen(df: pd.DataFrame, mode: str, answer_index: AnswerIndex):
     """퀴즈 모드 실행 (전체 화면 버전)"""
     if df is None or len(df) == 0:
         st.error("퀴즈 데이터가 없습니다.")
@@ -228,61 +202,14 @@ def run_quiz_mode_fullscreen(df: pd.DataFrame, mode: str):
     
     with col2:
         if st.button("🎲 새 문제 시작", key=f"new_fullscreen_{mode}", use_container_width=True, type="primary"):
-            char = df.sample(1).iloc[0]
-            quiz_data['current_question'] = char
-            quiz_data['show_answer'] = False
-            
-            if mode in ["이름 맞히기", "실루엣 맞히기"]:
-                correct_answer = char['캐릭터명']
-                wrong_answers = df[df['캐릭터명'] != correct_answer]['캐릭터명'].sample(3).tolist()
-                all_options = [correct_answer] + wrong_answers
-                random.shuffle(all_options)
-                quiz_data['options'] = all_options
-            elif mode == "희귀도 맞히기":
-                correct_rarity = char.get('희귀도', '')
-                all_rarities = df['희귀도'].unique()
-                wrong_rarities = [r for r in all_rarities if r != correct_rarity]
-                if len(wrong_rarities) >= 3:
-                    wrong_rarities = random.sample(wrong_rarities, 3)
-                else:
-                    wrong_rarities = wrong_rarities + ['3★', '4★', '5★']
-                all_options = [correct_rarity] + wrong_rarities[:3]
-                random.shuffle(all_options)
-                quiz_data['options'] = all_options
-            elif mode == "속성 맞히기":
-                if char.get('속성명리스트'):
-                    correct_attrs = [x.strip() for x in char['속성명리스트'].split('|') if x.strip()]
-                    all_attrs = []
-                    for attr_list in df['속성명리스트'].dropna():
-                        if attr_list:
-                            all_attrs.extend([x.strip() for x in attr_list.split('|') if x.strip()])
-                    all_attrs = list(set(all_attrs))
-                    wrong_attrs = [attr for attr in all_attrs if attr not in correct_attrs]
-                    if len(wrong_attrs) >= 3:
-                        wrong_attrs = random.sample(wrong_attrs, 3)
-                    else:
-                        wrong_attrs = ['화', '수', '지', '풍', '빛', '어둠']
-                    all_options = correct_attrs + wrong_attrs[:3]
-                    random.shuffle(all_options)
-                    quiz_data['options'] = all_options[:4]
-                    quiz_data['correct_answer'] = correct_attrs[0] if correct_attrs else ""
-            elif mode == "무기 맞히기":
-                if char.get('무기명리스트'):
-                    correct_weapons = [x.strip() for x in char['무기명리스트'].split('|') if x.strip()]
-                    all_weapons = []
-                    for weapon_list in df['무기명리스트'].dropna():
-                        if weapon_list:
-                            all_weapons.extend([x.strip() for x in weapon_list.split('|') if x.strip()])
-                    all_weapons = list(set(all_weapons))
-                    wrong_weapons = [weapon for weapon in all_weapons if weapon not in correct_weapons]
-                    if len(wrong_weapons) >= 3:
-                        wrong_weapons = random.sample(wrong_weapons, 3)
-                    else:
-                        wrong_weapons = ['검', '창', '도끼', '활', '지팡이', '단검']
-                    all_options = correct_weapons + wrong_weapons[:3]
-                    random.shuffle(all_options)
-                    quiz_data['options'] = all_options[:4]
-                    quiz_data['correct_answer'] = correct_weapons[0] if correct_weapons else ""
+            # 정답 값 하나 + 서로 다른 오답 값 3개 (정답 캐릭터가 가진 다른 속성/무기는 오답에서 제외)
+            sampled = answer_index.sample(QUIZ_MODE_FIELDS[mode], 4, QUIZ_RNG)
+            if sampled is not None:
+                row, correct_answer, options = sampled
+                quiz_data['current_question'] = df.iloc[row]
+                quiz_data['show_answer'] = False
+                quiz_data['options'] = options
+                quiz_data['correct_answer'] = correct_answer
             
             st.rerun()
     
@@ -295,15 +222,16 @@ def run_quiz_mode_fullscreen(df: pd.DataFrame, mode: str):
             <h2 style="margin: 0 0 2rem 0; color: #FFD700; font-size: 2.5rem;">문제</h2>
         """, unsafe_allow_html=True)
         
+        image_path = character_image_path(char)
         if mode == "이름 맞히기":
-            if char['이미지경로']:
-                icon_data = safe_icon_to_data_uri(char['이미지경로'])
+            if image_path:
+                icon_data = safe_icon_to_data_uri(image_path, display_px=300)
                 st.markdown(f'<div style="text-align: center; margin: 2rem 0;"><img src="{icon_data}" style="width: 300px; height: 300px; object-fit: contain; border-radius: 15px; box-shadow: 0 8px 32px rgba(0,0,0,0.3);"></div>', unsafe_allow_html=True)
             st.markdown('<p style="font-size: 2rem; font-weight: 600; margin: 2rem 0;">이 캐릭터의 이름은?</p>', unsafe_allow_html=True)
             
         elif mode == "실루엣 맞히기":
-            if char['이미지경로']:
-                st.markdown(create_silhouette_html_fullscreen(char['이미지경로'], char['캐릭터명']), unsafe_allow_html=True)
+            if image_path:
+                st.markdown(create_silhouette_html_fullscreen(image_path, char['캐릭터명']), unsafe_allow_html=True)
             
         elif mode == "희귀도 맞히기":
             st.markdown(f'<p style="font-size: 2rem; font-weight: 600; margin: 2rem 0;"><strong>{char["캐릭터명"]}</strong>의 희귀도는?</p>', unsafe_allow_html=True)
@@ -334,20 +262,7 @@ def run_quiz_mode_fullscreen(df: pd.DataFrame, mode: str):
                     st.markdown(f'<div style="margin: 2rem 0; padding: 2rem; background: #e3f2fd; border-radius: 15px; border-left: 8px solid #2196F3; text-align: center;"><h4 style="margin: 0; color: #333;">선택한 답: <strong>{selected}</strong></h4></div>', unsafe_allow_html=True)
                     
                     if st.button("✅ 정답 확인", key=f"check_fullscreen_{mode}", use_container_width=True, type="primary"):
-                        if mode in ["이름 맞히기", "실루엣 맞히기"]:
-                            correct = char['캐릭터명']
-                        elif mode == "희귀도 맞히기":
-                            correct = char.get('희귀도', '')
-                        elif mode == "속성 맞히기":
-                            correct = quiz_data.get('correct_answer', '')
-                            if not correct:
-                                correct = char.get('속성명리스트', '').split('|')[0].strip() if char.get('속성명리스트') else ''
-                        elif mode == "무기 맞히기":
-                            correct = quiz_data.get('correct_answer', '')
-                            if not correct:
-                                correct = char.get('무기명리스트', '').split('|')[0].strip() if char.get('무기명리스트') else ''
-                        else:
-                            correct = ""
+                        correct = quiz_data.get('correct_answer', '')
                         
                         quiz_data['total'] += 1
                         if selected == correct:
@@ -370,8 +285,8 @@ def run_quiz_mode_fullscreen(df: pd.DataFrame, mode: str):
             col1, col2 = st.columns([1, 2])
             
             with col1:
-                if char['이미지경로']:
-                    icon_data = safe_icon_to_data_uri(char['이미지경로'])
+                if image_path:
+                    icon_data = safe_icon_to_data_uri(image_path, display_px=250)
                     st.markdown(f'<div style="text-align: center;"><img src="{icon_data}" style="width: 250px; height: 250px; object-fit: contain; border-radius: 15px; box-shadow: 0 8px 32px rgba(0,0,0,0.3);"></div>', unsafe_allow_html=True)
             
             with col2:
@@ -394,7 +309,7 @@ def create_character_card_fullscreen(char_data: pd.Series, column_map: dict) ->
     """캐릭터 카드 HTML 생성"""
     name = char_data[column_map['이름']]
     rarity = char_data[column_map['희귀도']]
-    icon_data = safe_icon_to_data_uri(char_data[column_map['캐릭터아이콘경로']])
+    icon_data = safe_icon_to_data_uri(char_data[column_map['캐릭터아이콘경로']], display_px=200)
     
     return f'''
     <div style="border: 3px solid #ddd; border-radius: 20px; padding: 3rem; margin: 2rem; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; text-align: center;">
@@ -443,8 +358,8 @@ def run_roulette_fullscreen():
     
     st.markdown('</div>', unsafe_allow_html=True)
     
-    # 필터링 적용
-    filtered_df = df.copy()
+    # 필터링 적용 (공유 데이터프레임은 그대로 두고 필터 결과만 새로 만듦)
+    filtered_df = df
     if selected_rarities:
         filtered_df = filtered_df[filtered_df[column_map['희귀도']].isin(selected_rarities)]
     if selected_attrs:
@@ -567,9 +482,9 @@ def show_quiz_page():
     selected_mode = st.selectbox("퀴즈 모드 선택", quiz_modes, key="quiz_mode_select_fullscreen")
     
     # 퀴즈 데이터 로드 및 실행
-    quiz_df = load_quiz_data()
+    quiz_df, answer_index = load_quiz_data()
     if quiz_df is not None:
-        run_quiz_mode_fullscreen(quiz_df, selected_mode)
+        run_quiz_mode_fullscreen(quiz_df, selected_mode, answer_index)
     else:
         st.error("퀴즈 데이터를 불러올 수 없습니다. CSV 파일을 확인하세요.")
 
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🎯 퀴즈 정답/보기 인덱스
+퀴즈 필드(이름, 희귀도, 속성, 무기 등)마다 정규화된 값 → 그 값을 가진 캐릭터 목록을 한 번만 만들어 두고,
+문제마다 정답 값 하나와 서로 다른 오답 값 k개를 행 순회나 재추첨 없이 뽑습니다.
+
+    - 값 목록: 필드별 고유 값 (정렬됨, 값 번호 = 목록 위치)
+    - 값 → 행: CSR 형태 (행 위치 배열 + 값별 시작 위치/개수)
+    - 행 → 값: 캐릭터가 가진 값 번호 (여러 값 필드에서 오답이 정답 캐릭터의 다른 값과 겹치지 않도록 제외)
+"""
+
+import numpy as np
+
+from eden_dataset import normalize_text
+from filter_index import split_values
+
+
+def _sample_distinct(population, k, rng):
+    """0..population-1 에서 서로 다른 정수 k개 (Floyd 알고리즘, 재추첨 없이 O(k))"""
+    chosen = []
+    seen = set()
+    for upper in range(population - k, population):
+        pick = int(rng.integers(upper + 1))
+        if pick in seen:
+            pick = upper
+        seen.add(pick)
+        chosen.append(pick)
+    return chosen
+
+
+class _FieldIndex:
+    def __init__(self, cells, multi_valued):
+        row_values = []
+        for cell in cells:
+            values = split_values(cell) if multi_valued else [cell]
+            normalized = []
+            for value in values:
+                value = normalize_text(value)
+                if value and value not in normalized:
+                    normalized.append(value)
+            row_values.append(normalized)
+
+        self.values = sorted({value for values in row_values for value in values})
+        ids = {value: i for i, value in enumerate(self.values)}
+        self.row_values = [sorted(ids[value] for value in values) for values in row_values]
+
+        # 값 → 행 (CSR)
+        buckets = [[] for _ in self.values]
+        for row, value_ids in enumerate(self.row_values):
+            for value_id in value_ids:
+                buckets[value_id].append(row)
+        self.counts = np.array([len(rows) for rows in buckets], dtype=np.int64)
+        self.offsets = np.concatenate(([0], np.cumsum(self.counts)[:-1])).astype(np.int64)
+        self.rows = np.array([row for rows in buckets for row in rows], dtype=np.int64)
+
+        # 행 × 값 소속 행렬 (일괄 생성에서 오답 후보 제외용)
+        self.membership = np.zeros((len(row_values), len(self.values)), dtype=bool)
+        for row, value_ids in enumerate(self.row_values):
+            self.membership[row, value_ids] = True
+
+
+class AnswerIndex:
+    """
+    퀴즈 필드별 값 → 캐릭터 인덱스
+
+    Args:
+        df: 캐릭터 데이터프레임 (행 위치는 df의 행 순서를 따름)
+        fields: {필드 이름: (컬럼 이름, 여러 값 여부)}
+    """
+
+    def __init__(self, df, fields):
+        self.size = len(df)
+        self.fields = {}
+        for field, (column, multi_valued) in fields.items():
+            cells = df[column].tolist() if column in df.columns else [''] * self.size
+            self.fields[field] = _FieldIndex(cells, multi_valued)
+
+    def values(self, field):
+        """필드의 고유 값 목록 (정렬됨)"""
+        return list(self.fields[field].values)
+
+    def sample(self, field, k, rng):
+        """
+        문제 하나의 정답과 보기
+
+        정답 값을 고르게 뽑은 뒤 그 값을 가진 캐릭터 하나를 고르고,
+        그 캐릭터가 가진 값을 모두 제외한 나머지에서 오답 k-1개를 뽑습니다.
+
+        Returns:
+            (행 위치, 정답 값, 보기 목록) 또는 값이 없으면 None. 보기는 최대 k개이며 정답 위치는 무작위
+        """
+        index = self.fields[field]
+        if not index.values:
+            return None
+        value_id = int(rng.integers(len(index.values)))
+        row = int(index.rows[index.offsets[value_id] + rng.integers(index.counts[value_id])])
+        excluded = index.row_values[row]
+
+        # 제외할 값을 건너뛰도록 번호를 옮겨 남은 값들 중에서 바로 뽑음
+        available = len(index.values) - len(excluded)
+        option_ids = []
+        for pick in _sample_distinct(available, min(k - 1, available), rng):
+            for skipped in excluded:
+                if pick >= skipped:
+                    pick += 1
+            option_ids.append(pick)
+        option_ids.insert(int(rng.integers(len(option_ids) + 1)), value_id)
+        return row, index.values[value_id], [index.values[i] for i in option_ids]
+
+    def sample_many(self, field, n, k, rng):
+        """
+        문제 n개의 정답과 보기를 한 번에 (값 수 V에 대해 n × V 난수 행렬 하나로 오답 선택)
+
+        Returns:
+            [(행 위치, 정답 값, 보기 목록), ...]
+        """
+        index = self.fields[field]
+        value_count = len(index.values)
+        if n <= 0 or not value_count:
+            return []
+        value_ids = rng.integers(value_count, size=n)
+        rows = index.rows[index.offsets[value_ids] + (rng.random(n) * index.counts[value_ids]).astype(np.int64)]
+
+        wrong_count = min(k - 1, value_count - 1)
+        keys = rng.random((n, value_count))
+        keys[index.membership[rows]] = np.inf  # 정답 캐릭터가 가진 값은 오답 후보에서 제외
+        if wrong_count > 0:
+            wrong_ids = np.argpartition(keys, wrong_count - 1, axis=1)[:, :wrong_count]
+            valid = np.isfinite(np.take_along_axis(keys, wrong_ids, axis=1))
+        else:
+            wrong_ids = np.empty((n, 0), dtype=np.int64)
+            valid = np.empty((n, 0), dtype=bool)
+        answer_slots = rng.integers(wrong_ids.shape[1] + 1, size=n)
+
+        results = []
+        for row, value_id, wrong, ok, slot in zip(rows, value_ids, wrong_ids, valid, answer_slots):
+            options = [index.values[i] for i in wrong[ok]]
+            options.insert(min(int(slot), len(options)), index.values[value_id])
+            results.append((int(row), index.values[value_id], options))
+        return results
@@ -14,6 +14,10 @@ import re
 import unicodedata
 from pathlib import Path
 
+# 이미지 저장소 (이름 변경 시 이름→해시 인덱스 갱신)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "01_scraping"))
+from image_store import get_image_store
+
 # 경로 설정
 BASE_DIR = Path(__file__).parent.resolve()
 IMAGE_DIR = BASE_DIR / "character_art"
@@ -95,6 +99,7 @@ def batch_rename_images():
     rename_results = []
     renamed_count = 0
     error_count = 0
+    store = get_image_store()
     
     for img_file in image_files:
         try:
@@ -117,7 +122,7 @@ def batch_rename_images():
                     print(f"[SKIP] 이미 존재함: {new_name}")
                     continue
                 
-                img_file.rename(new_path)
+                store.rename(img_file, new_path)
                 renamed_count += 1
                 print(f"[RENAME] {img_file.name} → {new_name}")
             
@@ -134,6 +139,8 @@ def batch_rename_images():
             error_count += 1
             print(f"[ERROR] 이름변경 실패 {img_file.name}: {e}")
     
+    store.flush()
+    
     # 결과 저장
     if rename_results:
         df_result = pd.DataFrame(rename_results)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🆔 캐릭터 ID
+위키 에셋 파일 이름에 들어 있는 숫자 ID(예: 101000021_s2_rank5_command.png)로 캐릭터마다 안정적인 정수 ID를 만듭니다.
+    - 에셋 ID가 있으면: 에셋 번호 × 10 + 스타일 번호 (_s2 → 2, _s3 → 3, 없으면 0)
+    - 없으면: 정규화한 영문 이름의 CRC32를 NAME_ID_BASE 위쪽에 배치 (에셋 ID 범위와 겹치지 않음)
+다시 스크래핑해도 같은 캐릭터는 같은 ID를 받으므로, CSV·이미지 인덱스·앱 사이의 조인은 표시 이름 대신 이 ID로 합니다.
+"""
+
+import os
+import re
+import zlib
+from urllib.parse import parse_qs, unquote, urlparse
+
+
+ID_COLUMN = '캐릭터ID'
+ASSET_NAME = re.compile(r'^(\d{6,12})(?:_s(\d))?(?=[_.]|$)')
+NAME_ID_BASE = 10 ** 13  # 에셋 ID(최대 12자리 × 10)보다 큰 범위
+
+
+def asset_filename(value):
+    """URL(위키 thumb.php?f=... 포함) 또는 경로에서 에셋 파일 이름 (공백은 '_')"""
+    if not isinstance(value, str) or not value.strip():
+        return ''
+    value = value.strip()
+    parsed = urlparse(value)
+    name = parse_qs(parsed.query).get('f', [None])[0] if parsed.query else None
+    if not name:
+        name = parsed.path if parsed.scheme else value
+    return os.path.basename(unquote(name).replace('\\', '/')).replace(' ', '_')
+
+
+def asset_character_id(value):
+    """에셋 파일 이름/URL/경로의 캐릭터 ID (숫자 에셋 ID가 없으면 None)"""
+    match = ASSET_NAME.match(asset_filename(value))
+    if not match:
+        return None
+    return int(match.group(1)) * 10 + int(match.group(2) or 0)
+
+
+def name_character_id(name):
+    """에셋 ID가 없는 캐릭터용 이름 기반 ID"""
+    key = re.sub(r'\s+', ' ', name).strip().casefold() if isinstance(name, str) else ''
+    return NAME_ID_BASE + zlib.crc32(key.encode('utf-8'))
+
+
+def parse_character_id(value):
+    """CSV 셀 값('1010000212', '1010000212.0', 숫자)을 ID로 (비어 있거나 숫자가 아니면 None)"""
+    if value is None or value != value or isinstance(value, bool):
+        return None
+    try:
+        char_id = int(float(value)) if isinstance(value, str) and '.' in value else int(value)
+    except (TypeError, ValueError):
+        return None
+    return char_id if char_id > 0 else None
+
+
+def character_id(icon='', english_name=''):
+    """아이콘(에셋) → 영문 이름 순으로 만든 캐릭터 ID"""
+    char_id = asset_character_id(icon)
+    return char_id if char_id is not None else name_character_id(english_name)
+
+
+def assign_character_ids(icons, english_names, existing=None):
+    """
+    캐릭터 목록 전체의 ID (목록 안에서 중복 없음)
+
+    Args:
+        existing: 이미 기록된 ID 목록 (있으면 그대로 사용, 비어 있는 항목만 새로 만듦)
+
+    ID가 겹치면 나중 항목을 이름 기반 ID로 바꾸고, 그래도 겹치면 빈 번호가 나올 때까지 1씩 올립니다.
+    """
+    existing = list(existing) if existing is not None else [None] * len(icons)
+    ids = []
+    used = set()
+    for icon, name, previous in zip(icons, english_names, existing):
+        char_id = parse_character_id(previous) or character_id(icon, name)
+        if char_id in used:
+            char_id = name_character_id(name)
+            while char_id in used:
+                char_id += 1
+        used.add(char_id)
+        ids.append(char_id)
+    return ids
+
+
+def index_by_character_id(paths):
+    """이미지 경로 목록 → {캐릭터 ID: 경로} (같은 ID의 파일이 여럿이면 5성(rank5) 아이콘, 그다음 이름순)"""
+    index = {}
+    for path in sorted(paths, key=lambda p: ('rank5' not in asset_filename(str(p)), str(p))):
+        char_id = asset_character_id(str(path))
+        if char_id is not None:
+            index.setdefault(char_id, path)
+    return index
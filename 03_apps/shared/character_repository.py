@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📚 공유 캐릭터 저장소 (프로세스 전체에서 한 벌만 두는 읽기 전용 데이터)
+정규 데이터셋(없으면 통합 CSV)을 한 번만 읽어 컬럼마다 쓰기 금지된 NumPy 배열로 고정하고,
+캐릭터 ID/한글 이름/영문 이름 → 행 위치 조회 딕셔너리를 함께 만들어 둡니다.
+
+룰렛/퀴즈 페이지와 런처는 get_character_repository()로 같은 객체를 받습니다.
+st.cache_data처럼 호출마다 데이터프레임을 복사하지 않으며, 파일이 바뀌면 다음 호출에서 새로 읽습니다.
+공유 데이터프레임은 셀 단위 쓰기만 막혀 있습니다 (df.loc[i, 컬럼] = 값 → ValueError/TypeError).
+컬럼 대입(df[컬럼] = 값, 새 컬럼 추가)은 막히지 않고 모든 세션이 함께 쓰는 프레임을 바꾸며,
+column()/record()가 돌려주는 배열과도 어긋나게 됩니다. repository.df에는 절대 컬럼을 대입하지 말고,
+필터링 결과나 df.assign(...)처럼 파생 프레임을 만들어 쓰세요.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from character_ids import ID_COLUMN
+from eden_dataset import (DATASET_PATH, LEGACY_COLUMNS, UNIFIED_CSV_PATH, load_legacy_view,
+                          normalize_legacy_frame, normalize_text)
+
+REQUIRED_COLUMNS = ('캐릭터명', 'English_Name', '희귀도', '속성명리스트', '무기명리스트')
+
+
+def _read_only(values):
+    values = np.array(values, copy=True)
+    values.setflags(write=False)
+    return values
+
+
+def file_version(*paths):
+    """파일들의 (경로, 수정 시각, 크기)로 만든 버전 문자열 (캐시 키)"""
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            parts.append(f"{path}:missing")
+    return "|".join(parts)
+
+
+def _source_version(path):
+    # Parquet을 못 쓰면 통합 CSV로 대체하므로 두 파일을 함께 봄
+    return file_version(path, UNIFIED_CSV_PATH) if path.suffix == '.parquet' else file_version(path)
+
+
+class CharacterRepository:
+    """
+    읽기 전용 캐릭터 데이터
+
+    Args:
+        df: 기존 한글 컬럼 형식의 캐릭터 데이터프레임 (load_legacy_view / normalize_legacy_frame 결과)
+        source: 읽어 온 파일 경로 (표시용)
+        version: 파일 버전 문자열 (저장소에서 파생한 인덱스/캐시의 키)
+    """
+
+    def __init__(self, df, source='', version=''):
+        self.source = str(source)
+        self.version = version
+        self.columns = {}
+        for column in df.columns:
+            series = df[column]
+            if pd.api.types.is_string_dtype(series):
+                self.columns[column] = _read_only(series.to_numpy(dtype=object, na_value=''))
+            else:
+                self.columns[column] = _read_only(series.to_numpy())
+        # 같은 배열을 그대로 감싼 데이터프레임 (복사 없음, 셀 쓰기 불가 - 컬럼 대입은 호출하는 쪽에서 금지)
+        self.df = pd.DataFrame({column: pd.Series(values, dtype=values.dtype, copy=False)
+                                for column, values in self.columns.items()}, copy=False)
+
+        # 캐릭터 ID (에셋 ID 기반의 안정적인 정수, 재스크래핑/행 순서 변경과 무관)
+        if ID_COLUMN in self.columns:
+            self.ids = self.columns[ID_COLUMN].astype(np.int64)
+            self.ids.setflags(write=False)
+        else:
+            self.ids = _read_only(np.arange(len(self.df), dtype=np.int64))
+        self.by_id = {int(char_id): pos for pos, char_id in enumerate(self.ids)}
+        # 이름 → 행 위치 목록 (같은 이름의 캐릭터가 여럿일 수 있음, 영문 이름은 대소문자 무시)
+        self.by_korean_name = {}
+        self.by_english_name = {}
+        for pos, name in enumerate(self.columns.get('캐릭터명', ())):
+            key = normalize_text(name)
+            if key:
+                self.by_korean_name.setdefault(key, []).append(pos)
+        for pos, name in enumerate(self.columns.get('English_Name', ())):
+            key = normalize_text(name).casefold()
+            if key:
+                self.by_english_name.setdefault(key, []).append(pos)
+
+    def __len__(self):
+        return len(self.df)
+
+    def column(self, name):
+        """컬럼의 읽기 전용 NumPy 배열"""
+        return self.columns[name]
+
+    def record(self, pos):
+        """행 하나를 {컬럼: 값} 딕셔너리로 (호출마다 새 딕셔너리)"""
+        return {column: values[pos] for column, values in self.columns.items()}
+
+    def get(self, char_id):
+        """캐릭터 ID의 행 위치 (없으면 None)"""
+        return self.by_id.get(char_id)
+
+    def character_id(self, pos):
+        """행 위치의 캐릭터 ID"""
+        return int(self.ids[pos])
+
+    def find(self, name):
+        """한글 이름 → 영문 이름 순으로 찾은 행 위치 목록 (없으면 빈 목록)"""
+        key = normalize_text(name)
+        return list(self.by_korean_name.get(key) or self.by_english_name.get(key.casefold(), []))
+
+
+def load_repository(path=DATASET_PATH):
+    """
+    캐릭터 저장소 생성 (Parquet이면 호환 뷰, CSV면 정규화 후 사용)
+
+    Parquet을 쓸 수 없으면(스키마 버전 불일치, pyarrow 없음) 통합 CSV로 대체합니다.
+
+    Returns:
+        CharacterRepository 또는 None (읽을 파일이 없을 때)
+
+    Raises:
+        ValueError: 필수 컬럼(REQUIRED_COLUMNS)이 없을 때
+    """
+    path = Path(path)
+    version = _source_version(path)
+    df = None
+    if path.suffix == '.parquet':
+        df = load_legacy_view(path=path)
+        if df is None:
+            path = UNIFIED_CSV_PATH
+    if df is None:
+        if not path.exists():
+            return None
+        try:
+            df = pd.read_csv(path, encoding='utf-8-sig')
+        except UnicodeDecodeError:
+            df = pd.read_csv(path, encoding='cp949')
+        df = normalize_legacy_frame(df)
+    missing_columns = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+    if missing_columns:
+        raise ValueError(f"필수 컬럼이 누락되었습니다: {missing_columns}")
+    # 앱마다 따로 채우던 빠진 컬럼(출시일, 퍼스널리티 등)을 로드 시 한 번만 채움
+    for column in LEGACY_COLUMNS.values():
+        if column not in df.columns and column != ID_COLUMN:  # ID가 없으면 CharacterRepository가 행 위치로 대체
+            df[column] = 0 if column == '최대성급' else ''
+    return CharacterRepository(df, source=path, version=version)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _shared_repository(path, version):
+    repository = load_repository(path)
+    if repository is not None:
+        print(f"📚 캐릭터 저장소 로드: {len(repository)}명 ({repository.source})")
+    return repository
+
+
+def get_character_repository(path=DATASET_PATH):
+    """
+    프로세스 전체에서 공유하는 캐릭터 저장소 (파일이 바뀌면 다시 로드, 못 읽으면 None)
+
+    이 함수는 공용 모듈에 한 번만 정의되므로 모든 페이지가 같은 캐시 항목을 씁니다.
+    """
+    path = Path(path)
+    version = _source_version(path)
+    return _shared_repository(str(path), version)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗃️ Another Eden 정규 캐릭터 데이터셋 (Parquet)
+eden_unified_data.csv를 정규화한 뒤 타입이 지정된 컬럼형 파일 하나로 변환합니다.
+정규화는 여기서 한 번만 하고, 앱은 값을 그대로 비교·표시합니다.
+    - 캐릭터 ID: 에셋 파일 이름의 숫자 ID에서 만든 안정적인 정수 (character_ids 참고, CSV에 있으면 그대로 사용)
+    - 모든 문자열: NFKC + BOM/줄바꿈 없는 공백 제거
+    - 희귀도: '4~5★ SA' → 최고 성급 등급 '5★ SA' (원래 범위는 rarity_range, 숫자는 max_star)
+    - 무기: 표기 통일 ('주먹' → '권갑')
+    - 속성·무기·방어구·퍼스널리티 및 아이콘 경로: 리스트 컬럼
+    - 이미지 경로: 실제 파일을 찾아 프로젝트 기준 POSIX 경로로 고정 (이름으로 못 찾으면 캐릭터 ID로, 그래도 없으면 '')
+    - 출시일: 날짜 타입
+    - 희귀도/속성/무기는 사전(categorical) 인코딩
+    - 스키마 버전을 파일 메타데이터에 기록 (버전이 다르면 앱은 CSV로 대체)
+
+앱은 load_dataset(columns=...)으로 필요한 컬럼만 읽고, 기존 한글 컬럼 형식이 필요한 곳은
+load_legacy_view()로 '|' 구분 문자열 컬럼(eden_unified_data.csv와 같은 이름)을 받습니다.
+
+사용법:
+    python eden_dataset.py   # 04_data/csv/eden_unified_data.csv → 04_data/dataset/eden_characters.parquet
+"""
+
+import os
+import re
+import unicodedata
+from pathlib import Path
+
+import pandas as pd
+
+from character_ids import ID_COLUMN, assign_character_ids, index_by_character_id
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+CSV_DIR = PROJECT_ROOT / "04_data" / "csv"
+UNIFIED_CSV_PATH = CSV_DIR / "eden_unified_data.csv"
+DATASET_DIR = PROJECT_ROOT / "04_data" / "dataset"
+DATASET_PATH = DATASET_DIR / "eden_characters.parquet"
+IMAGE_SEARCH_DIR = PROJECT_ROOT / "04_data" / "images" / "character_art"
+
+SCHEMA_VERSION = 3
+SCHEMA_VERSION_KEY = b"eden_schema_version"
+
+# 정규 컬럼 → 기존 CSV(eden_unified_data.csv) 컬럼
+LEGACY_COLUMNS = {
+    'character_id': ID_COLUMN,
+    'korean_name': '캐릭터명',
+    'english_name': 'English_Name',
+    'icon_path': '캐릭터아이콘경로',
+    'rarity': '희귀도',
+    'rarity_range': '희귀도범위',
+    'max_star': '최대성급',
+    'elements': '속성명리스트',
+    'weapons': '무기명리스트',
+    'personalities': '퍼스널리티리스트',
+    'element_icons': '속성_아이콘경로리스트',
+    'weapon_icons': '무기_아이콘경로리스트',
+    'armors': '방어구명리스트',
+    'armor_icons': '방어구_아이콘경로리스트',
+    'equipment_info': '속성장비_정보',
+    'release_date': '출시일',
+}
+NAME_LIST_COLUMNS = ('elements', 'weapons', 'armors', 'personalities')   # '|' 또는 ','로 구분된 이름
+PATH_LIST_COLUMNS = ('element_icons', 'weapon_icons', 'armor_icons')     # '|'로 구분된 경로
+LIST_SEPARATOR = '|'
+WEAPON_ALIASES = {'주먹': '권갑'}
+
+
+def _schema():
+    import pyarrow as pa
+
+    category = pa.dictionary(pa.int16(), pa.string())
+    return pa.schema([
+        ('character_id', pa.int64()),
+        ('korean_name', pa.string()),
+        ('english_name', pa.string()),
+        ('icon_path', pa.string()),
+        ('rarity', category),
+        ('rarity_range', category),
+        ('max_star', pa.int8()),
+        ('elements', pa.list_(category)),
+        ('weapons', pa.list_(category)),
+        ('armors', pa.list_(category)),
+        ('personalities', pa.list_(pa.string())),
+        ('element_icons', pa.list_(pa.string())),
+        ('weapon_icons', pa.list_(pa.string())),
+        ('armor_icons', pa.list_(pa.string())),
+        ('equipment_info', pa.list_(pa.string())),
+        ('release_date', pa.date32()),
+    ], metadata={SCHEMA_VERSION_KEY: str(SCHEMA_VERSION).encode()})
+
+
+# --- 정규화 ---
+
+def normalize_text(value):
+    """NFKC 정규화 + BOM 제거 + 줄바꿈 없는 공백을 일반 공백으로 (앞뒤 공백 제거)"""
+    if not isinstance(value, str):
+        return ''
+    return unicodedata.normalize('NFKC', value).replace('\ufeff', '').replace('\u00a0', ' ').strip()
+
+
+def canonical_rarity(value):
+    """
+    희귀도 범위를 최고 성급 등급으로 정리
+
+    Returns:
+        (등급, 최고 성급) 예: '4~5★ SA' → ('5★ SA', 5), 성급이 없으면 (원래 값, 0)
+    """
+    value = normalize_text(value)
+    stars = [int(n) for n in re.findall(r'(\d)(?=★)', value)]
+    if not stars:
+        return value, 0
+    max_star = max(stars)
+    return f"{max_star}★{' SA' if 'SA' in value else ''}", max_star
+
+
+def split_names(value):
+    return [item for item in (normalize_text(v) for v in re.split('[|,]', normalize_text(value))) if item]
+
+
+def split_weapons(value):
+    return [WEAPON_ALIASES.get(name, name) for name in split_names(value)]
+
+
+class ImagePathResolver:
+    """
+    CSV의 이미지 경로를 실제 파일의 프로젝트 기준 POSIX 경로로 변환
+    파일 이름(대소문자 무시)으로 먼저 찾고, 없으면 에셋 파일 이름의 캐릭터 ID로 찾습니다.
+    """
+
+    def __init__(self, search_dir=IMAGE_SEARCH_DIR):
+        self.by_name = {}
+        for dirpath, _dirnames, filenames in os.walk(search_dir):
+            for filename in filenames:
+                rel = (Path(dirpath) / filename).relative_to(PROJECT_ROOT).as_posix()
+                self.by_name.setdefault(filename.lower(), rel)
+        self.by_id = index_by_character_id(self.by_name.values())
+
+    def resolve(self, value, char_id=None):
+        path = normalize_text(value).replace('\\', '/')
+        if path and (PROJECT_ROOT / path).is_file():
+            return Path(os.path.relpath(PROJECT_ROOT / path, PROJECT_ROOT)).as_posix()
+        resolved = self.by_name.get(path.rsplit('/', 1)[-1].lower(), '') if path else ''
+        return resolved or (self.by_id.get(char_id, '') if char_id is not None else '')
+
+    def resolve_list(self, value):
+        return [resolved for resolved in (self.resolve(item) for item in normalize_text(value).split('|')) if resolved]
+
+
+def build_dataset(source_csv=UNIFIED_CSV_PATH, output_path=DATASET_PATH):
+    """통합 CSV를 정규 Parquet 데이터셋으로 변환하고 캐릭터 수 반환"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    source = pd.read_csv(source_csv, encoding='utf-8-sig', dtype=str).fillna('')
+    legacy_to_canonical = {legacy: canonical for canonical, legacy in LEGACY_COLUMNS.items()}
+    source = source.rename(columns=legacy_to_canonical)
+    resolver = ImagePathResolver()
+
+    def raw(name):
+        return source[name].tolist() if name in source.columns else [''] * len(source)
+
+    rarities = [canonical_rarity(value) for value in raw('rarity')]
+    english_names = [normalize_text(v) for v in raw('english_name')]
+    character_ids = assign_character_ids(raw('icon_path'), english_names, existing=raw('character_id'))
+    columns = {
+        'character_id': character_ids,
+        'korean_name': [normalize_text(v) for v in raw('korean_name')],
+        'english_name': english_names,
+        'icon_path': [resolver.resolve(v, char_id) for v, char_id in zip(raw('icon_path'), character_ids)],
+        'rarity': [tier for tier, _max_star in rarities],
+        'rarity_range': [normalize_text(v) for v in raw('rarity')],
+        'max_star': [max_star for _tier, max_star in rarities],
+        'elements': [split_names(v) for v in raw('elements')],
+        'weapons': [split_weapons(v) for v in raw('weapons')],
+        'armors': [split_names(v) for v in raw('armors')],
+        'personalities': [split_names(v) for v in raw('personalities')],
+        'element_icons': [resolver.resolve_list(v) for v in raw('element_icons')],
+        'weapon_icons': [resolver.resolve_list(v) for v in raw('weapon_icons')],
+        'armor_icons': [resolver.resolve_list(v) for v in raw('armor_icons')],
+        'equipment_info': [[item for item in (normalize_text(x) for x in normalize_text(v).split('|')) if item]
+                           for v in raw('equipment_info')],
+        'release_date': pd.to_datetime(pd.Series(raw('release_date')).map(normalize_text),
+                                       errors='coerce').dt.date.tolist(),
+    }
+
+    schema = _schema()
+    arrays = []
+    for field in schema:
+        values = columns[field.name]
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        elif pa.types.is_list(field.type) and pa.types.is_dictionary(field.type.value_type):
+            # 리스트 안의 값도 사전 인코딩 (속성/무기는 종류가 몇 개뿐)
+            plain = pa.array(values, type=pa.list_(pa.string()))
+            arrays.append(pa.ListArray.from_arrays(plain.offsets, plain.values.dictionary_encode()))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    table = pa.Table.from_arrays(arrays, schema=schema)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    pq.write_table(table, tmp_path, compression='zstd')
+    os.replace(tmp_path, output_path)
+    return table.num_rows
+
+
+def _read_table(columns=None, path=DATASET_PATH):
+    """Arrow 테이블로 읽기 (파일이 없거나, 스키마 버전이 다르거나, pyarrow가 없으면 None)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    try:
+        parquet_file = pq.ParquetFile(path)
+        metadata = parquet_file.schema_arrow.metadata or {}
+        if metadata.get(SCHEMA_VERSION_KEY) != str(SCHEMA_VERSION).encode():
+            return None
+        return parquet_file.read(columns=list(columns) if columns is not None else None)
+    except (OSError, ValueError):
+        return None
+
+
+def load_dataset(columns=None, path=DATASET_PATH):
+    """
+    정규 데이터셋 로드 (필요한 컬럼만 읽음)
+
+    Returns:
+        DataFrame 또는 None (파일이 없거나, 스키마 버전이 다르거나, pyarrow가 없을 때)
+    """
+    table = _read_table(columns, path)
+    return table.to_pandas() if table is not None else None
+
+
+def load_legacy_view(columns=None, path=DATASET_PATH):
+    """
+    기존 CSV와 같은 한글 컬럼/문자열 형식의 호환 뷰
+
+    Args:
+        columns: 필요한 기존 컬럼 이름 목록 (None이면 전체)
+
+    Returns:
+        DataFrame 또는 None. 리스트 컬럼은 '|'로 이어 붙이고 빈 값은 ''로 채웁니다.
+    """
+    canonical_for = {legacy: canonical for canonical, legacy in LEGACY_COLUMNS.items()}
+    if columns is None:
+        wanted = list(LEGACY_COLUMNS)
+    else:
+        wanted = [canonical_for[c] for c in columns if c in canonical_for]
+    table = _read_table(wanted, path)
+    if table is None:
+        return None
+
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    # 문자열 변환은 행 단위 파이썬 루프 대신 Arrow 연산으로 처리
+    view = {}
+    for name in wanted:
+        column = table.column(name)
+        if pa.types.is_list(column.type):
+            column = pc.binary_join(column.cast(pa.list_(pa.string())), LIST_SEPARATOR)
+        elif pa.types.is_date(column.type):
+            column = pc.strftime(column, format='%Y-%m-%d')
+        elif pa.types.is_dictionary(column.type):
+            column = column.cast(pa.string())
+        if pa.types.is_string(column.type):
+            column = pc.fill_null(column, '')
+        view[LEGACY_COLUMNS[name]] = column
+    return pa.table(view).to_pandas()
+
+
+def normalize_legacy_frame(df):
+    """
+    CSV로 읽은 기존 형식 데이터에 정규 데이터셋과 같은 정규화를 적용 (Parquet을 쓸 수 없을 때의 대체 경로)
+
+    문자열 정리, 희귀도 등급/최고 성급, 무기 표기 통일, 이미지 경로 고정을 로드 시 한 번만 수행합니다.
+    """
+    df = df.fillna('').copy()
+    resolver = ImagePathResolver()
+    for column in df.columns:
+        if pd.api.types.is_string_dtype(df[column]):
+            df[column] = df[column].map(normalize_text)
+    column_values = (lambda column: df[column].tolist() if column in df.columns else [''] * len(df))
+    df[ID_COLUMN] = pd.array(assign_character_ids(column_values('캐릭터아이콘경로'), column_values('English_Name'),
+                                                  existing=column_values(ID_COLUMN)), dtype='int64')
+    if '희귀도' in df.columns:
+        rarities = [canonical_rarity(value) for value in df['희귀도']]
+        df['희귀도범위'] = df['희귀도']
+        df['희귀도'] = [tier for tier, _max_star in rarities]
+        df['최대성급'] = [max_star for _tier, max_star in rarities]
+    for column in ('속성명리스트', '방어구명리스트', '퍼스널리티리스트'):
+        if column in df.columns:
+            df[column] = [LIST_SEPARATOR.join(split_names(value)) for value in df[column]]
+    if '무기명리스트' in df.columns:
+        df['무기명리스트'] = [LIST_SEPARATOR.join(split_weapons(value)) for value in df['무기명리스트']]
+    if '캐릭터아이콘경로' in df.columns:
+        df['캐릭터아이콘경로'] = [resolver.resolve(value, char_id)
+                             for value, char_id in zip(df['캐릭터아이콘경로'], df[ID_COLUMN])]
+    for column in ('속성_아이콘경로리스트', '무기_아이콘경로리스트', '방어구_아이콘경로리스트'):
+        if column in df.columns:
+            df[column] = [LIST_SEPARATOR.join(resolver.resolve_list(value)) for value in df[column]]
+    return df
+
+
+if __name__ == "__main__":
+    count = build_dataset()
+    print(f"🗃️ 정규 데이터셋 생성 완료: {count}명 → {DATASET_PATH} "
+          f"({DATASET_PATH.stat().st_size / 1024:.1f} KB, 스키마 v{SCHEMA_VERSION})")
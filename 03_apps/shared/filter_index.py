@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔎 캐릭터 필터 인덱스
+희귀도/속성/무기/퍼스널리티 등의 값마다 캐릭터 전체에 대한 NumPy 불리언 마스크를 미리 만들어 두고,
+필터 조합(AND/OR)을 행 단위 순회 없이 마스크 연산만으로 계산합니다.
+사이드바 선택지 목록도 인덱스의 값 목록을 그대로 사용합니다.
+"""
+
+import re
+
+import numpy as np
+
+
+MULTI_VALUE_SEPARATOR = re.compile('[|,]')
+
+
+def split_values(value):
+    """'불|물' 또는 'A, B' 형태의 셀을 공백 제거된 값 목록으로 분리"""
+    if not isinstance(value, str) or not value:
+        return []
+    return [item.strip() for item in MULTI_VALUE_SEPARATOR.split(value) if item.strip()]
+
+
+class FilterIndex:
+    """
+    필드(값) → 캐릭터 불리언 마스크 인덱스
+
+    Args:
+        df: 캐릭터 데이터프레임 (마스크는 df의 행 순서를 따름)
+        fields: {필드 이름: (컬럼 이름, 여러 값 여부)}
+            여러 값 필드는 셀을 '|' 또는 ','로 나눠 각 값마다 마스크를 만들고,
+            단일 값 필드는 셀 전체를 하나의 값으로 사용합니다.
+    """
+
+    def __init__(self, df, fields):
+        self.size = len(df)
+        self.masks = {}  # 필드 → {값: 불리언 배열}
+        for field, (column, multi_valued) in fields.items():
+            positions = {}
+            if column in df.columns:
+                for pos, cell in enumerate(df[column].tolist()):
+                    if multi_valued:
+                        values = split_values(cell)
+                    elif isinstance(cell, str):
+                        values = [cell] if cell.strip() else []
+                    else:
+                        values = [] if cell is None or cell != cell else [cell]  # NaN 제외
+                    for value in values:
+                        positions.setdefault(value, []).append(pos)
+            field_masks = {}
+            for value, rows in positions.items():
+                mask = np.zeros(self.size, dtype=bool)
+                mask[rows] = True
+                field_masks[value] = mask
+            self.masks[field] = field_masks
+
+    def all(self):
+        return np.ones(self.size, dtype=bool)
+
+    def none(self):
+        return np.zeros(self.size, dtype=bool)
+
+    def options(self, field):
+        """필드의 선택지 목록 (정렬됨)"""
+        return sorted(self.masks.get(field, {}), key=str)
+
+    def count(self, field, value):
+        mask = self.masks.get(field, {}).get(value)
+        return int(mask.sum()) if mask is not None else 0
+
+    def mask(self, field, values, match_all=False):
+        """
+        선택한 값들의 마스크 (선택이 없으면 전체)
+
+        Args:
+            match_all: True면 모든 값을 가진 캐릭터(AND), False면 하나라도 가진 캐릭터(OR)
+        """
+        if not values:
+            return self.all()
+        field_masks = self.masks.get(field, {})
+        result = self.all() if match_all else self.none()
+        for value in values:
+            value_mask = field_masks.get(value)
+            if value_mask is None:
+                if match_all:
+                    return self.none()
+                continue
+            if match_all:
+                result &= value_mask
+            else:
+                result |= value_mask
+        return result
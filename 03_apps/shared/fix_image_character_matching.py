@@ -12,6 +12,9 @@ from pathlib import Path
 import re
 import unicodedata
 
+from character_ids import ID_COLUMN, character_id, parse_character_id
+from image_lookup import get_image_index
+
 # 경로 설정
 BASE_DIR = Path(__file__).parent.resolve()
 IMAGE_DIR = BASE_DIR / "character_art"
@@ -35,23 +38,6 @@ def load_korean_mapping():
             print(f"[ERROR] 매핑 파일 읽기 실패: {e}")
     return mapping
 
-def find_all_image_files():
-    """모든 이미지 파일 검색"""
-    image_files = {}
-    if not IMAGE_DIR.exists():
-        return image_files
-    
-    # 모든 하위 디렉토리 포함 검색
-    for root, dirs, files in os.walk(IMAGE_DIR):
-        for file in files:
-            if file.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.webp')):
-                full_path = Path(root) / file
-                # 파일명(확장자 제외)을 키로 사용
-                filename_key = file.lower().rsplit('.', 1)[0]
-                image_files[filename_key] = str(full_path)
-    
-    return image_files
-
 def normalize_name(name):
     """이름 정규화"""
     if not name:
@@ -78,8 +64,8 @@ def extract_style_suffix(name):
             break
     return base_name.strip(), style_suffix
 
-def find_matching_image(char_name, eng_name, image_files, korean_mapping):
-    """캐릭터에 맞는 이미지 파일 찾기"""
+def find_matching_image(char_name, eng_name, image_index, korean_mapping):
+    """캐릭터에 맞는 이미지 파일 찾기 (후보 이름마다 이미지 인덱스 조회 한 번)"""
     # 검색할 이름 후보들
     search_names = []
     
@@ -98,28 +84,11 @@ def find_matching_image(char_name, eng_name, image_files, korean_mapping):
         if korean_mapped:
             search_names.append(normalize_name(korean_mapped + style_suffix))
     
-    # 각 후보 이름으로 이미지 파일 검색
+    # 각 후보 이름으로 이미지 파일 검색 (정확한 이름 → 공백/특수문자 무시 → 스타일별 → 스타일 제거 순)
     for search_name in search_names:
-        if not search_name:
-            continue
-            
-        # 정확한 매칭
-        search_key = search_name.lower()
-        if search_key in image_files:
-            return image_files[search_key]
-        
-        # 부분 매칭 (스타일 접미사 제거)
-        base_search, _ = extract_style_suffix(search_name)
-        base_key = base_search.lower()
-        if base_key in image_files:
-            return image_files[base_key]
-        
-        # 유사 매칭 (공백, 특수문자 제거)
-        clean_key = re.sub(r'[^\w가-힣]', '', search_key)
-        for file_key, file_path in image_files.items():
-            clean_file_key = re.sub(r'[^\w가-힣]', '', file_key)
-            if clean_key == clean_file_key:
-                return file_path
+        image_path = image_index.find(search_name)
+        if image_path:
+            return image_path
     
     return None
 
@@ -133,10 +102,10 @@ def fix_data_matching():
     print(f"한글 매핑 로드: {len(korean_mapping)}개")
     
     # 이미지 파일 검색
-    image_files = find_all_image_files()
-    print(f"이미지 파일 발견: {len(image_files)}개")
+    image_index = get_image_index(IMAGE_DIR)
+    print(f"이미지 파일 발견: {len(image_index)}개")
     
-    if not image_files:
+    if not len(image_index):
         print("[WARN] 이미지 파일이 없습니다. 원본 데이터를 사용합니다.")
         # 원본 데이터 사용
         if ORIGINAL_CSV.exists():
@@ -185,8 +154,13 @@ def fix_data_matching():
             char_name = normalize_name(row.get('캐릭터명', ''))
             eng_name = normalize_name(row.get('영문명', ''))
             
-            # 이미지 파일 찾기
-            image_path = find_matching_image(char_name, eng_name, image_files, korean_mapping)
+            # 캐릭터 ID (CSV에 없으면 기존 이미지 경로의 에셋 ID → 영문명으로 생성)
+            char_id = parse_character_id(row.get(ID_COLUMN))
+            if char_id is None:
+                char_id = character_id(str(row.get('캐릭터아이콘경로', '')), eng_name)
+            
+            # 이미지 파일 찾기 (캐릭터 ID(에셋 ID) → 이름 순)
+            image_path = image_index.get(char_id) or find_matching_image(char_name, eng_name, image_index, korean_mapping)
             
             # 한글 이름 보정
             if not char_name or char_name == eng_name:
@@ -200,6 +174,7 @@ def fix_data_matching():
             
             # 결과 추가
             results.append({
+                ID_COLUMN: char_id,
                 '캐릭터명': char_name,
                 '영문명': eng_name,
                 '캐릭터아이콘경로': image_path or '',
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🖼️ 공용 아이콘 data URI 캐시
+퀴즈/룰렛/런처가 같은 아이콘을 매 렌더링·재실행마다 다시 읽고 base64 인코딩하지 않도록
+메모리 LRU + 디스크(경로·수정 시각 기준) 2단계로 인코딩 결과를 캐시합니다.
+디스크 캐시는 프로세스 간에 공유되므로 다른 앱에서 한 번 인코딩한 아이콘은 바로 재사용됩니다.
+
+Streamlit 정적 파일 서빙(server.enableStaticServing)이 켜져 있으면 icon_src()는 data URI 대신
+app/static/img/<내용 해시>.png URL을 반환하므로, HTML에는 짧은 URL만 실리고 브라우저 캐시가 재사용됩니다.
+"""
+
+import os
+import base64
+import shutil
+import hashlib
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from image_derivatives import best_variant
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+ICON_CACHE_DIR = PROJECT_ROOT / "04_data" / "cache" / "icon_data_uri"
+MEMORY_CACHE_SIZE = 2048  # 전체 아이콘 수(약 1,400개)를 넉넉히 담는 크기
+STATIC_IMAGE_SUBDIR = "img"  # <메인 스크립트 폴더>/static/img 에 게시
+
+MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+}
+
+
+def _disk_cache_path(path_str, mtime_ns, size):
+    key = hashlib.sha1(f"{path_str}|{mtime_ns}|{size}".encode('utf-8')).hexdigest()
+    return ICON_CACHE_DIR / key[:2] / f"{key}.txt"
+
+
+@lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def _encode_cached(path_str, mtime_ns, size):
+    """(경로, 수정 시각, 크기)가 같으면 같은 data URI를 반환 (파일이 바뀌면 키가 달라짐)"""
+    cache_path = _disk_cache_path(path_str, mtime_ns, size)
+    try:
+        return cache_path.read_text(encoding='ascii')
+    except OSError:
+        pass
+
+    with open(path_str, 'rb') as f:
+        encoded = base64.b64encode(f.read()).decode()
+    mime_type = MIME_TYPES.get(os.path.splitext(path_str)[1].lower(), 'image/png')
+    data_uri = f"data:{mime_type};base64,{encoded}"
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(data_uri, encoding='ascii')
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # 읽기 전용 배포 환경에서는 메모리 캐시만 사용
+    return data_uri
+
+
+def icon_to_data_uri(path, default=None, display_px=None):
+    """
+    이미지 파일을 data URI로 변환 (캐시 사용)
+
+    Args:
+        path: 이미지 파일 경로 (str 또는 Path)
+        default: 파일이 없거나 지원하지 않는 형식일 때 반환할 값
+        display_px: 화면 표시 크기 (CSS px). 지정하면 파생본 manifest에서 충분히 작은 WebP를 사용
+
+    Returns:
+        str: data URI 문자열 또는 default
+    """
+    try:
+        path = best_variant(path, display_px)
+        path_str = os.path.abspath(str(path))
+        if os.path.splitext(path_str)[1].lower() not in MIME_TYPES:
+            return default
+        stat = os.stat(path_str)
+        return _encode_cached(path_str, stat.st_mtime_ns, stat.st_size)
+    except (OSError, ValueError, TypeError):
+        return default
+
+
+def icon_to_base64(path, default=None):
+    """data URI에서 접두사를 뺀 순수 base64 문자열 반환"""
+    data_uri = icon_to_data_uri(path)
+    if data_uri is None:
+        return default
+    return data_uri.split(',', 1)[1]
+
+
+def cache_info():
+    """메모리 LRU 적중/미스 통계"""
+    return _encode_cached.cache_info()
+
+
+# --- 정적 URL 서빙 ---
+
+def static_serving_enabled():
+    """Streamlit 정적 파일 서빙 설정 여부 (.streamlit/config.toml의 server.enableStaticServing)"""
+    try:
+        import streamlit as st
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def _app_static_dir():
+    """현재 실행 중인 Streamlit 메인 스크립트 옆의 static 폴더 (실행 컨텍스트가 없으면 None)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except Exception:
+        return None
+    if ctx is None or not getattr(ctx, 'main_script_path', None):
+        return None
+    return str(Path(ctx.main_script_path).parent.resolve() / "static")
+
+
+@lru_cache(maxsize=MEMORY_CACHE_SIZE)
+def _publish_static(path_str, mtime_ns, size, static_dir):
+    """
+    이미지를 static/img/<내용 해시><확장자>로 게시하고 상대 URL 반환
+
+    파일 이름이 내용 해시라서 내용이 같으면 URL도 같고(브라우저 캐시 공유), 바뀌면 URL도 바뀝니다.
+    Streamlit은 static 폴더 밖을 가리키는 심볼릭 링크를 거부하므로 하드 링크(불가 시 복사)를 사용합니다.
+    """
+    with open(path_str, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:20]
+    ext = os.path.splitext(path_str)[1].lower()
+    file_name = f"{digest}{ext}"
+    target_dir = os.path.join(static_dir, STATIC_IMAGE_SUBDIR)
+    target = os.path.join(target_dir, file_name)
+    if not os.path.exists(target):
+        os.makedirs(target_dir, exist_ok=True)
+        tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.link(path_str, tmp_path)
+        except OSError:
+            shutil.copy2(path_str, tmp_path)
+        os.replace(tmp_path, target)
+    return f"app/static/{STATIC_IMAGE_SUBDIR}/{file_name}"
+
+
+def icon_to_url(path, default=None, display_px=None):
+    """이미지를 Streamlit 정적 URL로 변환 (실행 컨텍스트 밖이거나 실패하면 default)"""
+    static_dir = _app_static_dir()
+    if static_dir is None:
+        return default
+    try:
+        path = best_variant(path, display_px)
+        path_str = os.path.abspath(str(path))
+        if os.path.splitext(path_str)[1].lower() not in MIME_TYPES:
+            return default
+        stat = os.stat(path_str)
+        return _publish_static(path_str, stat.st_mtime_ns, stat.st_size, static_dir)
+    except (OSError, ValueError, TypeError):
+        return default
+
+
+def icon_src(path, default=None, display_px=None):
+    """<img src>에 넣을 값: 정적 서빙이 켜져 있으면 URL, 아니면 data URI"""
+    if static_serving_enabled():
+        url = icon_to_url(path, display_px=display_px)
+        if url is not None:
+            return url
+    return icon_to_data_uri(path, default=default, display_px=display_px)
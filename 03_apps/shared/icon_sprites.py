@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧩 속성/무기/방어구 아이콘 스프라이트 아틀라스
+character_art/elements_equipment의 작은 아이콘들을 한 장의 아틀라스 이미지로 묶고 좌표 인덱스를 기록합니다.
+카드 그리드는 아이콘마다 data URI를 넣는 대신 아틀라스 한 장 + CSS background-position으로 표시합니다.
+
+사용법:
+    python icon_sprites.py          # 아이콘이 바뀌었을 때만 아틀라스 다시 생성
+    python icon_sprites.py --force  # 강제로 다시 생성
+"""
+
+import os
+import sys
+import json
+import math
+import html
+import time
+from pathlib import Path
+
+from icon_cache import icon_src
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+SPRITE_SOURCE_DIR = PROJECT_ROOT / "04_data" / "images" / "character_art" / "elements_equipment"
+SPRITE_DIR = PROJECT_ROOT / "04_data" / "images" / "sprites"
+ATLAS_PATH = SPRITE_DIR / "elements_equipment.png"
+INDEX_PATH = SPRITE_DIR / "elements_equipment.json"
+CELL_PX = 56  # 카드 아이콘 표시 크기(28px)의 2배 (고해상도 화면 대응)
+SOURCE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp'}
+
+
+def _icon_key(path):
+    """CSV의 경로 표기(/ 또는 \\)와 관계없이 파일명으로 조회"""
+    return str(path).replace("\\", "/").rsplit("/", 1)[-1].strip().lower()
+
+
+def _source_files(source_dir):
+    return sorted(p for p in Path(source_dir).iterdir()
+                  if p.is_file() and p.suffix.lower() in SOURCE_EXTENSIONS)
+
+
+def build_atlas(source_dir=SPRITE_SOURCE_DIR, force=False):
+    """아이콘 아틀라스와 좌표 인덱스 생성 (변경이 없으면 False 반환)"""
+    from PIL import Image
+
+    files = _source_files(source_dir)
+    sources = {p.name: p.stat().st_mtime_ns for p in files}
+    previous = _read_index()
+    if not force and previous.get('sources') == sources and ATLAS_PATH.exists():
+        return False
+
+    columns = max(1, math.ceil(math.sqrt(len(files))))
+    rows = max(1, math.ceil(len(files) / columns))
+    atlas = Image.new('RGBA', (columns * CELL_PX, rows * CELL_PX), (0, 0, 0, 0))
+    icons = {}
+
+    for i, path in enumerate(files):
+        col, row = i % columns, i // columns
+        with Image.open(path) as img:
+            icon = img.convert('RGBA')
+            icon.thumbnail((CELL_PX, CELL_PX), Image.LANCZOS)
+            # 셀 가운데 정렬
+            offset = ((CELL_PX - icon.width) // 2, (CELL_PX - icon.height) // 2)
+            atlas.paste(icon, (col * CELL_PX + offset[0], row * CELL_PX + offset[1]), icon)
+        icons[_icon_key(path.name)] = [col, row]
+
+    SPRITE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_atlas = ATLAS_PATH.with_name(f".{ATLAS_PATH.name}.tmp")
+    atlas.save(tmp_atlas, 'PNG', optimize=True)
+    os.replace(tmp_atlas, ATLAS_PATH)
+
+    index = {
+        'cell': CELL_PX,
+        'columns': columns,
+        'rows': rows,
+        'icons': icons,
+        'sources': sources,
+        'updated_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    tmp_index = f"{INDEX_PATH}.tmp"
+    with open(tmp_index, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_index, INDEX_PATH)
+    _index_cache.clear()
+    return True
+
+
+def _read_index():
+    try:
+        with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+# --- 앱에서 사용하는 조회 API ---
+
+_index_cache = {}
+
+
+def load_sprite_index():
+    """좌표 인덱스 로드 (아틀라스가 없으면 빈 딕셔너리, 파일이 바뀌었을 때만 다시 읽음)"""
+    try:
+        mtime_ns = INDEX_PATH.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if not ATLAS_PATH.exists():
+        return {}
+    if _index_cache.get('mtime_ns') != mtime_ns:
+        # 내용을 먼저 넣어야 다른 스레드가 새 mtime만 보고 빈 항목을 읽지 않음
+        _index_cache['index'] = _read_index()
+        _index_cache['mtime_ns'] = mtime_ns
+    return _index_cache['index']
+
+
+def sprite_css(display_px=28, selector=".eden-sprite"):
+    """아틀라스를 한 번만 참조하는 CSS 규칙 (아틀라스가 없으면 빈 문자열)"""
+    index = load_sprite_index()
+    if not index:
+        return ""
+    atlas_src = icon_src(ATLAS_PATH)
+    if not atlas_src:
+        return ""
+    rules = [
+        f"{selector} {{ display: inline-block; width: {display_px}px; height: {display_px}px; "
+        f"flex-shrink: 0; background-image: url('{atlas_src}'); background-repeat: no-repeat; "
+        f"background-size: {index['columns'] * display_px}px {index['rows'] * display_px}px; }}"
+    ]
+    # 아이콘별 좌표는 셀 번호 클래스(.s0, .s1, ...)로 한 번만 정의해 카드 HTML을 짧게 유지
+    for col, row in sorted(index.get('icons', {}).values(), key=lambda pos: (pos[1], pos[0])):
+        rules.append(f"{selector}.s{row * index['columns'] + col} "
+                     f"{{ background-position: -{col * display_px}px -{row * display_px}px; }}")
+    return "\n".join(rules)
+
+
+def sprite_html(path, title="", class_name="eden-sprite"):
+    """아이콘 경로에 해당하는 스프라이트 span (아틀라스에 없으면 None, 크기·좌표는 sprite_css()가 정의)"""
+    if not path:
+        return None
+    index = load_sprite_index()
+    position = index.get('icons', {}).get(_icon_key(path)) if index else None
+    if position is None:
+        return None
+    col, row = position
+    cell = row * index['columns'] + col
+    return f'<span class="{class_name} s{cell}" role="img" aria-label="{html.escape(title)}"></span>'
+
+
+if __name__ == "__main__":
+    force = len(sys.argv) > 1 and sys.argv[1] == "--force"
+    changed = build_atlas(force=force)
+    index = _read_index()
+    if changed:
+        print(f"🧩 아틀라스 생성 완료: 아이콘 {len(index.get('icons', {}))}개 → {ATLAS_PATH}")
+    else:
+        print(f"🧩 변경 없음: {ATLAS_PATH}")
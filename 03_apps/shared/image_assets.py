@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏗️ 앱용 이미지 산출물 일괄 생성
+데이터 빌드(create_complete_unified_data.py, master_scraper.py) 끝에 실행되어 앱이 쓰는 이미지 산출물을 만듭니다.
+산출물은 git에서 제외되므로 새로 체크아웃하거나 배포한 뒤에는 이 단계를 한 번 실행해야 합니다.
+없으면 앱은 원본 PNG, 인라인 data URI, CSS 실루엣으로 대체해 동작합니다.
+
+    1. image_derivatives: 표시 크기별 썸네일/WebP 파생본
+    2. icon_sprites: 속성/무기/방어구 아이콘 아틀라스
+    3. reveal_images: 실루엣 퀴즈 공개 단계 이미지
+
+각 단계는 변경된 원본만 처리하므로 반복 실행해도 빠릅니다.
+
+사용법:
+    python image_assets.py          # 변경된 이미지만 처리
+    python image_assets.py --force  # 전체 다시 생성
+"""
+
+import sys
+import time
+
+
+def build_image_assets(force=False):
+    """
+    파생본 → 아틀라스 → 공개 단계 이미지를 차례로 생성
+
+    Returns:
+        True면 모두 생성, False면 Pillow가 없어 건너뜀 (앱은 원본 이미지로 동작)
+    """
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("⚠️ Pillow가 설치되지 않아 이미지 산출물 생성을 건너뜁니다. 앱은 원본 이미지를 사용합니다.")
+        return False
+
+    from image_derivatives import build_derivatives
+    from icon_sprites import build_atlas
+    from reveal_images import build_reveal_images
+
+    started = time.time()
+    result = build_derivatives(force=force)
+    print(f"🪄 이미지 파생본: 생성 {result['generated']}개, 변경 없음 {result['unchanged']}개, "
+          f"실패 {result['failed']}개")
+    changed = build_atlas(force=force)
+    print(f"🧩 아이콘 아틀라스: {'다시 생성' if changed else '변경 없음'}")
+    result = build_reveal_images(force=force)
+    print(f"👤 공개 단계 이미지: 생성 {result['generated']}개, 변경 없음 {result['unchanged']}개, "
+          f"실패 {result['failed']}개")
+    print(f"✅ 이미지 산출물 생성 완료 ({time.time() - started:.1f}초)")
+    return True
+
+
+if __name__ == "__main__":
+    build_image_assets(force=len(sys.argv) > 1 and sys.argv[1] == "--force")
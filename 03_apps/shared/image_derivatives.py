@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🪄 캐릭터 이미지 파생본(썸네일/WebP) 생성기
+04_data/images/character_art 아래 모든 이미지에 대해 표시 크기별 WebP 썸네일을 만들고,
+앱이 화면 크기에 맞는 가장 작은 파일을 고를 수 있도록 manifest.json을 기록합니다.
+변경된 파일(수정 시각/크기 → 해시 순으로 확인)만 다시 생성합니다.
+
+사용법:
+    python image_derivatives.py          # 변경된 이미지만 생성
+    python image_derivatives.py --force  # 전체 다시 생성
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+SOURCE_DIR = PROJECT_ROOT / "04_data" / "images" / "character_art"
+DERIVATIVE_DIR = PROJECT_ROOT / "04_data" / "images" / "derivatives"
+MANIFEST_PATH = DERIVATIVE_DIR / "manifest.json"
+
+# 생성할 썸네일 최대 변 길이 (px). 앱 표시 크기의 2배(고해상도 화면)를 기준으로 함
+#   56: 카드 속성/무기 아이콘(28px), 140: 카드 캐릭터 아이콘(70px),
+#   400: 퀴즈 실루엣(200px), 560: 슬롯머신(280px)
+THUMBNAIL_SIZES = (56, 140, 400, 560)
+DEVICE_PIXEL_RATIO = 2
+WEBP_QUALITY = 85
+WEBP_METHOD = 4  # 6은 4보다 약 4배 느리고 크기는 1% 정도만 줄어듦
+SOURCE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _write_manifest(manifest):
+    DERIVATIVE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def _read_manifest():
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'images': {}}
+
+
+def _save_webp(img, dest):
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest.with_name(f".{dest.name}.tmp")
+    img.save(tmp_path, 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+    os.replace(tmp_path, dest)
+    return dest.stat().st_size
+
+
+def make_variants(src, rel_path):
+    """
+    이미지 하나의 파생본 생성
+
+    Returns:
+        {'width', 'height', 'variants': {최대 변 길이(str) 또는 'full': 프로젝트 기준 상대 경로}}
+        원본보다 커지는 WebP는 버리고 원본 경로를 사용합니다.
+    """
+    from PIL import Image
+
+    src_size = src.stat().st_size
+    src_rel = src.relative_to(PROJECT_ROOT).as_posix()
+    variants = {}
+
+    with Image.open(src) as img:
+        img.load()
+        width, height = img.size
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA')
+        longest = max(width, height)
+
+        webp_rel = Path(rel_path).with_suffix('.webp')
+        full_dest = DERIVATIVE_DIR / "full" / webp_rel
+        full_bytes = _save_webp(img, full_dest)
+        if full_bytes < src_size:
+            variants['full'] = full_dest.relative_to(PROJECT_ROOT).as_posix()
+        else:
+            full_dest.unlink()
+            variants['full'] = src_rel
+
+        for max_px in THUMBNAIL_SIZES:
+            if max_px >= longest:
+                continue  # 확대는 하지 않음 (full 사용)
+            thumb = img.copy()
+            thumb.thumbnail((max_px, max_px), Image.LANCZOS)
+            dest = DERIVATIVE_DIR / str(max_px) / webp_rel
+            _save_webp(thumb, dest)
+            variants[str(max_px)] = dest.relative_to(PROJECT_ROOT).as_posix()
+
+    return {'width': width, 'height': height, 'variants': variants}
+
+
+def _variants_exist(entry):
+    return all((PROJECT_ROOT / p).exists() for p in entry.get('variants', {}).values())
+
+
+def build_derivatives(source_dir=SOURCE_DIR, force=False):
+    """변경된 이미지의 파생본을 생성하고 manifest 갱신 (처리 통계 반환)"""
+    source_dir = Path(source_dir)
+    manifest = _read_manifest()
+    images = manifest.setdefault('images', {})
+    stats = {'generated': 0, 'unchanged': 0, 'failed': 0, 'removed': 0, 'source_bytes': 0, 'derived_bytes': 0}
+    seen = set()
+
+    for dirpath, _dirnames, filenames in os.walk(source_dir):
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[1].lower() not in SOURCE_EXTENSIONS:
+                continue
+            src = Path(dirpath) / filename
+            rel_path = src.relative_to(source_dir).as_posix()
+            key = src.relative_to(PROJECT_ROOT).as_posix()
+            seen.add(key)
+            stat = src.stat()
+            entry = images.get(key)
+
+            if not force and entry and _variants_exist(entry):
+                if entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+                    stats['unchanged'] += 1
+                    continue
+                # 수정 시각만 바뀐 경우 (복사/체크아웃 등) 해시로 확인
+                digest = file_hash(src)
+                if entry.get('sha256') == digest:
+                    entry['mtime_ns'] = stat.st_mtime_ns
+                    entry['size'] = stat.st_size
+                    stats['unchanged'] += 1
+                    continue
+
+            try:
+                entry = make_variants(src, rel_path)
+            except Exception as e:
+                print(f"  ✗ {key}: {e}")
+                stats['failed'] += 1
+                continue
+            entry.update({'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': file_hash(src)})
+            images[key] = entry
+            stats['generated'] += 1
+
+    # 원본이 사라진 항목 정리
+    for key in [k for k in images if k not in seen]:
+        for rel in images[key].get('variants', {}).values():
+            path = PROJECT_ROOT / rel
+            if path.is_relative_to(DERIVATIVE_DIR) and path.exists():
+                path.unlink()
+        del images[key]
+        stats['removed'] += 1
+
+    for key, entry in images.items():
+        stats['source_bytes'] += entry.get('size', 0)
+        full = PROJECT_ROOT / entry['variants'].get('full', key)
+        if full.exists():
+            stats['derived_bytes'] += full.stat().st_size
+
+    manifest['updated_at'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    _write_manifest(manifest)
+    _manifest_cache.clear()
+    return stats
+
+
+# --- 앱에서 사용하는 조회 API ---
+
+_manifest_cache = {}
+
+
+def load_manifest():
+    """manifest 로드 (파일이 바뀌었을 때만 다시 읽음)"""
+    try:
+        mtime_ns = MANIFEST_PATH.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _manifest_cache.get('mtime_ns') != mtime_ns:
+        # 내용을 먼저 넣어야 다른 스레드가 새 mtime만 보고 빈 항목을 읽지 않음
+        _manifest_cache['images'] = _read_manifest().get('images', {})
+        _manifest_cache['mtime_ns'] = mtime_ns
+    return _manifest_cache['images']
+
+
+def best_variant(path, display_px=None):
+    """
+    표시 크기에 충분한 가장 작은 파생본 경로 반환 (파생본이 없거나 원본이 바뀌었으면 원본 경로)
+
+    Args:
+        path: 원본 이미지 경로
+        display_px: 화면에 표시되는 최대 변 길이 (CSS px). None이면 원본 경로를 그대로 반환
+    """
+    if not display_px:
+        return path
+    try:
+        src = Path(path).resolve()
+        key = src.relative_to(PROJECT_ROOT).as_posix()
+    except (ValueError, OSError, TypeError):
+        return path
+    entry = load_manifest().get(key)
+    if not entry:
+        return path
+    try:
+        if src.stat().st_mtime_ns != entry.get('mtime_ns'):
+            return path  # 원본이 바뀐 뒤 아직 다시 생성되지 않음
+    except OSError:
+        return path
+
+    variants = entry.get('variants', {})
+    chosen = variants.get('full')
+    needed = display_px * DEVICE_PIXEL_RATIO
+    sizes = sorted(int(k) for k in variants if k.isdigit() and int(k) >= needed)
+    if sizes:
+        chosen = variants[str(sizes[0])]
+    if not chosen:
+        return path
+    chosen_path = PROJECT_ROOT / chosen
+    return str(chosen_path) if chosen_path.exists() else path
+
+
+if __name__ == "__main__":
+    force = len(sys.argv) > 1 and sys.argv[1] == "--force"
+    print(f"🪄 이미지 파생본 생성 중: {SOURCE_DIR}")
+    started = time.time()
+    result = build_derivatives(force=force)
+    print(f"   생성: {result['generated']}개, 변경 없음: {result['unchanged']}개, "
+          f"실패: {result['failed']}개, 정리: {result['removed']}개")
+    print(f"   원본 {result['source_bytes'] / 1024 / 1024:.1f} MB → 원본 크기 WebP {result['derived_bytes'] / 1024 / 1024:.1f} MB "
+          f"({time.time() - started:.1f}초)")
+    print(f"   manifest: {MANIFEST_PATH}")
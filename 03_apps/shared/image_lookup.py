@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔎 이미지 조회 인덱스
+이미지 폴더를 os.scandir 한 번으로 훑어 파일 이름 → 경로 조회 딕셔너리를 만들고 디스크에 저장해 둡니다.
+이름으로 이미지를 찾을 때마다 폴더를 다시 나열하거나 전체 파일을 정규식으로 비교하지 않고 딕셔너리 조회 한 번으로 끝납니다.
+
+    - 파일 이름(확장자 제외, 대소문자 무시) → 경로
+    - 정규화 키(NFKC, 대소문자 무시, 공백/기호 제거) → 경로
+    - (기본 이름 키, 스타일) → 경로  예: '002_Cyan Scyther_AS.png' → ('cyanscyther', 'AS')
+    - 캐릭터 ID(에셋 ID, character_ids 참고) → 경로
+
+저장된 인덱스는 스캔한 폴더들의 수정 시각이 하나라도 바뀌면(파일 추가/삭제/이름 변경) 다시 만듭니다.
+같은 이름의 파일이 여러 폴더에 있으면 경로 이름순으로 첫 번째가 우선합니다.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+import unicodedata
+from pathlib import Path
+
+from character_ids import index_by_character_id
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+IMAGE_DIR = PROJECT_ROOT / "04_data" / "images" / "character_art"
+INDEX_CACHE_DIR = PROJECT_ROOT / "04_data" / "cache" / "image_lookup"
+INDEX_VERSION = 1
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
+
+ORDER_PREFIX = re.compile(r'^\d{1,4}_')  # 정리용 번호 (001_이름_NS.png)
+STYLE_SUFFIX = re.compile(r'[\s_]+\(?(AS|ES|NS|Another\s*Style|Extra\s*Style|Manifestation|Alter)\)?$',
+                          re.IGNORECASE)
+STYLE_ALIASES = {'as': 'AS', 'anotherstyle': 'AS', 'es': 'ES', 'extrastyle': 'ES', 'ns': '',
+                 'manifestation': 'MANIFESTATION', 'alter': 'ALTER'}
+
+
+def normalize_key(text):
+    """조회용 이름 키 (NFKC + 대소문자 무시 + 글자/숫자만)"""
+    text = unicodedata.normalize('NFKC', text or '').casefold()
+    return re.sub(r'[\W_]+', '', text)
+
+
+def canonical_style(style):
+    """스타일 표기 통일 ('Another Style' → 'AS', 'NS'/없음 → '')"""
+    return STYLE_ALIASES.get(normalize_key(style), (style or '').strip().upper())
+
+
+def split_style(name):
+    """
+    이름에서 스타일 접미사를 분리 → (기본 이름, 스타일)
+
+    파일 이름의 '_NS' 표시와 이름 자체의 ' AS'가 함께 있으면('Velette AS_NS') 이름 쪽 스타일을 씁니다.
+    """
+    base = ORDER_PREFIX.sub('', (name or '').strip())
+    styles = []
+    while True:
+        match = STYLE_SUFFIX.search(base)
+        if not match or match.start() == 0:
+            break
+        styles.append(canonical_style(match.group(1)))
+        base = base[:match.start()]
+    return base.strip(), next((style for style in styles if style), '')
+
+
+def _scan(root):
+    """root 아래 이미지 파일 (root 기준 POSIX 경로, 이름순)과 폴더별 수정 시각"""
+    files = []
+    dirs = {}
+    pending = ['']
+    while pending:
+        rel_dir = pending.pop()
+        try:
+            dirs[rel_dir] = os.stat(root / rel_dir).st_mtime_ns
+            with os.scandir(root / rel_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.is_dir():
+                        pending.append(rel)
+                    elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                        files.append(rel)
+        except OSError:
+            dirs[rel_dir] = None
+    return sorted(files), dirs
+
+
+class ImageIndex:
+    """
+    이미지 폴더 하나의 조회 인덱스 (get_image_index()로 받아서 사용)
+
+    조회 결과는 모두 절대 경로 문자열이며, 없으면 None입니다.
+    """
+
+    def __init__(self, root, dirs, files, by_stem, by_key, by_name, by_id):
+        self.root = Path(root)
+        self.dirs = dirs
+        self.files = files
+        self.by_stem = by_stem
+        self.by_key = by_key
+        self.by_name = by_name
+        self.by_id = by_id
+
+    @classmethod
+    def build(cls, root):
+        """폴더를 한 번 훑어 인덱스 생성"""
+        files, dirs = _scan(root)
+        by_stem, by_key, by_name = {}, {}, {}
+        for rel in files:
+            stem = os.path.splitext(rel.rsplit('/', 1)[-1])[0]
+            by_stem.setdefault(stem.casefold(), rel)
+            by_key.setdefault(normalize_key(stem), rel)
+            base, style = split_style(stem)
+            by_name.setdefault(f"{normalize_key(base)}|{style}", rel)
+        by_id = {str(char_id): rel for char_id, rel in index_by_character_id(files).items()}
+        return cls(root, dirs, files, by_stem, by_key, by_name, by_id)
+
+    def is_current(self):
+        """스캔한 폴더들의 수정 시각이 그대로인지 (파일 수와 무관하게 폴더 수만큼만 stat)"""
+        for rel_dir, mtime_ns in self.dirs.items():
+            try:
+                current = os.stat(self.root / rel_dir).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime_ns:
+                return False
+        return True
+
+    def __len__(self):
+        return len(self.files)
+
+    def _path(self, rel):
+        return str(self.root / rel) if rel else None
+
+    def stem(self, filename_base):
+        """확장자를 뺀 파일 이름이 정확히 같은 이미지 (대소문자 무시)"""
+        return self._path(self.by_stem.get((filename_base or '').casefold()))
+
+    def get(self, char_id):
+        """캐릭터 ID의 이미지"""
+        return self._path(self.by_id.get(str(char_id))) if char_id is not None else None
+
+    def find(self, name, style=None):
+        """
+        이름(스타일 접미사 포함 가능)에 맞는 이미지
+
+        파일 이름 그대로 → 정규화 키 → (기본 이름, 스타일) → 기본 이름(기본 스타일) 순으로 찾습니다.
+        style을 주면 이름에서 분리한 스타일 대신 사용합니다.
+        """
+        if not name:
+            return None
+        rel = self.by_stem.get(name.casefold()) or self.by_key.get(normalize_key(name))
+        if rel is None:
+            base, name_style = split_style(name)
+            style = name_style if style is None else canonical_style(style)
+            key = normalize_key(base)
+            rel = self.by_name.get(f"{key}|{style}") or self.by_name.get(f"{key}|")
+        return self._path(rel)
+
+    # --- 저장 ---
+
+    def to_dict(self):
+        return {'version': INDEX_VERSION, 'root': str(self.root), 'dirs': self.dirs, 'files': self.files,
+                'by_stem': self.by_stem, 'by_key': self.by_key, 'by_name': self.by_name, 'by_id': self.by_id,
+                'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+
+    @classmethod
+    def from_dict(cls, data, root):
+        if data.get('version') != INDEX_VERSION or data.get('root') != str(root):
+            return None
+        return cls(root, data['dirs'], data['files'], data['by_stem'], data['by_key'], data['by_name'],
+                   data['by_id'])
+
+
+def _cache_path(root):
+    key = hashlib.sha1(str(root).encode('utf-8')).hexdigest()[:16]
+    return INDEX_CACHE_DIR / f"{key}.json"
+
+
+def _load_saved(root):
+    try:
+        with open(_cache_path(root), 'r', encoding='utf-8') as f:
+            index = ImageIndex.from_dict(json.load(f), root)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return index if index is not None and index.is_current() else None
+
+
+def _save(index):
+    path = _cache_path(index.root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️ 이미지 인덱스 저장 실패: {e}")
+
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+def get_image_index(root=IMAGE_DIR):
+    """
+    폴더의 이미지 인덱스 (메모리 → 저장된 파일 → 새 스캔 순, 폴더가 바뀌었으면 다시 스캔)
+
+    호출마다 폴더 수만큼 stat으로 변경 여부만 확인하므로, 반복 조회하는 쪽은 한 번 받아서 재사용하세요.
+    """
+    root = Path(root).resolve()
+    index = _indexes.get(root)
+    if index is not None and index.is_current():
+        return index
+    with _lock:
+        index = _indexes.get(root)
+        if index is None or not index.is_current():
+            index = _load_saved(root)
+            if index is None:
+                index = ImageIndex.build(root)
+                _save(index)
+            _indexes[root] = index
+    return index
+
+
+if __name__ == "__main__":
+    started = time.time()
+    image_index = ImageIndex.build(IMAGE_DIR.resolve())
+    _save(image_index)
+    print(f"🔎 이미지 인덱스 생성: {len(image_index)}개 파일, 폴더 {len(image_index.dirs)}개 "
+          f"({time.time() - started:.2f}초) → {_cache_path(image_index.root)}")
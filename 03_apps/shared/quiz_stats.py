@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📈 퀴즈 통계 저장소 (SQLite, WAL 모드)
+답안 하나마다 이벤트 한 줄을 추가하고, 같은 트랜잭션에서 세션 합계와 퀴즈 유형별/일별 집계를 증분 갱신합니다.
+"유형별 정확도"나 "최고 점수" 조회는 전체 기록을 훑지 않고 집계 테이블/인덱스만 읽습니다.
+여러 Streamlit 세션이 동시에 기록해도 WAL + 잠금 대기로 서로의 기록을 덮어쓰지 않습니다.
+
+기존 04_data/quiz_stats.json은 저장소를 처음 열 때 한 번만 가져옵니다 (원본 파일은 그대로 둠).
+
+사용법:
+    python quiz_stats.py   # 유형별 정확도와 최고 점수 출력
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+STATS_DB_PATH = PROJECT_ROOT / "04_data" / "quiz_stats.sqlite3"
+LEGACY_JSON_PATH = PROJECT_ROOT / "04_data" / "quiz_stats.json"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    ended_at TEXT NOT NULL,
+    score REAL NOT NULL DEFAULT 0,
+    total_questions INTEGER NOT NULL DEFAULT 0,
+    correct_answers INTEGER NOT NULL DEFAULT 0,
+    max_combo INTEGER NOT NULL DEFAULT 0,
+    hints_used INTEGER NOT NULL DEFAULT 0,
+    total_time REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_score ON sessions (score DESC);
+CREATE TABLE IF NOT EXISTS answers (
+    answer_id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    answered_at TEXT NOT NULL,
+    quiz_type TEXT NOT NULL,
+    is_correct INTEGER NOT NULL,
+    time_taken REAL NOT NULL,
+    score REAL NOT NULL,
+    character_id INTEGER,
+    question_seq INTEGER
+);
+CREATE TABLE IF NOT EXISTS category_rollup (
+    quiz_type TEXT PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    total_time REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    day TEXT NOT NULL,
+    quiz_type TEXT NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, quiz_type)
+);
+"""
+
+ROLLUP_STATEMENTS = (
+    """INSERT INTO category_rollup (quiz_type, total, correct, total_time)
+       VALUES (:quiz_type, :total, :correct, :time_taken)
+       ON CONFLICT (quiz_type) DO UPDATE SET
+           total = total + excluded.total,
+           correct = correct + excluded.correct,
+           total_time = total_time + excluded.total_time""",
+    """INSERT INTO daily_rollup (day, quiz_type, total, correct)
+       VALUES (:day, :quiz_type, :total, :correct)
+       ON CONFLICT (day, quiz_type) DO UPDATE SET
+           total = total + excluded.total,
+           correct = correct + excluded.correct""",
+)
+
+
+def _migrate(conn):
+    """이전 버전에서 만든 저장소에 빠진 컬럼/인덱스 추가"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(answers)")}
+    if 'character_id' not in columns:
+        conn.execute("ALTER TABLE answers ADD COLUMN character_id INTEGER")
+    if 'question_seq' not in columns:
+        conn.execute("ALTER TABLE answers ADD COLUMN question_seq INTEGER")
+    # 같은 문제의 답안은 한 번만 기록 (question_seq가 없는 기록은 제외 - NULL은 서로 겹치지 않음)
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS answers_question ON answers (session_id, question_seq)")
+
+
+def _apply_rollups(conn, params):
+    """유형별/일별 집계에 params의 total/correct/time_taken을 더함"""
+    for statement in ROLLUP_STATEMENTS:
+        conn.execute(statement, params)
+
+
+class QuizStatsStore:
+    """
+    퀴즈 통계 저장소
+
+    작업마다 짧은 연결을 열어 쓰므로 여러 스레드/프로세스에서 같은 인스턴스나 같은 파일을 함께 써도 됩니다.
+    """
+
+    def __init__(self, path=STATS_DB_PATH, legacy_json_path=LEGACY_JSON_PATH):
+        self.path = Path(path)
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self.legacy_json_path = legacy_json_path
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.executescript(SCHEMA)
+                    _migrate(conn)
+                    self._import_legacy_json(conn)
+                    self._schema_ready = True
+        return conn
+
+    def _import_legacy_json(self, conn):
+        """기존 JSON 통계의 세션과 유형별 합계를 한 번만 가져옴 (답안 단위 기록은 없음)"""
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_json_imported'").fetchone():
+            return
+        try:
+            with open(self.legacy_json_path, 'r', encoding='utf-8') as f:
+                sessions = json.load(f).get('sessions', [])
+        except (OSError, ValueError, TypeError):
+            sessions = []
+        with conn:
+            for i, session in enumerate(sessions):
+                date = str(session.get('date', ''))
+                conn.execute(
+                    "INSERT OR IGNORE INTO sessions (session_id, started_at, ended_at, score, total_questions, "
+                    "correct_answers, max_combo, hints_used, total_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (f"legacy-{i}", date, date, session.get('score', 0), session.get('total_questions', 0),
+                     session.get('correct_answers', 0), session.get('max_combo', 0),
+                     session.get('hints_used', 0), session.get('total_time', 0)))
+                for quiz_type, counts in session.get('category_stats', {}).items():
+                    _apply_rollups(conn, {'quiz_type': quiz_type, 'day': date[:10], 'time_taken': 0,
+                                          'total': counts.get('total', 0), 'correct': counts.get('correct', 0)})
+            conn.execute("INSERT INTO meta (key, value) VALUES ('legacy_json_imported', ?)",
+                         (datetime.now().isoformat(timespec='seconds'),))
+
+    # --- 기록 ---
+
+    def record_answer(self, session_id, quiz_type, is_correct, time_taken=0.0, score=0.0,
+                      combo=0, hints_used=0, character_id=None, question_seq=None):
+        """
+        답안 이벤트 추가 + 세션 합계/유형별/일별 집계 갱신 (한 트랜잭션)
+
+        character_id: 문제 캐릭터의 캐릭터 ID (character_ids 참고, 캐릭터별 집계용)
+        question_seq: 세션 안의 문제 번호. 같은 (세션, 문제 번호)가 이미 기록되어 있으면 아무것도 바꾸지 않음
+
+        Returns:
+            새로 기록했으면 True, 이미 기록된 문제라 건너뛰었으면 False
+        """
+        now = datetime.now()
+        answered_at = now.isoformat(timespec='seconds')
+        params = {
+            'session_id': session_id, 'answered_at': answered_at, 'day': answered_at[:10],
+            'quiz_type': quiz_type, 'total': 1, 'correct': int(bool(is_correct)),
+            'time_taken': float(time_taken), 'score': float(score) if is_correct else 0.0,
+            'combo': int(combo), 'hints_used': int(hints_used),
+            'character_id': int(character_id) if character_id is not None else None,
+            'question_seq': int(question_seq) if question_seq is not None else None,
+        }
+        conn = self._connect()
+        try:
+            with conn:
+                inserted = conn.execute(
+                    "INSERT OR IGNORE INTO answers (session_id, answered_at, quiz_type, is_correct, time_taken, "
+                    "score, character_id, question_seq) VALUES (:session_id, :answered_at, :quiz_type, :correct, "
+                    ":time_taken, :score, :character_id, :question_seq)", params).rowcount
+                if not inserted:
+                    return False
+                conn.execute(
+                    "INSERT INTO sessions (session_id, started_at, ended_at, score, total_questions, correct_answers, "
+                    "max_combo, hints_used, total_time) VALUES (:session_id, :answered_at, :answered_at, :score, 1, "
+                    ":correct, :combo, :hints_used, :time_taken) "
+                    "ON CONFLICT (session_id) DO UPDATE SET ended_at = excluded.ended_at, "
+                    "score = score + excluded.score, total_questions = total_questions + 1, "
+                    "correct_answers = correct_answers + excluded.correct_answers, "
+                    "max_combo = MAX(max_combo, excluded.max_combo), hints_used = excluded.hints_used, "
+                    "total_time = total_time + excluded.total_time", params)
+                _apply_rollups(conn, params)
+        finally:
+            conn.close()
+        return True
+
+    # --- 조회 (집계 테이블/인덱스만 읽음) ---
+
+    def accuracy_by_type(self):
+        """{퀴즈 유형: {'total', 'correct', 'accuracy', 'avg_time'}}"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT quiz_type, total, correct, total_time FROM category_rollup "
+                                "ORDER BY quiz_type").fetchall()
+        finally:
+            conn.close()
+        return {row['quiz_type']: {
+            'total': row['total'],
+            'correct': row['correct'],
+            'accuracy': row['correct'] / row['total'] if row['total'] else 0.0,
+            'avg_time': row['total_time'] / row['total'] if row['total'] else 0.0,
+        } for row in rows}
+
+    def top_scores(self, limit=5):
+        """점수가 높은 세션 목록"""
+        conn = self._connect()
+        try:
+            rows = conn.execute("SELECT session_id, ended_at, score, total_questions, correct_answers, max_combo "
+                                "FROM sessions ORDER BY score DESC LIMIT ?", (limit,)).fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+    def daily(self, days=7):
+        """최근 days일의 일별 문제 수/정답 수 {날짜: {'total', 'correct'}}"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT day, SUM(total) AS total, SUM(correct) AS correct FROM daily_rollup "
+                "WHERE day IN (SELECT DISTINCT day FROM daily_rollup ORDER BY day DESC LIMIT ?) "
+                "GROUP BY day ORDER BY day", (days,)).fetchall()
+        finally:
+            conn.close()
+        return {row['day']: {'total': row['total'], 'correct': row['correct']} for row in rows}
+
+
+if __name__ == "__main__":
+    store = QuizStatsStore()
+    print(f"📈 퀴즈 통계: {store.path}")
+    for quiz_type, stats in store.accuracy_by_type().items():
+        print(f"   {quiz_type}: {stats['correct']}/{stats['total']} ({stats['accuracy'] * 100:.1f}%)")
+    for rank, session in enumerate(store.top_scores(), 1):
+        print(f"   {rank}. {session['score']:.0f}점 ({session['correct_answers']}/{session['total_questions']}, "
+              f"{session['ended_at']})")
@@ -14,6 +14,10 @@ import unicodedata
 from pathlib import Path
 import shutil
 
+# 이미지 저장소 (이름 변경 시 이름→해시 인덱스 갱신)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "01_scraping"))
+from image_store import get_image_store
+
 # 한글 매핑 로드
 def load_korean_mapping():
     """Matching_names.csv에서 한글 매핑 로드"""
@@ -161,15 +165,17 @@ def rename_images_to_korean():
     # 실제 변경 실행
     print("\n파일 이름 변경 중...")
     success_count = 0
+    store = get_image_store()
     
     for plan in rename_plan:
         try:
             if plan['old_path'] != plan['new_path']:
-                os.rename(plan['old_path'], plan['new_path'])
+                store.rename(plan['old_path'], plan['new_path'])
                 success_count += 1
                 print(f"✓ {plan['old_name']} -> {plan['new_name']}")
         except Exception as e:
             print(f"✗ 실패 {plan['old_name']}: {e}")
+    store.flush()
     
     # 결과 CSV 생성
     results = []
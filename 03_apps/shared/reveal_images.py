@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+👤 실루엣 퀴즈용 단계별 공개 이미지 생성기
+캐릭터 아이콘마다 실루엣(알파 마스크를 어두운 색으로 채움)과 점점 선명해지는 공개 단계 이미지(모자이크/블러)를
+미리 만들어 둡니다. 퀴즈는 원본 대신 현재 단계 이미지만 보내므로 페이지에서 정답 이미지를 읽을 수 없고,
+공개는 다음 단계 파일로 바꾸기만 하면 됩니다.
+
+출력 파일 이름은 원본 내용 해시 기반이라 캐릭터 이름이 드러나지 않고, 같은 이미지는 한 번만 생성됩니다.
+원본이 바뀌었는지는 수정 시각/크기 → 해시 순으로 확인하며, 렌더링 설정(REVEAL_STAGES, MAX_PX,
+SILHOUETTE_COLOR, WebP 품질)을 바꾸거나 --force로 실행하면 기존 파일을 덮어써 전체를 다시 생성합니다.
+
+사용법:
+    python reveal_images.py          # 변경된 아이콘만 생성
+    python reveal_images.py --force  # 전체 다시 생성
+"""
+
+import os
+import sys
+import json
+import time
+from pathlib import Path
+
+from image_derivatives import WEBP_QUALITY, WEBP_METHOD, file_hash
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+SOURCE_DIR = PROJECT_ROOT / "04_data" / "images" / "character_art" / "icons"
+REVEAL_DIR = PROJECT_ROOT / "04_data" / "images" / "reveal"
+MANIFEST_PATH = REVEAL_DIR / "manifest.json"
+SOURCE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
+
+# 공개 단계 (처음 → 마지막, 그다음은 원본): (종류, 값)
+#   silhouette: 알파 마스크 실루엣, pixelate: 긴 변을 값 개수의 블록으로 모자이크, blur: 가우시안 블러 반지름(px)
+REVEAL_STAGES = (
+    ('silhouette', 0),
+    ('pixelate', 8),
+    ('pixelate', 16),
+    ('blur', 2),
+)
+MAX_PX = 400  # 퀴즈 표시 크기(200px)의 2배, 더 작은 원본은 확대하지 않음
+SILHOUETTE_COLOR = (20, 24, 32)
+
+
+def _stage_name(stage):
+    kind, value = stage
+    return kind if kind == 'silhouette' else f"{kind}{value}"
+
+
+def render_stage(img, stage):
+    """RGBA 이미지 하나의 공개 단계 이미지"""
+    from PIL import Image, ImageFilter
+
+    kind, value = stage
+    if kind == 'silhouette':
+        silhouette = Image.new('RGBA', img.size, SILHOUETTE_COLOR + (255,))
+        silhouette.putalpha(img.getchannel('A'))
+        return silhouette
+    if kind == 'pixelate':
+        scale = value / max(img.size)
+        small = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))), Image.BILINEAR)
+        return small.resize(img.size, Image.NEAREST)
+    if kind == 'blur':
+        return img.filter(ImageFilter.GaussianBlur(value))
+    raise ValueError(f"알 수 없는 공개 단계: {kind}")
+
+
+def _render_settings():
+    """결과 이미지에 영향을 주는 설정 (manifest에 기록해 바뀌면 전체 다시 생성)"""
+    return {'stages': [list(stage) for stage in REVEAL_STAGES], 'max_px': MAX_PX,
+            'silhouette_color': list(SILHOUETTE_COLOR), 'webp_quality': WEBP_QUALITY, 'webp_method': WEBP_METHOD}
+
+
+def make_stages(src, digest, force=False):
+    """
+    아이콘 하나의 공개 단계 이미지 생성 (force면 이미 있는 파일도 다시 렌더링)
+
+    Returns:
+        단계 순서대로 프로젝트 기준 상대 경로 목록
+    """
+    from PIL import Image
+
+    paths = []
+    with Image.open(src) as img:
+        img = img.convert('RGBA')
+        img.thumbnail((MAX_PX, MAX_PX), Image.LANCZOS)
+        for stage in REVEAL_STAGES:
+            dest = REVEAL_DIR / digest[:2] / f"{digest[:20]}_{_stage_name(stage)}.webp"
+            if force or not dest.exists():
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = dest.with_name(f".{dest.name}.tmp")
+                render_stage(img, stage).save(tmp_path, 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+                os.replace(tmp_path, dest)
+            paths.append(dest.relative_to(PROJECT_ROOT).as_posix())
+    return paths
+
+
+def _read_manifest():
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'images': {}}
+
+
+def _write_manifest(manifest):
+    REVEAL_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def build_reveal_images(source_dir=SOURCE_DIR, force=False):
+    """변경된 아이콘의 공개 단계 이미지를 생성하고 manifest 갱신 (처리 통계 반환)"""
+    manifest = _read_manifest()
+    stages = [list(stage) for stage in REVEAL_STAGES]
+    settings = _render_settings()
+    if manifest.get('settings') != settings:
+        force = True  # 렌더링 설정이 바뀌면 기존 파일을 덮어써 전체 다시 생성
+    images = {} if force else manifest.get('images', {})
+    stats = {'generated': 0, 'unchanged': 0, 'failed': 0, 'removed': 0}
+    seen = set()
+
+    for dirpath, _dirnames, filenames in os.walk(source_dir):
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[1].lower() not in SOURCE_EXTENSIONS:
+                continue
+            src = Path(dirpath) / filename
+            key = src.relative_to(PROJECT_ROOT).as_posix()
+            seen.add(key)
+            stat = src.stat()
+            entry = images.get(key)
+
+            if entry and all((PROJECT_ROOT / p).exists() for p in entry.get('stages', [])):
+                if entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+                    stats['unchanged'] += 1
+                    continue
+                digest = file_hash(src)
+                if entry.get('sha256') == digest:
+                    entry['mtime_ns'] = stat.st_mtime_ns
+                    entry['size'] = stat.st_size
+                    stats['unchanged'] += 1
+                    continue
+            else:
+                digest = file_hash(src)
+
+            try:
+                paths = make_stages(src, digest, force=force)
+            except Exception as e:
+                print(f"  ✗ {key}: {e}")
+                stats['failed'] += 1
+                continue
+            images[key] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest, 'stages': paths}
+            stats['generated'] += 1
+
+    for key in [k for k in images if k not in seen]:
+        del images[key]
+        stats['removed'] += 1
+
+    # 어떤 아이콘도 참조하지 않는 단계 파일 정리 (원본 변경/삭제, 단계 설정 변경)
+    referenced = {p for entry in images.values() for p in entry['stages']}
+    if REVEAL_DIR.exists():
+        for path in REVEAL_DIR.glob("*/*.webp"):
+            if path.relative_to(PROJECT_ROOT).as_posix() not in referenced:
+                path.unlink()
+
+    manifest = {'stages': stages, 'settings': settings, 'images': images, 'updated_at': time.strftime('%Y-%m-%d %H:%M:%S')}
+    _write_manifest(manifest)
+    _manifest_cache.clear()
+    return stats
+
+
+# --- 앱에서 사용하는 조회 API ---
+
+_manifest_cache = {}
+
+
+def load_manifest():
+    """manifest 로드 (파일이 바뀌었을 때만 다시 읽음)"""
+    try:
+        mtime_ns = MANIFEST_PATH.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _manifest_cache.get('mtime_ns') != mtime_ns:
+        # 내용을 먼저 넣어야 다른 스레드가 새 mtime만 보고 빈 항목을 읽지 않음
+        _manifest_cache['images'] = _read_manifest().get('images', {})
+        _manifest_cache['mtime_ns'] = mtime_ns
+    return _manifest_cache['images']
+
+
+def reveal_stage_paths(path):
+    """
+    아이콘의 공개 단계 이미지 경로 목록 (처음 → 마지막)
+
+    아직 생성되지 않았거나 원본이 바뀐 뒤 다시 생성되지 않았으면 빈 목록을 반환합니다.
+    """
+    if not path:
+        return []
+    try:
+        src = Path(path)
+        src = (src if src.is_absolute() else PROJECT_ROOT / src).resolve()
+        entry = load_manifest().get(src.relative_to(PROJECT_ROOT).as_posix())
+        if not entry or src.stat().st_mtime_ns != entry.get('mtime_ns'):
+            return []
+    except (ValueError, OSError, TypeError):
+        return []
+    paths = [PROJECT_ROOT / p for p in entry.get('stages', [])]
+    return [str(p) for p in paths] if all(p.exists() for p in paths) else []
+
+
+if __name__ == "__main__":
+    force = len(sys.argv) > 1 and sys.argv[1] == "--force"
+    print(f"👤 공개 단계 이미지 생성 중: {SOURCE_DIR}")
+    started = time.time()
+    result = build_reveal_images(force=force)
+    print(f"   생성: {result['generated']}개, 변경 없음: {result['unchanged']}개, "
+          f"실패: {result['failed']}개, 정리: {result['removed']}개 ({time.time() - started:.1f}초)")
+    print(f"   manifest: {MANIFEST_PATH}")
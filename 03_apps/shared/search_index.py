@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔤 캐릭터 이름/퍼스널리티 검색 인덱스
+한글 이름·영문 이름·퍼스널리티 태그를 로드 시점에 역색인(정렬된 키 + 접두사 이진 탐색)으로 만들어
+입력할 때마다 전체 행을 훑지 않고 순위가 매겨진 결과를 돌려줍니다.
+
+키 종류:
+    - 자모 분해 키: '레이브'처럼 조합 중인 글자나 영문 일부 입력도 접두사로 일치
+    - 초성 키: 'ㄹㅇㅂ' → 레이븐
+"""
+
+import re
+import bisect
+
+import numpy as np
+
+from filter_index import split_values
+
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ",
+             "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+JONGSEONG = ["", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+             "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 입력 중 낱자로 들어오는 겹모음/겹받침도 분해 키와 같은 형태로 맞춤
+COMPOUND_JAMO = {"ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+                 "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+                 "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ"}
+CHOSEONG_SET = set(CHOSEONG)
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# 일치 종류별 점수 (필드 가중치와 곱해 행 점수로 사용, 행마다 최고 점수만 유지)
+SCORE_EXACT = 10
+SCORE_PREFIX = 8
+SCORE_WORD_PREFIX = 6
+SCORE_SUBSTRING = 3
+SCORE_TYPED_BONUS = 1  # 자모 단위가 아니라 입력한 글자 그대로 접두사일 때 ('에' → 엘실보다 에바 우선)
+
+
+def fold(text):
+    return str(text).strip().casefold()
+
+
+def decompose_jamo(text):
+    """한글 음절을 자모로 분해 ('레이븐' → 'ㄹㅔㅇㅣㅂㅡㄴ'), 그 외 문자는 그대로"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            out.append(CHOSEONG[offset // 588])
+            out.append(JUNGSEONG[(offset % 588) // 28])
+            out.append(JONGSEONG[offset % 28])
+        else:
+            out.append(COMPOUND_JAMO.get(ch, ch))
+    return "".join(out)
+
+
+def hangul_initials(text):
+    """한글 음절의 초성만 추출 ('레이븐' → 'ㄹㅇㅂ'), 한글이 아닌 문자는 버림"""
+    return "".join(CHOSEONG[(ord(ch) - HANGUL_BASE) // 588]
+                   for ch in text if HANGUL_BASE <= ord(ch) <= HANGUL_LAST)
+
+
+def is_initials_query(query):
+    compact = query.replace(" ", "")
+    return bool(compact) and all(ch in CHOSEONG_SET for ch in compact)
+
+
+class _PrefixTable:
+    """정렬된 키 목록 + 키별 (행, 점수) 게시 목록"""
+
+    def __init__(self):
+        self.postings = {}
+        self.originals = {}  # 키 → 분해 전 텍스트
+
+    def add(self, key, row, score, original=None):
+        if not key:
+            return
+        self.originals.setdefault(key, original if original is not None else key)
+        rows = self.postings.setdefault(key, {})
+        if rows.get(row, 0) < score:
+            rows[row] = score
+
+    def freeze(self):
+        self.keys = sorted(self.postings)
+
+    def prefix(self, query):
+        """query로 시작하는 키들의 (키, 게시 목록)"""
+        start = bisect.bisect_left(self.keys, query)
+        for key in self.keys[start:]:
+            if not key.startswith(query):
+                break
+            yield key, self.postings[key]
+
+    def substring(self, query):
+        for key in self.keys:
+            if query in key:
+                yield key, self.postings[key]
+
+
+class SearchIndex:
+    """
+    이름/퍼스널리티 검색 인덱스
+
+    Args:
+        df: 캐릭터 데이터프레임 (결과 위치는 df의 행 순서를 따름)
+        fields: {필드 이름: (컬럼 이름, 여러 값 여부, 가중치)}
+    """
+
+    def __init__(self, df, fields):
+        self.size = len(df)
+        self.values = _PrefixTable()    # 값 전체 (자모 분해)
+        self.words = _PrefixTable()     # 값 안의 단어 (자모 분해)
+        self.initials = _PrefixTable()  # 값/단어의 초성
+        for field, (column, multi_valued, weight) in fields.items():
+            if column not in df.columns:
+                continue
+            for pos, cell in enumerate(df[column].tolist()):
+                values = split_values(cell) if multi_valued else ([cell] if isinstance(cell, str) else [])
+                for value in values:
+                    self._add_value(fold(value), pos, weight)
+        for table in (self.values, self.words, self.initials):
+            table.freeze()
+
+    def _add_value(self, value, pos, weight):
+        if not value:
+            return
+        self.values.add(decompose_jamo(value), pos, weight, value)
+        self.initials.add(hangul_initials(value), pos, weight)
+        for word in TOKEN_PATTERN.findall(value):
+            self.words.add(decompose_jamo(word), pos, weight, word)
+            self.initials.add(hangul_initials(word), pos, weight)
+
+    @staticmethod
+    def _collect(scores, matches, score, typed=None, table=None):
+        for key, rows in matches:
+            bonus = SCORE_TYPED_BONUS if typed and table.originals[key].startswith(typed) else 0
+            for row, weight in rows.items():
+                value = weight * score + bonus
+                if scores.get(row, 0) < value:
+                    scores[row] = value
+
+    def search(self, query):
+        """
+        순위가 매겨진 검색 결과
+
+        Returns:
+            [(행 위치, 점수), ...] 점수 내림차순 (같으면 원래 순서)
+        """
+        query = fold(query)
+        if not query:
+            return []
+        scores = {}
+        if is_initials_query(query):
+            key = query.replace(" ", "")
+            self._collect(scores, self.initials.substring(key), SCORE_SUBSTRING)
+            self._collect(scores, self.initials.prefix(key), SCORE_WORD_PREFIX)
+        else:
+            key = decompose_jamo(query)
+            self._collect(scores, self.values.substring(key), SCORE_SUBSTRING)
+            self._collect(scores, self.words.prefix(key), SCORE_WORD_PREFIX, query, self.words)
+            self._collect(scores, self.values.prefix(key), SCORE_PREFIX, query, self.values)
+            self._collect(scores, [(key, self.values.postings.get(key, {}))], SCORE_EXACT)
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def mask(self, query):
+        """검색어와 일치하는 행의 불리언 마스크 (검색어가 비어 있으면 전체)"""
+        if not fold(query):
+            return np.ones(self.size, dtype=bool)
+        mask = np.zeros(self.size, dtype=bool)
+        rows = [row for row, _score in self.search(query)]
+        mask[rows] = True
+        return mask
@@ -14,6 +14,9 @@ import re
 import unicodedata
 from pathlib import Path
 
+from character_ids import ID_COLUMN, character_id, parse_character_id
+from image_lookup import get_image_index
+
 # 경로 설정
 BASE_DIR = Path(__file__).parent.resolve()
 IMAGE_DIR = BASE_DIR / "character_art"
@@ -70,31 +73,14 @@ def sanitize_filename(name):
 
 # 이미지 파일 검색
 def find_image_file(base_name, style_suffix=""):
-    """이미지 파일 검색 (대소문자 무시)"""
-    if not IMAGE_DIR.exists():
-        return None
-    
-    # 파일명 생성
+    """이미지 파일 검색 (파일 이름 대소문자 무시, 이미지 인덱스 조회)"""
     filename_base = sanitize_filename(base_name + style_suffix)
-    
-    # 확장자 목록
-    extensions = ['.png', '.jpg', '.jpeg', '.gif', '.webp']
-    
-    # 정확한 이름으로 검색
-    for ext in extensions:
-        target_file = f"{filename_base}{ext}"
-        target_path = IMAGE_DIR / target_file
-        if target_path.exists():
-            return str(target_path)
-    
-    # 대소문자 무시하고 검색
-    filename_base_lower = filename_base.lower()
-    for file in IMAGE_DIR.iterdir():
-        if file.is_file() and file.suffix.lower() in extensions:
-            if file.stem.lower() == filename_base_lower:
-                return str(file)
-    
-    return None
+    return get_image_index(IMAGE_DIR).stem(filename_base)
+
+# 캐릭터 ID로 이미지 검색
+def find_image_by_id(char_id):
+    """캐릭터 ID(에셋 ID 기반)에 해당하는 이미지 파일 (이름 표기가 달라도 찾음)"""
+    return get_image_index(IMAGE_DIR).get(char_id)
 
 # 통합 데이터 생성
 def create_unified_data():
@@ -134,11 +120,17 @@ def create_unified_data():
         if not kor_name or kor_name == eng_name:
             kor_name = korean_mapping.get(base_name.lower(), base_name) + style_suffix
         
-        # 이미지 파일 검색
-        image_path = find_image_file(base_name, style_suffix)
+        # 캐릭터 ID (CSV에 없으면 기존 이미지 경로의 에셋 ID → 영문명으로 생성)
+        char_id = parse_character_id(row.get('character_id'))
+        if char_id is None:
+            char_id = character_id(str(row.get('image_path', '')), eng_name)
+        
+        # 이미지 파일 검색 (캐릭터 ID → 이름 순)
+        image_path = find_image_by_id(char_id) or find_image_file(base_name, style_suffix)
         
         # 결과 추가
         results.append({
+            ID_COLUMN: char_id,
             '캐릭터명': kor_name,
             '영문명': eng_name,
             '캐릭터아이콘경로': image_path or '',
@@ -11,7 +11,7 @@ import re
 import requests
 import time
 import mimetypes
-import shutil
+import sys
 from pathlib import Path
 from urllib.parse import urljoin, unquote, parse_qs, urlparse
 from bs4 import BeautifulSoup
@@ -26,6 +26,17 @@ IMAGE_DIR = PROJECT_ROOT / "04_data" / "images" / "character_art"
 BASE_URL = "https://anothereden.wiki"
 TARGET_URL = "https://anothereden.wiki/w/Characters"
 
+# 공용 HTTP 요청 레이어 (커넥션 풀 + 재시도)
+sys.path.insert(0, str(PROJECT_ROOT / "01_scraping"))
+from http_fetcher import get_fetcher
+from image_store import get_image_store
+
+# 정규 데이터셋 (앱이 우선 사용하는 Parquet)
+sys.path.insert(0, str(PROJECT_ROOT / "03_apps" / "shared"))
+from eden_dataset import build_dataset, DATASET_PATH
+from image_assets import build_image_assets
+from character_ids import assign_character_ids, parse_character_id
+
 # 무기/속성 번역 매핑 추가
 WEAPON_TRANSLATION = {
     'Sword': '검',
@@ -86,7 +97,7 @@ def download_image(image_url, subfolder=""):
         base_name, ext = os.path.splitext(image_name)
         if not ext or len(ext) > 5:
             try:
-                head_resp = requests.head(full_image_url, timeout=3, allow_redirects=True)
+                head_resp = get_fetcher().head(full_image_url, timeout=3)
                 head_resp.raise_for_status()
                 content_type = head_resp.headers.get('Content-Type')
                 if content_type:
@@ -106,11 +117,10 @@ def download_image(image_url, subfolder=""):
         if os.path.exists(save_path) and os.path.getsize(save_path) > 0:
             return save_path
 
-        img_response = requests.get(full_image_url, stream=True, timeout=10)
+        img_response = get_fetcher().get(full_image_url, timeout=10)
         img_response.raise_for_status()
-        with open(save_path, 'wb') as f:
-            for chunk in img_response.iter_content(8192):
-                f.write(chunk)
+        # 같은 바이트는 이미지 저장소의 blob 하나를 공유
+        get_image_store().put_bytes(img_response.content, save_path)
         time.sleep(0.05) 
         return save_path
     except Exception as e:
@@ -157,7 +167,8 @@ def organize_images(character_data, output_dir):
                 final_organized_filename = f"{index+1:03d}_{sanitized_filename_base}{extension}"
                 
                 destination_path = os.path.join(target_dir, final_organized_filename)
-                shutil.copy2(char_data["icon_path"], destination_path)
+                # 복사 대신 저장소 blob에 연결 (정리용 번호 사본은 추가 용량을 차지하지 않음)
+                get_image_store().put_file(char_data["icon_path"], destination_path)
                 
                 if index % 50 == 0:
                     print(f"   이미지 정리 진행률: {index+1}/{len(character_data)}")
@@ -173,6 +184,7 @@ def organize_images(character_data, output_dir):
     print("   가나다순 정리 중...")
     for idx, data in enumerate(sorted_by_name):
         copy_and_rename_image(data, idx, by_name_dir)
+    get_image_store().flush()
         
     print(f"✅ 이미지 정리 완료: {organized_base_dir}")
     return organized_base_dir
@@ -426,7 +438,7 @@ def scrape_character_table():
     
     headers_ua = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
     try:
-        response = requests.get(TARGET_URL, headers=headers_ua, timeout=15)
+        response = get_fetcher().get(TARGET_URL, headers=headers_ua, timeout=15)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         print(f"Error fetching page: {e}")
@@ -526,7 +538,12 @@ def scrape_character_table():
     return character_data
 
 def load_personality_data():
-    """퍼스널리티 데이터 로드"""
+    """
+    퍼스널리티 데이터 로드
+
+    Returns:
+        {영문명: [퍼스널리티, ...]} + Character_ID 컬럼이 있으면 {캐릭터 ID: [...]} 항목도 함께
+    """
     personality_file = Path("character_personalities.csv")
     if not personality_file.exists():
         print("❌ character_personalities.csv 파일이 없습니다")
@@ -540,6 +557,9 @@ def load_personality_data():
             eng_name = row['English_Name']
             personalities = row['Personalities_List'].split('|')
             personality_data[eng_name] = personalities
+            char_id = parse_character_id(row.get('Character_ID'))
+            if char_id is not None:
+                personality_data[char_id] = personalities
         
         print(f"✅ 퍼스널리티 데이터 로드: {len(personality_data)}명")
         return personality_data
@@ -707,14 +727,17 @@ def create_character_data():
     unified_data = []
     
     print("🔄 데이터 통합 시작...")
-    for char_data in table_data:
+    # 캐릭터 ID (아이콘 에셋 ID 기반) - 퍼스널리티 조인과 앱의 캐릭터 식별에 사용
+    char_ids = assign_character_ids([char_data['icon_filename'] for char_data in table_data],
+                                    [char_data['name'] for char_data in table_data])
+    for char_data, char_id in zip(table_data, char_ids):
         eng_name = char_data['name']
         
         # 한글 이름 변환 (매핑이 있으면 사용, 없으면 영어 이름 그대로)
         korean_name = name_mapping.get(eng_name, eng_name)
         
-        # 퍼스널리티 데이터 가져오기
-        personalities = personality_data.get(eng_name, [])
+        # 퍼스널리티 데이터 가져오기 (캐릭터 ID → 영문명 순)
+        personalities = personality_data.get(char_id) or personality_data.get(eng_name, [])
         
         # 속성과 무기 추출
         elements, weapons = extract_elements_and_weapons(personalities)
@@ -740,6 +763,7 @@ def create_character_data():
         
         # 통합 데이터 행 생성
         unified_row = {
+            '캐릭터ID': char_id,
             '캐릭터명': korean_name,
             'English_Name': eng_name,
             '캐릭터아이콘경로': char_data['icon_path'],
@@ -765,6 +789,16 @@ def create_character_data():
     unified_csv_path = CSV_DIR / "eden_unified_data.csv"
     df.to_csv(unified_csv_path, index=False, encoding='utf-8-sig')
     print(f"✅ 통합 CSV 생성 완료: {unified_csv_path}")
+
+    # 1-1. 정규 데이터셋 (eden_characters.parquet) - 앱에서 우선 사용
+    try:
+        build_dataset(unified_csv_path)
+        print(f"✅ 정규 데이터셋 생성 완료: {DATASET_PATH}")
+    except ImportError:
+        print("⚠️ pyarrow가 설치되지 않아 정규 데이터셋(Parquet)을 건너뜁니다. 앱은 CSV를 사용합니다.")
+
+    # 1-2. 앱용 이미지 산출물 (파생본, 아이콘 아틀라스, 실루엣 공개 단계) - git에서 제외되므로 빌드마다 갱신
+    build_image_assets()
     
     # 2. 퀴즈용 데이터 (eden_quiz_data.csv) - 앱에서 우선 사용
     quiz_csv_path = CSV_DIR / "eden_quiz_data.csv"
@@ -787,6 +821,7 @@ def create_character_data():
     organized_dir = organize_images(table_data, str(CSV_DIR))
     
     print(f"📊 처리된 캐릭터: {len(unified_data)}개")
+    get_fetcher().stats.print_report()
     
     # 통계 출력
     print("\n📈 데이터 통계:")
@@ -815,7 +850,7 @@ def create_character_data():
         print(f"      퍼스널리티: {char['퍼스널리티리스트'][:50]}...")
         print()
     
-    return [unified_csv_path, quiz_csv_path, roulette_csv_path, excel_path, roulette_from_excel_path, organized_dir]
+    return [unified_csv_path, DATASET_PATH, quiz_csv_path, roulette_csv_path, excel_path, roulette_from_excel_path, organized_dir]
 
 def main():
     """메인 실행 함수"""
@@ -827,6 +862,7 @@ def main():
     
     # 통합 데이터 생성
     csv_paths = create_character_data()
+    get_image_store().flush()
     
     if csv_paths:
         print("\n🎉 완전한 통합 데이터 생성 완료!")
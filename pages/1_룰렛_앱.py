@@ -10,8 +10,7 @@ import random
 import os
 import re
 import html
-import base64
-import unicodedata
+import sys
 import uuid
 from pathlib import Path
 import streamlit.components.v1 as components
@@ -24,6 +23,17 @@ DATA_DIR = PROJECT_ROOT / "04_data"
 CSV_DIR = DATA_DIR / "csv"
 IMAGE_DIR = DATA_DIR / "images" / "character_art"
 
+# 공용 아이콘 캐시 (메모리 LRU + 디스크, 앱 간 공유)
+sys.path.insert(0, str(PROJECT_ROOT / "03_apps" / "shared"))
+from icon_cache import icon_src, icon_to_base64
+from icon_sprites import sprite_css, sprite_html, INDEX_PATH as SPRITE_INDEX_PATH
+from image_derivatives import MANIFEST_PATH as DERIVATIVE_MANIFEST_PATH
+from filter_index import FilterIndex
+from search_index import SearchIndex
+from eden_dataset import DATASET_PATH
+from character_repository import get_character_repository
+from character_ids import ID_COLUMN
+
 # 레거시 스타일 강화: 더 나은 룰렛 UI/UX
 st.markdown("""
 <style>
@@ -187,6 +197,10 @@ st.markdown("""
 # 전역 디버그 로거 및 안전 아이콘 변환 헬퍼
 # ─────────────────────────────────────────────
 
+# 아이콘이 없을 때 표시할 1x1 투명 GIF
+PLACEHOLDER_ICON_URI = "data:image/gif;base64,R0lGODlhEAAQAIABAP///wAAACH5BAEKAAEALAAAAAAQABAAAAIijI+py+0Po5yUFQA7"
+CARDS_PER_PAGE = 24  # 카드 그리드 한 페이지 (한 줄 4장 × 6줄)
+
 def log_debug(message: str):
     """디버그 모드 시 session_state 에 로그를 누적 저장."""
     if "debug_logs" not in st.session_state:
@@ -194,74 +208,35 @@ def log_debug(message: str):
     st.session_state["debug_logs"].append(message)
 
 
-def safe_icon_to_data_uri(path: any) -> str:
-    """아이콘 경로를 data URI로 안전하게 변환합니다. NaN 값을 포함한 모든 입력을 처리합니다."""
-    placeholder = "data:image/gif;base64,R0lGODlhEAAQAIABAP///wAAACH5BAEKAAEALAAAAAAQABAAAAIijI+py+0Po5yUFQA7"
-
-    # 1. NaN 또는 None 값인지 확인
-    if pd.isna(path):
-        log_debug("[EmptyVal] icon path is NaN or None.")
-        return placeholder
-
-    # 2. 문자열로 변환
-    path_str = str(path)
-
-    # 3. 경로 정규화 (공백 제거, 유니코드 정규화 등)
-    try:
-        normalized_path = unicodedata.normalize("NFKC", path_str)
-        normalized_path = normalized_path.replace("\\", "/").strip().lstrip("\ufeff").replace("\u00A0", "")
-    except TypeError:
-        # 혹시 모를 타입 오류 발생 시 안전하게 처리
-        log_debug(f"[TypeError] Normalization failed for path: {path_str}")
-        return placeholder
+def safe_icon_to_data_uri(path: any, display_px: int = None) -> str:
+    """
+    아이콘 경로를 <img src> 값으로 안전하게 변환합니다. NaN 값을 포함한 모든 입력을 처리합니다.
+    경로는 데이터 로드 시 프로젝트 기준 POSIX 경로로 정리되어 있으므로 여기서는 조회만 합니다.
+    정적 파일 서빙이 켜져 있으면 app/static URL을, 아니면 data URI를 반환합니다.
+    display_px(화면 표시 크기)를 주면 파생본 manifest에서 그 크기에 맞는 가장 작은 이미지를 사용합니다.
+    """
+    placeholder = PLACEHOLDER_ICON_URI
 
-    # 4. 정규화 후 경로가 비어있는지 확인
-    if not normalized_path:
-        log_debug("[EmptyVal] icon path is empty after normalization.")
+    # 1. NaN, None 또는 빈 값 (데이터 로드 시 파일을 찾지 못한 경로도 빈 값)
+    if pd.isna(path) or not str(path):
+        log_debug("[EmptyVal] icon path is empty.")
         return placeholder
 
-    path = normalized_path
+    path = str(path)
     if path.startswith(("http://", "https://", "data:image")):
         return path
-    
-    if not os.path.isabs(path):
-        # 상대 경로인 경우, 정확한 이미지 디렉토리에서 검색
-        search_dirs = [
-            IMAGE_DIR,  # 메인 이미지 디렉토리
-            DATA_DIR / "images",  # 백업 검색 경로
-            DATA_DIR / "images" / "character_art" / "elements_equipment",  # 속성/무기 아이콘 디렉토리
-            Path.cwd() / "04_data" / "images" / "character_art",  # 프로젝트 루트 기준
-            Path.cwd() / "04_data" / "images" / "character_art" / "elements_equipment",  # 속성/무기 아이콘
-            Path(path).parent if Path(path).parent.exists() else Path.cwd()
-        ]
-        
-        file_name = os.path.basename(path)
-        for search_dir in search_dirs:
-            if search_dir.exists():
-                potential_path = search_dir / file_name
-                if potential_path.exists():
-                    path = str(potential_path)
-                    break
-                # 대소문자 구분 없이 검색
-                try:
-                    for f in os.listdir(search_dir):
-                        if f.lower() == file_name.lower():
-                            path = str(search_dir / f)
-                            break
-                except Exception:
-                    continue
-    
-    if not os.path.exists(path):
+
+    # 2. 프로젝트 기준 상대 경로 → 절대 경로
+    full_path = Path(path) if os.path.isabs(path) else PROJECT_ROOT / path
+    if not full_path.is_file():
         log_debug(f"[NoFile] {path}")
         return placeholder
-    
-    try:
-        with open(path, "rb") as img_file:
-            b64_str = base64.b64encode(img_file.read()).decode()
-        return f"data:image/png;base64,{b64_str}"
-    except Exception as exc:
-        log_debug(f"[EncodeErr] {path}: {exc}")
+
+    src = icon_src(full_path, display_px=display_px)
+    if src is None:
+        log_debug(f"[EncodeErr] {path}")
         return placeholder
+    return src
 
 # ─────────────────────────────────────────────
 # Streamlit 고급 GUI 구현
@@ -275,7 +250,7 @@ def slot_machine_display(items, winner_index, item_display_duration_ms=50, spin_
     Args:
         items (list): 슬롯머신에 표시될 아이템 리스트.
                       각 아이템은 {'name': str, 'icon_base64': str} 형태의 딕셔너리여야 합니다.
-                      'icon_base64'는 이미지의 Base64 인코딩된 데이터입니다.
+                      'icon_base64'는 이미지 src 값입니다 (data URI 또는 정적 서빙 URL).
         winner_index (int): `items` 리스트 내에서 당첨자로 결정된 아이템의 인덱스.
         item_display_duration_ms (int, optional): 스핀 중 각 아이템이 화면에 표시되는 시간 (밀리초).
                                                 값이 작을수록 빠르게 지나갑니다. 기본값 50.
@@ -364,6 +339,9 @@ def slot_machine_display(items, winner_index, item_display_duration_ms=50, spin_
 
         if (numItems === 0) return;
 
+        // 정적 URL 모드에서는 스핀 중 깜빡임이 없도록 미리 받아 둠 (이후 스핀은 브라우저 캐시 사용)
+        items.forEach(src => {{ const preload = new Image(); preload.src = src; }});
+
         let currentIndex = 0;
         let spinInterval;
         let startTime = Date.now();
@@ -427,22 +405,14 @@ def get_image_base64(image_path):
         str | None: Base64로 인코딩된 이미지 문자열 (UTF-8 디코딩됨).
                      파일을 읽거나 인코딩하는 중 오류 발생 시 None 반환.
     """
-    try:
-        if not os.path.exists(image_path):
-            return None
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    except Exception as e:
-        log_debug(f"Base64 encoding error for {image_path}: {e}")
-        return None
+    return icon_to_base64(image_path)
 
-@st.cache_data
 def load_and_prepare_data(csv_path, personalities_csv_path, column_map_config):
     """
     CSV 파일을 로드하고 데이터를 준비합니다.
     
     Args:
-        csv_path: 메인 CSV 파일 경로
+        csv_path: 메인 데이터 파일 경로 (CSV 또는 정규 데이터셋 Parquet)
         personalities_csv_path: 퍼스널리티 CSV 파일 경로
         column_map_config: 컬럼 매핑 설정
         
@@ -504,42 +474,36 @@ def load_and_prepare_data(csv_path, personalities_csv_path, column_map_config):
             
             st.stop()
     
-    # 파일 읽기 시도 (여러 인코딩)
+    # 모든 페이지가 공유하는 읽기 전용 저장소로 로드
+    # (Parquet이면 호환 뷰, CSV면 정규 데이터셋과 같은 정규화를 프로세스에서 한 번만 적용)
     try:
-        df = pd.read_csv(csv_path, encoding='utf-8-sig').fillna('')
-        st.success(f"✅ UTF-8 인코딩으로 메인 파일 로드 성공")
-    except UnicodeDecodeError:
-        try:
-            df = pd.read_csv(csv_path, encoding='cp949').fillna('')
-            st.warning("⚠️ 메인 파일 인코딩을 cp949로 읽었습니다. UTF-8로 재저장을 권장합니다.")
-        except Exception as e:
-            st.error(f"❌ 메인 파일 읽기 실패: {str(e)}")
-            st.info("💡 스크래퍼를 다시 실행하여 올바른 형식의 파일을 생성하세요.")
-            st.stop()
+        repository = get_character_repository(csv_path)
+    except UnicodeDecodeError as e:
+        st.error(f"❌ 메인 파일 읽기 실패: {str(e)}")
+        st.info("💡 스크래퍼를 다시 실행하여 올바른 형식의 파일을 생성하세요.")
+        st.stop()
+    except ValueError as e:
+        st.error(f"📊 {e}")
+        st.info("💡 스크래퍼를 다시 실행하여 올바른 형식의 데이터를 생성하세요.")
+        st.stop()
     except Exception as e:
         st.error(f"❌ 예기치 못한 오류 발생: {str(e)}")
         st.stop()
     
     # 데이터 검증
-    if len(df) == 0:
+    if repository is None or len(repository) == 0:
         st.error("📋 메인 CSV 파일이 비어있습니다. 스크래퍼를 실행하여 데이터를 채우세요.")
         st.stop()
-    
-    # 필수 컬럼 확인
-    required_columns = ['캐릭터명', 'English_Name', '희귀도', '속성명리스트', '무기명리스트']
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    
-    if missing_columns:
-        st.error(f"📊 필수 컬럼이 누락되었습니다: {missing_columns}")
-        st.info("💡 스크래퍼를 다시 실행하여 올바른 형식의 데이터를 생성하세요.")
-        st.stop()
+    if repository.source.endswith('.parquet'):
+        st.success("✅ 정규 데이터셋(Parquet) 로드 성공")
+    df = repository.df
     
     # 성공 메시지
     st.success(f"✅ 메인 데이터 로드 완료: {len(df)}명의 캐릭터")
     
     return df, column_map_config['이름'], column_map_config['캐릭터아이콘경로'], column_map_config['희귀도'], column_map_config['속성명'], column_map_config['무기명'], column_map_config['퍼스널리티']
 
-def create_character_card_html(row: pd.Series, column_map: dict, is_winner: bool = False) -> str:
+def create_character_card_html(row: pd.Series, column_map: dict, is_winner: bool = False, use_sprites: bool = False) -> str:
     """
     캐릭터 데이터 한 행을 받아 스타일링된 HTML 카드 문자열을 생성합니다.
 
@@ -547,6 +511,8 @@ def create_character_card_html(row: pd.Series, column_map: dict, is_winner: bool
         row: 캐릭터 정보가 담긴 pandas Series.
         column_map: 컬럼 이름 매핑.
         is_winner: 룰렛 당첨 여부. True이면 강조 스타일이 적용됩니다.
+        use_sprites: True이면 속성/무기/방어구 아이콘을 스프라이트 아틀라스 좌표로 표시합니다.
+            (아틀라스에 없는 아이콘은 개별 이미지로 표시)
 
     Returns:
         생성된 HTML 카드 문자열.
@@ -568,16 +534,20 @@ def create_character_card_html(row: pd.Series, column_map: dict, is_winner: bool
         
         items_html = ""
         for name, path in zip(names, icon_paths):
-            icon_uri = safe_icon_to_data_uri(path)
-            if name or "data:image/png;base64," in icon_uri:
-                escaped_name = html.escape(name)
-                # 아이콘과 텍스트를 함께 표시 (텍스트가 없으면 아이콘만 표시)
-                text_html = f'<span class="eden-text">{escaped_name}</span>' if escaped_name else ''
-                items_html += (
-                    f'<div class="eden-item" title="{escaped_name}">'
-                    f'<img src="{icon_uri}" alt="{escaped_name}">{text_html}'
-                    f'</div>'
-                )
+            escaped_name = html.escape(name)
+            icon_html = sprite_html(path, title=name) if use_sprites else None
+            if icon_html is None:
+                icon_uri = safe_icon_to_data_uri(path, display_px=28)
+                if not name and icon_uri == PLACEHOLDER_ICON_URI:
+                    continue
+                icon_html = f'<img src="{icon_uri}" alt="{escaped_name}" loading="lazy" decoding="async">'
+            # 아이콘과 텍스트를 함께 표시 (텍스트가 없으면 아이콘만 표시)
+            text_html = f'<span class="eden-text">{escaped_name}</span>' if escaped_name else ''
+            items_html += (
+                f'<div class="eden-item" title="{escaped_name}">'
+                f'{icon_html}{text_html}'
+                f'</div>'
+            )
         
         return f'<div class="icon-container">{items_html}</div>'
 
@@ -589,7 +559,7 @@ def create_character_card_html(row: pd.Series, column_map: dict, is_winner: bool
         weapon_col, weapon_icon_col = column_map['무기명'], column_map['무기아이콘']
         armor_col, armor_icon_col = column_map['방어구명'], column_map['방어구아이콘']
 
-        char_icon_uri = safe_icon_to_data_uri(row.get(char_icon_col, ''))
+        char_icon_uri = safe_icon_to_data_uri(row.get(char_icon_col, ''), display_px=70)
         char_name = html.escape(str(row.get(name_col, '')))
         rarity = html.escape(str(row.get(rarity_col, '')))
         
@@ -602,7 +572,7 @@ def create_character_card_html(row: pd.Series, column_map: dict, is_winner: bool
         return f"""
         <div class="eden-card {winner_class}">
             <div class="card-header">
-                <img src="{char_icon_uri}" class="char-img" alt="{char_name}">
+                <img src="{char_icon_uri}" class="char-img" alt="{char_name}" loading="lazy" decoding="async">
                 <h4>{char_name} <span>({rarity})</span></h4>
             </div>
             <div class="card-body">
@@ -616,13 +586,75 @@ def create_character_card_html(row: pd.Series, column_map: dict, is_winner: bool
         log_debug(f"카드 생성 오류: {row.get(name_col, 'N/A')}, 오류: {e}")
         return "<div class='eden-card error-card'><p>카드 표시 오류</p></div>"
 
+def dataset_version(*paths) -> str:
+    """카드 HTML에 영향을 주는 파일들의 (경로, 수정 시각, 크기)로 만든 데이터 버전 문자열"""
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{path}:{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            parts.append(f"{path}:missing")
+    return "|".join(parts)
+
+
+@st.cache_resource(max_entries=4)
+def get_card_html_cache(version: str) -> dict:
+    """
+    데이터 버전별 카드 HTML 캐시 (세션 간 공유)
+
+    키는 (캐릭터 ID, 당첨 여부, 스프라이트 사용 여부)이며, CSV/퍼스널리티 CSV/아틀라스 인덱스/
+    이미지 파생본 manifest 중 하나가 바뀌면 버전 문자열이 달라져 새 딕셔너리가 만들어집니다.
+    """
+    return {}
+
+
+@st.cache_resource(max_entries=4)
+def get_filter_index(version: str, _df: pd.DataFrame, column_map: dict) -> FilterIndex:
+    """데이터 버전별 필터 인덱스 (희귀도/속성/무기/퍼스널리티 값 → 캐릭터 마스크)"""
+    return FilterIndex(_df, {
+        '희귀도': (column_map['희귀도'], False),
+        '속성': (column_map['속성명'], True),
+        '무기': (column_map['무기명'], False),
+        '퍼스널리티': (column_map['퍼스널리티'], True),
+    })
+
+
+@st.cache_resource(max_entries=4)
+def get_search_index(version: str, _df: pd.DataFrame, column_map: dict) -> SearchIndex:
+    """데이터 버전별 검색 인덱스 (한글 이름 > 영문 이름 > 퍼스널리티 순으로 가중치)"""
+    return SearchIndex(_df, {
+        '이름': (column_map['이름'], False, 3),
+        '영문 이름': ('English_Name', False, 2),
+        '퍼스널리티': (column_map['퍼스널리티'], True, 1),
+    })
+
+
+def get_card_html_list(df: pd.DataFrame, column_map: dict, card_cache: dict,
+                       winner_id=None, use_sprites: bool = False) -> list:
+    """df의 각 행에 대한 카드 HTML (캐릭터 ID로 캐시, 캐시에 있으면 행을 꺼내지 않고 그대로 사용)"""
+    ids = df[ID_COLUMN]
+    cards = []
+    for idx in df.index:
+        is_winner = winner_id is not None and ids.at[idx] == winner_id
+        key = (ids.at[idx], is_winner, use_sprites)
+        card = card_cache.get(key)
+        if card is None:
+            card = create_character_card_html(df.loc[idx], column_map, is_winner=is_winner, use_sprites=use_sprites)
+            card_cache[key] = card
+        cards.append(card)
+    return cards
+
+
 def main():
     """메인 애플리케이션 함수"""
     st.markdown("### 🎲 Another Eden 캐릭터 룰렛")
     
     # 정확한 데이터 파일 경로 사용
-    # 통합 데이터 파일 우선 시도, 없으면 기존 파일들 시도
-    default_csv_path = CSV_DIR / "eden_unified_data.csv"
+    # 정규 데이터셋(Parquet) → 통합 데이터 파일 → 기존 파일들 순으로 시도
+    default_csv_path = DATASET_PATH
+    if not default_csv_path.exists():
+        default_csv_path = CSV_DIR / "eden_unified_data.csv"
     if not default_csv_path.exists():
         default_csv_path = CSV_DIR / "eden_roulette_data.csv"
     if not default_csv_path.exists():
@@ -634,7 +666,7 @@ def main():
         return
 
     # --- 데이터 로드 및 준비 ---
-    csv_path = st.sidebar.text_input("CSV 파일 경로", value=str(default_csv_path))
+    csv_path = st.sidebar.text_input("데이터 파일 경로", value=str(default_csv_path))
     column_map = {
         '희귀도': '희귀도', '이름': '캐릭터명', '캐릭터아이콘경로': '캐릭터아이콘경로',
         '속성명': '속성명리스트', '속성아이콘': '속성_아이콘경로리스트',
@@ -655,57 +687,40 @@ def main():
         
     df, name_col, char_icon_col, rarity_col, element_col, weapon_col, personality_col = result
 
-    # ── 명칭 교정: '주먹' → '권갑' ──
-    weapon_col_name = column_map['무기명']
-    if weapon_col_name in df.columns:
-        df[weapon_col_name] = df[weapon_col_name].astype(str).apply(lambda s: s.replace('주먹', '권갑'))
-
-    # ── 성급(희귀도) 정규화: 복수 표기 시 최고 성급만 남기기 ──
-    def normalize_rarity(val: str) -> str:
-        if not isinstance(val, str):
-            return val
-        val = val.strip()
-        if not val:
-            return val
-        # SA 여부
-        has_sa = 'SA' in val
-        # 모든 숫자 추출
-        nums = re.findall(r'(\d)(?=★)', val)
-        if nums:
-            max_star = max(int(n) for n in nums)
-            return f"{max_star}★{' SA' if has_sa else ''}"
-        return val
-
-    rarity_col_name = column_map['희귀도']
-    if rarity_col_name in df.columns:
-        df[rarity_col_name] = df[rarity_col_name].astype(str).apply(normalize_rarity)
-
     if df is None: return
 
+    # 카드 HTML 캐시: 데이터가 바뀐 뒤 첫 실행에서 전체 카드를 미리 생성해 두고 이후에는 조회만 함
+    # 파생본 manifest가 바뀌면(썸네일 생성 등) 카드의 아이콘 URL도 바뀌므로 함께 버전에 포함
+    version = dataset_version(csv_path, personalities_csv_path, SPRITE_INDEX_PATH, DERIVATIVE_MANIFEST_PATH)
+    card_cache = get_card_html_cache(version)
+    filter_index = get_filter_index(version, df, column_map)
+    search_index = get_search_index(version, df, column_map)
+    icon_sprite_css = sprite_css(display_px=28, selector=".eden-card .eden-sprite")
+    if not card_cache:
+        get_card_html_list(df, column_map, card_cache, use_sprites=bool(icon_sprite_css))
+
     # --- 사이드바 필터 --- 
     with st.sidebar.container():
         st.markdown('<div class="filter-container">', unsafe_allow_html=True)
         st.header("🔎 필터 및 검색")
-        all_attrs = sorted(set(item for sublist in df[column_map['속성명']].dropna().apply(lambda x: re.split('[|,]', x)) for item in sublist if item.strip()))
-        
-        sel_rarity = st.multiselect("희귀도", sorted(df[column_map['희귀도']].dropna().unique()))
-        sel_attr = st.multiselect("속성 (AND 조건)", all_attrs)
-        sel_weapon = st.multiselect("무기", sorted(df[column_map['무기명']].dropna().unique()))
-        search_name = st.text_input("이름/성격 검색")
+        sel_rarity = st.multiselect("희귀도", filter_index.options('희귀도'))
+        sel_attr = st.multiselect("속성 (AND 조건)", filter_index.options('속성'))
+        sel_weapon = st.multiselect("무기", filter_index.options('무기'))
+        search_name = st.text_input("이름/성격 검색", help="초성(예: ㄹㅇㅂ → 레이븐)과 영문 이름 일부로도 검색할 수 있습니다.")
         st.markdown('</div>', unsafe_allow_html=True)
 
-    # --- 필터링 로직 ---
-    filtered_df = df.copy()
-    if sel_rarity: filtered_df = filtered_df[filtered_df[column_map['희귀도']].isin(sel_rarity)]
-    if sel_weapon: filtered_df = filtered_df[filtered_df[column_map['무기명']].isin(sel_weapon)]
-    if sel_attr:
-        for attr in sel_attr:
-            filtered_df = filtered_df[filtered_df[column_map['속성명']].str.contains(attr, na=False, regex=False)]
-    if search_name:
-        search_cols = [column_map['이름'], column_map['퍼스널리티']]
-        filtered_df = filtered_df[filtered_df[search_cols].apply(
-            lambda row: row.astype(str).str.contains(search_name, case=False, na=False).any(), axis=1
-        )]
+    # --- 필터링 로직 (희귀도·무기는 OR, 속성은 AND) ---
+    filter_mask = (
+        filter_index.mask('희귀도', sel_rarity)
+        & filter_index.mask('무기', sel_weapon)
+        & filter_index.mask('속성', sel_attr, match_all=True)
+    )
+    if search_name.strip():
+        # 검색어가 있으면 일치도 순으로 정렬 (이름/영문 이름/퍼스널리티, 초성·접두사 포함)
+        ranked_positions = [pos for pos, _score in search_index.search(search_name) if filter_mask[pos]]
+        filtered_df = df.iloc[ranked_positions]
+    else:
+        filtered_df = df[filter_mask]
 
     # --- 룰렛 기능 ---
     with st.sidebar.container():
@@ -713,25 +728,27 @@ def main():
         st.header("🎰 룰렛")
         if st.button("룰렛 돌리기!", use_container_width=True, key="roulette_button"):
             st.markdown('<div class="roulette-button">', unsafe_allow_html=True)
-        if not filtered_df.empty:
-            winner_series = filtered_df.sample(1).iloc[0]
-            st.session_state['roulette_winner'] = winner_series.to_dict()
-            
-            # 슬롯머신용 데이터 준비
-            roulette_candidates = filtered_df.sample(n=min(len(filtered_df), 50))
-            st.session_state['roulette_items'] = [
-                {"name": r[column_map['이름']], "icon_base64": safe_icon_to_data_uri(r[column_map['캐릭터아이콘경로']])}
-                for _, r in roulette_candidates.iterrows()
-            ]
-            # 당첨자를 후보 리스트의 특정 위치에 삽입
-            winner_item = {"name": winner_series[column_map['이름']], "icon_base64": safe_icon_to_data_uri(winner_series[column_map['캐릭터아이콘경로']])}
-            winner_index = random.randint(0, len(st.session_state['roulette_items']) -1)
-            st.session_state['roulette_items'][winner_index] = winner_item
-            st.session_state['roulette_winner_index'] = winner_index
-            st.session_state['roulette_trigger'] = True  # 애니메이션 1회용 트리거
-        else:
-            st.sidebar.warning("필터링된 캐릭터가 없습니다.")
-            st.session_state.pop('roulette_winner', None)
+            if not filtered_df.empty:
+                winner_series = filtered_df.sample(1).iloc[0]
+                st.session_state['roulette_winner'] = winner_series.to_dict()
+
+                # 슬롯머신용 데이터 준비
+                roulette_candidates = filtered_df.sample(n=min(len(filtered_df), 50))
+                st.session_state['roulette_items'] = [
+                    {"name": r[column_map['이름']], "icon_base64": safe_icon_to_data_uri(r[column_map['캐릭터아이콘경로']], display_px=280)}
+                    for _, r in roulette_candidates.iterrows()
+                ]
+                # 당첨자를 후보 리스트의 특정 위치에 삽입
+                winner_item = {"name": winner_series[column_map['이름']], "icon_base64": safe_icon_to_data_uri(winner_series[column_map['캐릭터아이콘경로']], display_px=280)}
+                winner_index = random.randint(0, len(st.session_state['roulette_items']) -1)
+                st.session_state['roulette_items'][winner_index] = winner_item
+                st.session_state['roulette_winner_index'] = winner_index
+                st.session_state['roulette_trigger'] = True  # 애니메이션 1회용 트리거
+                # 카드 그리드를 당첨 카드가 있는 페이지로 이동
+                st.session_state['card_page'] = filtered_df.index.get_loc(winner_series.name) // CARDS_PER_PAGE + 1
+            else:
+                st.sidebar.warning("필터링된 캐릭터가 없습니다.")
+                st.session_state.pop('roulette_winner', None)
 
     # 사이드바 하단 저작권 정보
     st.sidebar.markdown("---") 
@@ -755,6 +772,7 @@ def main():
         st.session_state.pop('roulette_items', None)
         st.session_state.pop('roulette_winner_index', None)
         st.session_state.pop('roulette_trigger', None)
+        st.session_state.pop('card_page', None)
     st.session_state['prev_filter_key'] = current_filter_key
 
     # --- 룰렛 결과 표시 ---
@@ -768,14 +786,29 @@ def main():
         # 트리거 끄기 -> 재실행 시 애니메이션 반복 방지
         st.session_state['roulette_trigger'] = False
 
-    # --- 캐릭터 카드 그리드 표시 ---
+    # --- 캐릭터 카드 그리드 표시 (현재 페이지 카드만 생성) ---
     st.markdown(f"#### 총 {len(filtered_df)}명")
-    winner_name = st.session_state.get('roulette_winner', {}).get(column_map['이름'])
+    # 이름이 같은 캐릭터(스타일 등)가 함께 강조되지 않도록 캐릭터 ID로 비교
+    winner_id = st.session_state.get('roulette_winner', {}).get(ID_COLUMN)
+
+    total_pages = max(1, (len(filtered_df) - 1) // CARDS_PER_PAGE + 1)
+    if st.session_state.get('card_page', 1) > total_pages:
+        st.session_state['card_page'] = 1
+    if total_pages > 1:
+        current_page = st.selectbox(
+            "페이지 선택",
+            range(1, total_pages + 1),
+            key='card_page',
+            format_func=lambda x: f"페이지 {x} / {total_pages}"
+        )
+    else:
+        current_page = 1
+    start_idx = (current_page - 1) * CARDS_PER_PAGE
+    page_df = filtered_df.iloc[start_idx:start_idx + CARDS_PER_PAGE]
 
-    card_html_list = [
-        create_character_card_html(row, column_map, is_winner=(row[column_map['이름']] == winner_name))
-        for _, row in filtered_df.iterrows()
-    ]
+    # 속성/무기/방어구 아이콘은 아틀라스 한 장을 CSS로 한 번만 참조 (icon_sprite_css, 아틀라스가 없으면 빈 문자열)
+    card_html_list = get_card_html_list(page_df, column_map, card_cache, winner_id=winner_id,
+                                        use_sprites=bool(icon_sprite_css))
 
     if not card_html_list:
         st.info("표시할 캐릭터가 없습니다. 필터 조건을 확인해주세요.")
@@ -924,6 +957,8 @@ def main():
                 object-fit: contain;
                 border-radius: 4px;
             }}
+
+            {icon_sprite_css}
             
             .eden-card .eden-text {{
                 font-size: 0.9em; 
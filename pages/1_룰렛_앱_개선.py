@@ -7,9 +7,8 @@
 import streamlit as st
 import pandas as pd
 import random
-import os
+import sys
 import re
-import base64
 from pathlib import Path
 
 # 경로 설정
@@ -19,6 +18,11 @@ DATA_DIR = PROJECT_ROOT / "04_data"
 CSV_DIR = DATA_DIR / "csv"
 IMAGE_DIR = DATA_DIR / "images" / "character_art"
 
+# 공용 아이콘 캐시 (메모리 LRU + 디스크, 앱 간 공유)
+sys.path.insert(0, str(BASE_DIR / "03_apps" / "shared"))
+from icon_cache import icon_to_data_uri
+from character_repository import get_character_repository
+
 # 페이지 설정
 st.set_page_config(
     page_title="🎲 어나더에덴 룰렛",
@@ -180,29 +184,25 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def safe_icon_to_data_uri(path):
-    """이미지 파일을 data URI로 변환 (간단 버전)"""
+def safe_icon_to_data_uri(path, display_px=None):
+    """이미지 파일을 data URI로 변환 (간단 버전, display_px를 주면 표시 크기에 맞는 파생본 사용)"""
     if not path or pd.isna(path):
         return ""
     
-    try:
-        if os.path.exists(path):
-            with open(path, 'rb') as f:
-                data = base64.b64encode(f.read()).decode()
-                return f"data:image/png;base64,{data}"
-    except:
-        pass
-    return ""
+    # 캐릭터 데이터의 아이콘 경로는 프로젝트 기준 상대 경로
+    return icon_to_data_uri(BASE_DIR / path, default="", display_px=display_px)
 
-@st.cache_data
 def load_character_data():
-    """캐릭터 데이터 로드"""
+    """캐릭터 데이터 로드 (모든 페이지가 공유하는 읽기 전용 저장소의 데이터프레임)"""
     try:
-        df = pd.read_csv(CSV_DIR / "eden_quiz_data.csv", encoding='utf-8-sig')
-        return df.fillna('')
-    except:
+        repository = get_character_repository()
+    except Exception as e:
+        print(f"⚠️ 캐릭터 데이터 로드 실패: {e}")
+        repository = None
+    if repository is None:
         st.error("데이터를 로드할 수 없습니다.")
         return pd.DataFrame()
+    return repository.df
 
 def main():
     # 데이터 로드
@@ -362,7 +362,7 @@ def main():
         
         # 이미지 표시
         if winner.get('캐릭터아이콘경로'):
-            image_uri = safe_icon_to_data_uri(winner['캐릭터아이콘경로'])
+            image_uri = safe_icon_to_data_uri(winner['캐릭터아이콘경로'], display_px=200)
             if image_uri:
                 with col2:
                     st.markdown(f"""
@@ -406,7 +406,7 @@ def main():
             
             with col:
                 # 이미지
-                image_uri = safe_icon_to_data_uri(char.get('캐릭터아이콘경로', ''))
+                image_uri = safe_icon_to_data_uri(char.get('캐릭터아이콘경로', ''), display_px=80)
                 img_html = f'<img src="{image_uri}" style="width: 80px; height: 80px; border-radius: 10px; object-fit: cover;">' if image_uri else ""
                 
                 st.markdown(f"""
@@ -6,16 +6,19 @@
 """
 
 import os
+import sys
+import numpy as np
 import pandas as pd
 import streamlit as st
-import random
 import time
-from typing import List, Dict, Any
-import base64
+from typing import List
 from pathlib import Path
-import unicodedata
 import json
+import uuid
+import sqlite3
 from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # --- 경로 설정 ---
 # 이 파일의 위치를 기준으로 경로를 설정합니다.
@@ -25,6 +28,14 @@ DATA_DIR = PROJECT_ROOT / "04_data"
 CSV_DIR = DATA_DIR / "csv"
 IMAGE_DIR = DATA_DIR / "images" / "character_art"
 
+# 공용 아이콘 캐시 (메모리 LRU + 디스크, 앱 간 공유)
+sys.path.insert(0, str(PROJECT_ROOT / "03_apps" / "shared"))
+from icon_cache import icon_to_data_uri
+from character_repository import CharacterRepository, get_character_repository
+from answer_index import AnswerIndex
+from reveal_images import reveal_stage_paths
+from quiz_stats import QuizStatsStore
+
 # --- CSS 스타일 ---
 st.markdown("""
 <style>
@@ -207,48 +218,34 @@ st.markdown("""
 """, unsafe_allow_html=True) 
 
 # --- 유틸리티 함수들 ---
-def normalize_text(text: str) -> str:
-    """텍스트 정규화 (한글/영문 혼용 지원)"""
-    if pd.isna(text):
-        return ""
-    
-    # 유니코드 정규화
-    normalized = unicodedata.normalize('NFKC', str(text))
-    
-    # 공백 제거 및 소문자 변환
-    cleaned = normalized.strip().lower()
-    
-    return cleaned
-
-def safe_icon_to_data_uri(path: str) -> str:
-    """안전한 아이콘 경로를 data URI로 변환"""
+def safe_icon_to_data_uri(path: str, display_px: int = None) -> str:
+    """안전한 아이콘 경로를 data URI로 변환 (display_px를 주면 표시 크기에 맞는 파생본 사용)"""
     if pd.isna(path) or not path:
         return ""
     
     try:
-        # 경로 정규화
+        # 데이터 로드 시 프로젝트 기준 POSIX 경로로 정리되어 있음
         icon_path = Path(path)
-        
-        # 상대 경로인 경우 절대 경로로 변환
         if not icon_path.is_absolute():
-            icon_path = IMAGE_DIR / icon_path.name
+            icon_path = PROJECT_ROOT / icon_path
         
-        if icon_path.exists():
-            with open(icon_path, 'rb') as f:
-                image_data = f.read()
-                mime_type = 'image/png' if icon_path.suffix.lower() == '.png' else 'image/jpeg'
-                encoded = base64.b64encode(image_data).decode()
-                return f"data:{mime_type};base64,{encoded}"
-        else:
-            # 파일이 없으면 기본 이미지 반환
-            return ""
+        # 파일이 없으면 빈 문자열 반환
+        return icon_to_data_uri(icon_path, default="", display_px=display_px)
     except Exception as e:
         print(f"이미지 로딩 오류: {e}")
         return ""
 
-@st.cache_data
-def load_character_data():
-    """캐릭터 데이터 로드 (개선된 경로 처리)"""
+def load_character_data() -> CharacterRepository:
+    """캐릭터 데이터 로드 (모든 페이지가 공유하는 읽기 전용 저장소, 정규 데이터셋 → 기존 CSV 순)"""
+    try:
+        repository = get_character_repository()
+    except Exception as e:
+        print(f"⚠️ 정규 데이터셋 로드 실패, 기존 CSV를 찾습니다: {e}")
+        repository = None
+    if repository is not None and len(repository) > 0:
+        st.success(f"✅ 캐릭터 데이터 로드 완료: {len(repository)}명의 캐릭터")
+        return repository
+
     # 다양한 경로 시도
     possible_paths = [
         CSV_DIR / "eden_quiz_data.csv",
@@ -294,40 +291,200 @@ def load_character_data():
         st.stop()
     
     try:
-        # CSV 파일 로드
-        df = pd.read_csv(csv_path, encoding='utf-8')
-        
-        # 필수 컬럼 확인
-        required_columns = ['캐릭터명', 'English_Name', '희귀도', '속성명리스트', '무기명리스트']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        
-        if missing_columns:
-            st.error(f"❌ 필수 컬럼이 누락되었습니다: {missing_columns}")
-            st.info("💡 스크래퍼를 다시 실행하여 올바른 형식의 데이터를 생성하세요.")
-            st.stop()
-        
-        # 출시일 컬럼이 없는 경우 대비
-        if '출시일' not in df.columns:
-            df['출시일'] = ''
-        
-        # 퍼스널리티 컬럼이 없는 경우 대비
-        if '퍼스널리티리스트' not in df.columns:
-            df['퍼스널리티리스트'] = ''
-        
-        st.success(f"✅ 캐릭터 데이터 로드 완료: {len(df)}명의 캐릭터")
-        return df
-        
+        # CSV 파일 로드 (정규 데이터셋과 같은 정규화와 빠진 컬럼 채우기는 저장소에서 한 번만 적용)
+        repository = get_character_repository(csv_path)
+        st.success(f"✅ 캐릭터 데이터 로드 완료: {len(repository)}명의 캐릭터")
+        return repository
+        
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        st.info("💡 스크래퍼를 다시 실행하여 올바른 형식의 데이터를 생성하세요.")
+        st.stop()
     except Exception as e:
         st.error(f"❌ 데이터 로딩 중 오류 발생: {str(e)}")
         st.info("💡 파일 형식을 확인하거나 스크래퍼를 다시 실행하세요.")
         st.stop() 
 
+# 퀴즈 유형별 (질문, 정답 컬럼)
+QUESTION_SPECS = {
+    "guess_name": ("이 캐릭터의 이름은 무엇일까요? (3-4성 최대)", '캐릭터명'),
+    "guess_rarity": ("이 캐릭터의 희귀도는 무엇일까요?", '희귀도'),
+    "guess_element": ("이 캐릭터의 속성은 무엇일까요? (3-4성 최대)", '속성명리스트'),
+    "guess_weapon": ("이 캐릭터가 사용하는 무기는 무엇일까요? (3-4성 최대)", '무기명리스트'),
+    "guess_personality": ("이 캐릭터의 퍼스널리티는 무엇일까요?", '퍼스널리티리스트'),
+    "guess_release_date": ("이 캐릭터의 출시일은 언제일까요?", '출시일'),
+    "silhouette_quiz": ("이 실루엣의 캐릭터는 누구일까요?", '캐릭터명'),
+}
+DEFAULT_QUESTION_SPEC = ("이 캐릭터의 이름은 무엇일까요?", '캐릭터명')
+NO_DATA_QUESTION = "데이터가 부족합니다. 스크래퍼를 실행해주세요."
+# 정답 컬럼별 여러 값 여부 (속성/무기/퍼스널리티는 그중 하나가 정답, 나머지 값은 오답 보기에서 제외)
+ANSWER_FIELDS = {
+    '캐릭터명': ('캐릭터명', False),
+    '희귀도': ('희귀도', False),
+    '속성명리스트': ('속성명리스트', True),
+    '무기명리스트': ('무기명리스트', True),
+    '퍼스널리티리스트': ('퍼스널리티리스트', True),
+    '출시일': ('출시일', False),
+}
+# 이름/속성/무기 맞추기는 3-4성 최대, 나머지 유형은 전체 캐릭터 대상
+QUIZ_MAX_RARITY = {"guess_name": 4, "guess_element": 4, "guess_weapon": 4}
+PREFETCH_DEPTH = 3  # 퀴즈 유형별로 미리 준비해 둘 다음 문제 수
+HISTORY_SIZE = 50  # 세션에 남겨 두는 최근 정답/오답 기록 수
+
+
+@st.cache_resource
+def get_prefetch_executor():
+    """힌트 이미지 읽기/인코딩용 스레드 풀 (모든 세션이 공유)"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="quiz-prefetch")
+
+
+@st.cache_resource
+def get_stats_store():
+    """퀴즈 통계 저장소 (모든 세션이 공유, 기록은 SQLite가 직렬화)"""
+    return QuizStatsStore()
+
+
+class QuizBank:
+    """
+    문제 생성용 읽기 전용 데이터 (모든 세션이 한 벌을 공유)
+    캐릭터 데이터는 공유 저장소를 그대로 참조하고, 희귀도별 행 위치 배열과 정답/보기 인덱스만 한 번 만듭니다.
+    """
+
+    def __init__(self, repository: CharacterRepository):
+        self.repository = repository
+        self.df = repository.df
+        self.pools = {}
+        self.answer_indexes = {}
+        for max_rarity in {5, *QUIZ_MAX_RARITY.values()}:
+            self.answer_index(max_rarity)
+
+    def pool(self, max_rarity: int = 5) -> np.ndarray:
+        """최고 성급이 max_rarity 이하인 캐릭터의 행 위치 배열"""
+        pool = self.pools.get(max_rarity)
+        if pool is None:
+            if max_rarity >= 5 or '최대성급' not in self.df.columns:
+                pool = np.arange(len(self.df))
+            else:
+                pool = np.flatnonzero(self.repository.column('최대성급') <= max_rarity)
+                # 해당 희귀도 캐릭터가 없으면 전체 데이터에서 선택
+                if len(pool) == 0:
+                    print(f"⚠️ 해당 희귀도 캐릭터가 없어서 전체 캐릭터에서 선택합니다. (max_rarity: {max_rarity})")
+                    pool = np.arange(len(self.df))
+            pool.setflags(write=False)
+            self.pools[max_rarity] = pool
+        return pool
+
+    def answer_index(self, max_rarity: int = 5) -> AnswerIndex:
+        """희귀도 범위별 정답/보기 인덱스 (행 위치는 pool() 기준)"""
+        index = self.answer_indexes.get(max_rarity)
+        if index is None:
+            index = AnswerIndex(self.df.iloc[self.pool(max_rarity)], ANSWER_FIELDS)
+            self.answer_indexes[max_rarity] = index
+        return index
+
+    def icon_path(self, row: int) -> str:
+        return self.repository.column('캐릭터아이콘경로')[row] if row >= 0 else ''
+
+    def hint_image(self, row: int) -> str:
+        """힌트 이미지 src (프로세스 공용 아이콘 캐시에서 읽음, 세션에는 저장하지 않음)"""
+        icon_path = self.icon_path(row)
+        return safe_icon_to_data_uri(icon_path, display_px=200) if icon_path else ""
+
+    def reveal_stages(self, row: int) -> List[str]:
+        """실루엣 퀴즈 공개 단계 이미지 경로 (아직 생성되지 않았으면 빈 목록)"""
+        icon_path = self.icon_path(row)
+        return reveal_stage_paths(PROJECT_ROOT / icon_path) if icon_path else []
+
+    def warm_images(self, question: "Question"):
+        """문제에 쓸 이미지를 미리 읽어 아이콘 캐시에 올려 둠 (스레드 풀에서 실행)"""
+        self.hint_image(question.row)
+        if question.quiz_type == "silhouette_quiz":
+            for stage in self.reveal_stages(question.row):
+                safe_icon_to_data_uri(stage)
+
+
+@st.cache_resource(max_entries=2)
+def get_quiz_bank(_repository: CharacterRepository, version: str) -> QuizBank:
+    """저장소 버전별 문제 생성용 데이터 (프로세스 전체에서 한 번만 생성)"""
+    return QuizBank(_repository)
+
+
+class Question:
+    """출제된 문제 하나 (캐릭터는 행 위치로, 이미지는 렌더링할 때 QuizBank에서 참조)"""
+    __slots__ = ('quiz_type', 'row', 'correct_answer', 'options')
+
+    def __init__(self, quiz_type: str, row: int, correct_answer: str, options: tuple):
+        self.quiz_type = quiz_type
+        self.row = row
+        self.correct_answer = correct_answer
+        self.options = options
+
+    @property
+    def text(self) -> str:
+        if self.row < 0:
+            return NO_DATA_QUESTION
+        return QUESTION_SPECS.get(self.quiz_type, DEFAULT_QUESTION_SPEC)[0]
+
+
+class AnswerRecord:
+    """답안 기록 하나"""
+    __slots__ = ('question', 'user_answer', 'is_correct', 'time_taken', 'score', 'combo')
+
+    def __init__(self, question: Question, user_answer: str, is_correct: bool, time_taken: float,
+                 score: float, combo: int):
+        self.question = question
+        self.user_answer = user_answer
+        self.is_correct = is_correct
+        self.time_taken = time_taken
+        self.score = score
+        self.combo = combo
+
+
+def _deep_sizeof(obj, skip_ids, seen=None) -> int:
+    """obj에서 닿는 객체들의 대략적인 메모리 합 (skip_ids의 공유 객체는 제외)"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen or id(obj) in skip_ids:
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes + sys.getsizeof(obj) if obj.base is None else sys.getsizeof(obj)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_sizeof(k, skip_ids, seen) + _deep_sizeof(v, skip_ids, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(_deep_sizeof(item, skip_ids, seen) for item in obj)
+    elif hasattr(type(obj), '__slots__'):
+        size += sum(_deep_sizeof(getattr(obj, name), skip_ids, seen)
+                    for name in type(obj).__slots__ if hasattr(obj, name))
+    return size
+
+
 class QuizGame:
-    def __init__(self, df: pd.DataFrame):
-        self.df = df
+    """
+    세션별 퀴즈 진행 상태 (문제 생성용 데이터는 공유 QuizBank를 참조)
+    문제와 기록은 캐릭터 행 위치와 보기 문자열 참조만 가지며, 기록은 최근 HISTORY_SIZE개만 유지합니다.
+    """
+    __slots__ = (
+        'bank', 'session_id', 'stats_store', 'rng', 'executor', 'prefetch_queues', 'prefetch_stats',
+        'score', 'total_questions', 'combo_count', 'max_combo', 'start_time', 'question_start_time',
+        'time_limit', 'hints_used', 'session_stats', 'retry_count', 'max_retries', 'partial_score',
+        'retry_penalty', 'silhouette_revealed', 'reveal_stage', 'current_question_data', 'answer_attempted',
+        'wrong_questions', 'correct_questions', 'last_answer', 'current_quiz_type', 'question_seq',
+    )
+
+    def __init__(self, bank: QuizBank, seed: int = None, executor: ThreadPoolExecutor = None,
+                 stats_store: QuizStatsStore = None):
+        self.bank = bank
+        # 답안마다 통계 저장소에 기록 (None이면 세션 안에서만 집계)
+        self.session_id = uuid.uuid4().hex
+        self.stats_store = stats_store
+        self.rng = np.random.default_rng(seed)
+        # 다음 문제 미리 준비: 퀴즈 유형 → (문제, 이미지 준비 Future) 큐 (executor가 없으면 바로 준비)
+        self.executor = executor
+        self.prefetch_queues = {}
+        self.prefetch_stats = {'hits': 0, 'misses': 0}
         self.score = 0
         self.total_questions = 0
-        self.current_question = None
         self.combo_count = 0
         self.max_combo = 0
         self.start_time = None
@@ -346,132 +503,92 @@ class QuizGame:
         self.partial_score = 0.5  # 부분 점수 (50%)
         self.retry_penalty = 0.3  # 재시도 페널티 (30% 감점)
         self.silhouette_revealed = False
+        self.reveal_stage = 0  # 실루엣 퀴즈 공개 단계
         self.current_question_data = None
         self.answer_attempted = False
-        # 틀린 문제 추적
-        self.wrong_questions = []
-        self.correct_questions = []
-        self.question_history = []
+        # 최근 정답/오답 기록 (오래된 것부터 버림)
+        self.wrong_questions = deque(maxlen=HISTORY_SIZE)
+        self.correct_questions = deque(maxlen=HISTORY_SIZE)
+        self.last_answer = None
+        self.question_seq = 0  # 세션 안의 문제 번호 (통계 저장소에서 같은 문제의 중복 기록 방지)
         # 현재 퀴즈 유형 추적
         self.current_quiz_type = None
 
-    def get_random_characters(self, n: int = 4, max_rarity: int = 5, use_all_characters: bool = False) -> List[Dict]:
-        """랜덤 캐릭터 n명 선택 (희귀도 제한 가능)"""
-        filtered_df = self.df.copy()
-        
-        if use_all_characters:
-            # 실루엣 퀴즈는 전체 캐릭터 사용
-            pass
-        elif max_rarity <= 4:
-            # 3-4성 최대 캐릭터만 필터링
-            filtered_df = filtered_df[filtered_df['희귀도'].str.contains(r'[1-4]★', na=False)]
-        elif max_rarity <= 3:
-            # 3성 이하 캐릭터만 필터링 (레거시 지원)
-            filtered_df = filtered_df[filtered_df['희귀도'].str.contains(r'[1-3]★', na=False)]
-        
-        # 필터링된 결과가 없으면 전체 데이터에서 선택
-        if len(filtered_df) == 0:
-            print(f"⚠️ 해당 희귀도 캐릭터가 없어서 전체 캐릭터에서 선택합니다. (max_rarity: {max_rarity})")
-            filtered_df = self.df.copy()
-        
-        if len(filtered_df) < n:
-            return filtered_df.to_dict('records')
-        return filtered_df.sample(n=n).to_dict('records') 
+    def generate_quiz_question(self, quiz_type: str) -> Question:
+        """퀴즈 문제 생성 (정답 값 하나 + 서로 다른 오답 값 3개)"""
+        max_rarity = QUIZ_MAX_RARITY.get(quiz_type, 5)
+        _question, answer_field = QUESTION_SPECS.get(quiz_type, DEFAULT_QUESTION_SPEC)
+        sampled = self.bank.answer_index(max_rarity).sample(answer_field, 4, self.rng)
 
-    def generate_quiz_question(self, quiz_type: str) -> Dict[str, Any]:
-        """퀴즈 문제 생성 (새 구조)"""
-        
-        # 퀴즈 유형별 캐릭터 필터링
-        if quiz_type == "silhouette_quiz":
-            # 실루엣 퀴즈는 전체 캐릭터 대상
-            characters = self.get_random_characters(4, use_all_characters=True)
-        elif quiz_type in ["guess_name", "guess_element", "guess_weapon"]:
-            # 이름/속성/무기 맞추기는 3-4성 최대
-            characters = self.get_random_characters(4, max_rarity=4)
-        else:
-            # 새로운 퀴즈 모드들은 전체 캐릭터 사용
-            characters = self.get_random_characters(4, use_all_characters=True)
-        
         # 캐릭터가 없으면 에러 처리
-        if not characters:
-            return {
-                'question': "데이터가 부족합니다. 스크래퍼를 실행해주세요.",
-                'options': ['데이터 없음'],
-                'correct_answer': '데이터 없음',
-                'hint_image': '',
-                'character_info': {},
-                'quiz_type': quiz_type
-            }
-        
-        correct_char = random.choice(characters)
-        
-        if quiz_type == "guess_name":
-            question = "이 캐릭터의 이름은 무엇일까요? (3-4성 최대)"
-            hint_image = safe_icon_to_data_uri(correct_char.get('캐릭터아이콘경로', ''))
-            options = [char.get('캐릭터명', '') for char in characters]
-            correct_answer = correct_char.get('캐릭터명', '')
-            
-        elif quiz_type == "guess_rarity":
-            question = "이 캐릭터의 희귀도는 무엇일까요?"
-            hint_image = safe_icon_to_data_uri(correct_char.get('캐릭터아이콘경로', ''))
-            options = [char.get('희귀도', '') for char in characters]
-            correct_answer = correct_char.get('희귀도', '')
-            
-        elif quiz_type == "guess_element":
-            question = "이 캐릭터의 속성은 무엇일까요? (3-4성 최대)"
-            hint_image = safe_icon_to_data_uri(correct_char.get('캐릭터아이콘경로', ''))
-            options = [char.get('속성명리스트', '') for char in characters]
-            correct_answer = correct_char.get('속성명리스트', '')
-            
-        elif quiz_type == "guess_weapon":
-            question = "이 캐릭터가 사용하는 무기는 무엇일까요? (3-4성 최대)"
-            hint_image = safe_icon_to_data_uri(correct_char.get('캐릭터아이콘경로', ''))
-            options = [char.get('무기명리스트', '') for char in characters]
-            correct_answer = correct_char.get('무기명리스트', '')
-            
-        elif quiz_type == "guess_personality":
-            question = "이 캐릭터의 퍼스널리티는 무엇일까요?"
-            hint_image = safe_icon_to_data_uri(correct_char.get('캐릭터아이콘경로', ''))
-            options = [char.get('퍼스널리티리스트', '') for char in characters]
-            correct_answer = correct_char.get('퍼스널리티리스트', '')
-            
-        elif quiz_type == "guess_release_date":
-            question = "이 캐릭터의 출시일은 언제일까요?"
-            hint_image = safe_icon_to_data_uri(correct_char.get('캐릭터아이콘경로', ''))
-            options = [char.get('출시일', '') for char in characters]
-            correct_answer = correct_char.get('출시일', '')
-            
-        elif quiz_type == "silhouette_quiz":
-            question = "이 실루엣의 캐릭터는 누구일까요?"
-            hint_image = safe_icon_to_data_uri(correct_char.get('캐릭터아이콘경로', ''))
-            options = [char.get('캐릭터명', '') for char in characters]
-            correct_answer = correct_char.get('캐릭터명', '')
-            
+        if sampled is None:
+            return Question(quiz_type, -1, '데이터 없음', ('데이터 없음',))
+
+        row, correct_answer, options = sampled
+        return Question(quiz_type, int(self.bank.pool(max_rarity)[row]), correct_answer, tuple(options))
+
+    def generate_questions(self, quiz_type: str, n: int, n_options: int = 4) -> List[Question]:
+        """
+        퀴즈 문제 n개를 한 번에 생성 (테스트/내보내기용)
+
+        정답/오답 값 선택은 AnswerIndex.sample_many()로 한 번에 처리합니다.
+        """
+        max_rarity = QUIZ_MAX_RARITY.get(quiz_type, 5)
+        _question, answer_field = QUESTION_SPECS.get(quiz_type, DEFAULT_QUESTION_SPEC)
+        pool = self.bank.pool(max_rarity)
+        sampled = self.bank.answer_index(max_rarity).sample_many(answer_field, n, n_options, self.rng)
+        return [Question(quiz_type, int(pool[row]), correct_answer, tuple(options))
+                for row, correct_answer, options in sampled]
+
+    def fill_prefetch(self, quiz_type: str):
+        """
+        quiz_type의 다음 문제를 PREFETCH_DEPTH개까지 미리 준비
+
+        보기 선택은 여기서 바로 하고(난수 생성기는 세션 스레드에서만 사용),
+        힌트 이미지 읽기/인코딩만 스레드 풀에 맡겨 공용 아이콘 캐시에 올려 둡니다.
+        """
+        queue = self.prefetch_queues.setdefault(quiz_type, deque())
+        while len(queue) < PREFETCH_DEPTH:
+            question = self.generate_quiz_question(quiz_type)
+            if self.executor is None:
+                future = Future()
+                future.set_result(self.bank.warm_images(question))
+            else:
+                future = self.executor.submit(self.bank.warm_images, question)
+            queue.append((question, future))
+
+    def next_question(self, quiz_type: str) -> Question:
+        """미리 준비된 다음 문제를 꺼냄 (이미지 준비가 끝나지 않았거나 큐가 비어 있으면 미스)"""
+        queue = self.prefetch_queues.get(quiz_type)
+        if queue and queue[0][1].done():
+            self.prefetch_stats['hits'] += 1
+            question, _future = queue.popleft()
         else:
-            # 기본 이름 맞추기
-            question = "이 캐릭터의 이름은 무엇일까요?"
-            hint_image = safe_icon_to_data_uri(correct_char.get('캐릭터아이콘경로', ''))
-            options = [char.get('캐릭터명', '') for char in characters]
-            correct_answer = correct_char.get('캐릭터명', '')
-        
-        return {
-            'question': question,
-            'options': options,
-            'correct_answer': correct_answer,
-            'hint_image': hint_image,
-            'character_info': correct_char,
-            'quiz_type': quiz_type
-        }
+            self.prefetch_stats['misses'] += 1
+            if queue:
+                question, future = queue.popleft()
+                future.result()
+            else:
+                question = self.generate_quiz_question(quiz_type)
+        self.fill_prefetch(quiz_type)
+        self.question_seq += 1
+        return question
+
+    def memory_bytes(self) -> int:
+        """세션이 가진 상태의 대략적인 메모리 (공유 QuizBank/스레드 풀/통계 저장소 제외)"""
+        return _deep_sizeof(self, {id(self.bank), id(self.executor), id(self.stats_store)})
 
     def process_answer(self, selected_answer: str, correct_answer: str, quiz_type: str):
         """답안 처리 및 점수 계산"""
-        is_correct = normalize_text(selected_answer) == normalize_text(correct_answer)
+        # 선택지와 정답은 같은 정규화된 데이터에서 나오므로 그대로 비교
+        is_correct = selected_answer == correct_answer
         
         # 시간 계산
         if self.question_start_time:
             time_taken = time.time() - self.question_start_time
         else:
             time_taken = 0
+        self.question_start_time = None  # 답한 문제의 타이머는 멈춤 (시간 초과 처리 반복 방지)
         
         # 점수 계산 (시간 보너스 포함)
         base_score = 10
@@ -491,15 +608,6 @@ class QuizGame:
             self.session_stats['category_stats'][quiz_type]['correct'] += 1
             self.session_stats['category_stats'][quiz_type]['total'] += 1
             
-            # 정답 문제 기록
-            self.correct_questions.append({
-                'question': self.current_question_data['question'],
-                'correct_answer': correct_answer,
-                'user_answer': selected_answer,
-                'quiz_type': quiz_type,
-                'time_taken': time_taken,
-                'score': total_score
-            })
             
         else:
             # 오답인 경우
@@ -511,18 +619,25 @@ class QuizGame:
                 self.session_stats['category_stats'][quiz_type] = {'correct': 0, 'total': 0}
             self.session_stats['category_stats'][quiz_type]['total'] += 1
             
-            # 틀린 문제 기록
-            self.wrong_questions.append({
-                'question': self.current_question_data['question'],
-                'correct_answer': correct_answer,
-                'user_answer': selected_answer,
-                'quiz_type': quiz_type,
-                'time_taken': time_taken
-            })
         
         self.total_questions += 1
         self.session_stats['total_time'] += time_taken
         
+        # 문제 기록 (문제 객체와 보기 문자열은 참조만 보관)
+        question = self.current_question_data or Question(quiz_type, -1, correct_answer, ())
+        self.last_answer = AnswerRecord(question, selected_answer, is_correct, time_taken,
+                                        total_score if is_correct else 0, self.combo_count)
+        (self.correct_questions if is_correct else self.wrong_questions).append(self.last_answer)
+        
+        if self.stats_store is not None:
+            char_id = self.bank.repository.character_id(question.row) if question.row >= 0 else None
+            try:
+                self.stats_store.record_answer(self.session_id, quiz_type, is_correct, time_taken, total_score,
+                                               combo=self.max_combo, hints_used=self.hints_used,
+                                               character_id=char_id, question_seq=self.question_seq)
+            except sqlite3.Error as e:
+                print(f"⚠️ 퀴즈 통계 기록 실패: {e}")
+        
         return {
             'is_correct': is_correct,
             'score': total_score,
@@ -535,12 +650,13 @@ def main():
     """메인 앱 함수"""
     st.title("🎮 Another Eden 퀴즈쇼")
     
-    # 데이터 로드
-    df = load_character_data()
+    # 데이터 로드 (문제 생성용 데이터는 모든 세션이 공유)
+    repository = load_character_data()
+    bank = get_quiz_bank(repository, repository.version)
     
     # 세션 상태 초기화
     if 'game' not in st.session_state:
-        st.session_state.game = QuizGame(df)
+        st.session_state.game = QuizGame(bank, executor=get_prefetch_executor(), stats_store=get_stats_store())
     
     if 'current_quiz' not in st.session_state:
         st.session_state.current_quiz = None
@@ -578,6 +694,7 @@ def main():
         )
         
         quiz_type = quiz_types[selected_quiz_type]
+        game.fill_prefetch(quiz_type)
         
         # 타이머 설정
         enable_timer = st.checkbox("⏱️ 타이머 사용", value=True)
@@ -586,10 +703,11 @@ def main():
         
         # 새 문제 생성 버튼
         if st.button("🔄 새 문제 생성", use_container_width=True):
-            st.session_state.current_quiz = game.generate_quiz_question(quiz_type)
+            st.session_state.current_quiz = game.next_question(quiz_type)
             st.session_state.quiz_answered = False
             st.session_state.show_result = False
             game.silhouette_revealed = False
+            game.reveal_stage = 0
             game.retry_count = 0
             game.current_question_data = st.session_state.current_quiz
             game.current_quiz_type = quiz_type
@@ -608,6 +726,24 @@ def main():
             st.metric("최대 콤보", f"{game.max_combo}")
             st.metric("총 문제 수", game.total_questions)
         
+        # 전체 기록 (집계 테이블만 조회)
+        if game.stats_store is not None:
+            with st.expander("🏆 전체 기록"):
+                try:
+                    quiz_names = {value: name for name, value in quiz_types.items()}
+                    for stats_type, stats in game.stats_store.accuracy_by_type().items():
+                        st.caption(f"{quiz_names.get(stats_type, stats_type)}: "
+                                   f"{stats['accuracy'] * 100:.1f}% ({stats['correct']}/{stats['total']})")
+                    for rank, session in enumerate(game.stats_store.top_scores(3), 1):
+                        st.caption(f"{rank}위 {session['score']:.0f}점 · {session['ended_at'][:10]}")
+                except sqlite3.Error as e:
+                    st.caption(f"기록을 불러오지 못했습니다: {e}")
+        
+        prefetch = game.prefetch_stats
+        if prefetch['hits'] + prefetch['misses']:
+            st.caption(f"⚡ 미리 준비된 문제: 적중 {prefetch['hits']} / 미스 {prefetch['misses']}")
+        st.caption(f"💾 세션 메모리: {game.memory_bytes() / 1024:.1f} KB")
+        
         # 틀린 문제 보기 버튼
         if game.wrong_questions:
             if st.button("❌ 틀린 문제 보기", use_container_width=True):
@@ -622,31 +758,45 @@ def main():
         with st.container():
             st.markdown(f"""
             <div class="quiz-container">
-                <h2 class="quiz-question">{quiz['question']}</h2>
+                <h2 class="quiz-question">{quiz.text}</h2>
             """, unsafe_allow_html=True)
             
-            # 이미지 표시
-            if quiz['hint_image']:
+            # 이미지 표시 (세션에는 행 위치만 있고 이미지는 공용 캐시에서 읽음)
+            hint_image = bank.hint_image(quiz.row)
+            if hint_image:
                 if quiz_type == "silhouette_quiz" and not game.silhouette_revealed:
-                    # 실루엣 모드
-                    st.markdown(f"""
-                    <img src="{quiz['hint_image']}" 
-                         class="silhouette-image" 
-                         style="max-width: 200px; height: auto; margin: 1rem auto; display: block;">
-                    """, unsafe_allow_html=True)
+                    # 실루엣 모드: 현재 공개 단계 이미지만 보냄 (원본은 공개 후에만)
+                    reveal_images = bank.reveal_stages(quiz.row)
+                    if reveal_images:
+                        stage = min(game.reveal_stage, len(reveal_images) - 1)
+                        st.markdown(f"""
+                        <img src="{safe_icon_to_data_uri(reveal_images[stage])}" 
+                             style="width: 200px; height: auto; margin: 1rem auto; display: block; image-rendering: pixelated;">
+                        """, unsafe_allow_html=True)
+                    else:
+                        # 공개 단계 이미지가 아직 생성되지 않은 경우 CSS로 가림
+                        st.markdown(f"""
+                        <img src="{hint_image}" 
+                             class="silhouette-image" 
+                             style="max-width: 200px; height: auto; margin: 1rem auto; display: block;">
+                        """, unsafe_allow_html=True)
                     
-                    if st.button("👁️ 실루엣 보기", use_container_width=True):
-                        game.silhouette_revealed = True
+                    has_next_stage = game.reveal_stage + 1 < len(reveal_images)
+                    if st.button("🔍 조금 더 보기" if has_next_stage else "👁️ 실루엣 보기", use_container_width=True):
+                        if has_next_stage:
+                            game.reveal_stage += 1
+                        else:
+                            game.silhouette_revealed = True
                         st.rerun()
                 else:
                     # 일반 모드
                     st.markdown(f"""
-                    <img src="{quiz['hint_image']}" 
+                    <img src="{hint_image}" 
                          style="max-width: 200px; height: auto; margin: 1rem auto; display: block;">
                     """, unsafe_allow_html=True)
             
             # 타이머 표시
-            if enable_timer and game.question_start_time:
+            if enable_timer and game.question_start_time and not st.session_state.quiz_answered:
                 elapsed = time.time() - game.question_start_time
                 remaining = max(0, game.time_limit - elapsed)
                 
@@ -654,7 +804,7 @@ def main():
                     st.error("⏰ 시간 초과!")
                     st.session_state.quiz_answered = True
                     st.session_state.show_result = True
-                    result = game.process_answer("", quiz['correct_answer'], quiz_type)
+                    result = game.process_answer("", quiz.correct_answer, quiz_type)
                     st.rerun()
                 else:
                     st.markdown(f"""
@@ -667,9 +817,8 @@ def main():
             if not st.session_state.quiz_answered:
                 st.markdown('<div class="quiz-options">', unsafe_allow_html=True)
                 
-                # 답안 섞기
-                options = quiz['options'].copy()
-                random.shuffle(options)
+                # 보기 순서는 문제 생성 시 이미 무작위 (rerun마다 섞으면 누른 버튼과 답이 어긋남)
+                options = quiz.options
                 
                 cols = st.columns(2)
                 for i, option in enumerate(options):
@@ -677,22 +826,23 @@ def main():
                     if col.button(option, key=f"option_{i}", use_container_width=True):
                         st.session_state.quiz_answered = True
                         st.session_state.show_result = True
-                        result = game.process_answer(option, quiz['correct_answer'], quiz_type)
+                        result = game.process_answer(option, quiz.correct_answer, quiz_type)
                         st.rerun()
                 
                 st.markdown('</div>', unsafe_allow_html=True)
             
             # 결과 표시
             if st.session_state.show_result:
-                if 'result' in locals():
-                    if result['is_correct']:
-                        st.success(f"✅ 정답입니다! +{result['score']:.1f}점")
-                        if result['combo'] > 1:
-                            st.info(f"🔥 콤보: {result['combo']}연속 정답!")
+                result = game.last_answer
+                if result is not None and result.question is quiz:
+                    if result.is_correct:
+                        st.success(f"✅ 정답입니다! +{result.score:.1f}점")
+                        if result.combo > 1:
+                            st.info(f"🔥 콤보: {result.combo}연속 정답!")
                     else:
-                        st.error(f"❌ 틀렸습니다. 정답: {quiz['correct_answer']}")
+                        st.error(f"❌ 틀렸습니다. 정답: {quiz.correct_answer}")
                     
-                    st.info(f"⏱️ 소요 시간: {result['time_taken']:.1f}초")
+                    st.info(f"⏱️ 소요 시간: {result.time_taken:.1f}초")
                 
                 # 다음 문제 버튼들
                 col1, col2 = st.columns(2)
@@ -701,7 +851,8 @@ def main():
                     if st.button("🔄 다음 문제", key="next_btn", use_container_width=True):
                         game.retry_count = 0
                         game.silhouette_revealed = False
-                        st.session_state.current_quiz = game.generate_quiz_question(quiz_type)
+                        game.reveal_stage = 0
+                        st.session_state.current_quiz = game.next_question(quiz_type)
                         st.session_state.quiz_answered = False
                         st.session_state.show_result = False
                         game.current_question_data = st.session_state.current_quiz
@@ -714,7 +865,8 @@ def main():
                     if st.button("🎯 자동 다음 문제", key="auto_next_btn", use_container_width=True):
                         game.retry_count = 0
                         game.silhouette_revealed = False
-                        st.session_state.current_quiz = game.generate_quiz_question(quiz_type)
+                        game.reveal_stage = 0
+                        st.session_state.current_quiz = game.next_question(quiz_type)
                         st.session_state.quiz_answered = False
                         st.session_state.show_result = False
                         game.current_question_data = st.session_state.current_quiz
@@ -723,37 +875,38 @@ def main():
                             game.question_start_time = time.time()
                         st.rerun()
             
-            # 캐릭터 상세 정보 표시
-            char_info = quiz['character_info']
-            st.markdown(f"""
-            <div class="character-hint">
-                <h4>📋 캐릭터 정보</h4>
-                <ul>
-                    <li><strong>이름:</strong> {char_info.get('캐릭터명', 'N/A')}</li>
-                    <li><strong>희귀도:</strong> {char_info.get('희귀도', 'N/A')}</li>
-                    <li><strong>속성:</strong> {char_info.get('속성명리스트', 'N/A')}</li>
-                    <li><strong>무기:</strong> {char_info.get('무기명리스트', 'N/A')}</li>
-                    <li><strong>퍼스널리티:</strong> {char_info.get('퍼스널리티리스트', 'N/A')}</li>
-                    <li><strong>출시일:</strong> {char_info.get('출시일', 'N/A')}</li>
-                </ul>
-            </div>
-            """, unsafe_allow_html=True)
+            # 캐릭터 상세 정보 표시 (정답이 드러나므로 답한 뒤에만)
+            if st.session_state.quiz_answered:
+                char_info = bank.repository.record(quiz.row) if quiz.row >= 0 else {}
+                st.markdown(f"""
+                <div class="character-hint">
+                    <h4>📋 캐릭터 정보</h4>
+                    <ul>
+                        <li><strong>이름:</strong> {char_info.get('캐릭터명', 'N/A')}</li>
+                        <li><strong>희귀도:</strong> {char_info.get('희귀도', 'N/A')}</li>
+                        <li><strong>속성:</strong> {char_info.get('속성명리스트', 'N/A')}</li>
+                        <li><strong>무기:</strong> {char_info.get('무기명리스트', 'N/A')}</li>
+                        <li><strong>퍼스널리티:</strong> {char_info.get('퍼스널리티리스트', 'N/A')}</li>
+                        <li><strong>출시일:</strong> {char_info.get('출시일', 'N/A')}</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
             
             st.markdown('</div>', unsafe_allow_html=True)
     
     # 틀린 문제 표시
     if st.session_state.get('show_wrong_questions', False) and game.wrong_questions:
         st.markdown("## ❌ 틀린 문제 목록")
-        st.info(f"총 {len(game.wrong_questions)}개의 문제를 틀렸습니다.")
+        st.info(f"총 {game.session_stats['wrong_answers']}개의 문제를 틀렸습니다. (최근 {len(game.wrong_questions)}개 표시)")
         
         for i, wrong_q in enumerate(game.wrong_questions, 1):
-            with st.expander(f"문제 {i}: {wrong_q['question']}", expanded=False):
+            with st.expander(f"문제 {i}: {wrong_q.question.text}", expanded=False):
                 st.markdown(f"""
-                **문제:** {wrong_q['question']}  
-                **정답:** {wrong_q['correct_answer']}  
-                **내 답:** {wrong_q['user_answer']}  
-                **퀴즈 유형:** {wrong_q['quiz_type']}  
-                **소요 시간:** {wrong_q['time_taken']:.1f}초
+                **문제:** {wrong_q.question.text}  
+                **정답:** {wrong_q.question.correct_answer}  
+                **내 답:** {wrong_q.user_answer}  
+                **퀴즈 유형:** {wrong_q.question.quiz_type}  
+                **소요 시간:** {wrong_q.time_taken:.1f}초
                 """)
         
         if st.button("🔙 퀴즈로 돌아가기", use_container_width=True):
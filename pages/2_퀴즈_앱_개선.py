@@ -8,9 +8,8 @@ import streamlit as st
 import pandas as pd
 import random
 import time
-import os
+import sys
 from pathlib import Path
-import base64
 
 # 경로 설정
 BASE_DIR = Path(__file__).parent.parent.resolve()
@@ -18,6 +17,11 @@ DATA_DIR = BASE_DIR / "04_data"
 CSV_DIR = DATA_DIR / "csv"
 IMAGE_DIR = DATA_DIR / "images" / "character_art"
 
+# 공용 아이콘 캐시 (메모리 LRU + 디스크, 앱 간 공유)
+sys.path.insert(0, str(BASE_DIR / "03_apps" / "shared"))
+from icon_cache import icon_to_data_uri
+from character_repository import get_character_repository
+
 # 페이지 설정
 st.set_page_config(
     page_title="🎮 어나더에덴 퀴즈",
@@ -207,27 +211,23 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def safe_icon_to_data_uri(path):
-    """이미지를 data URI로 변환"""
+def safe_icon_to_data_uri(path, display_px=None):
+    """이미지를 data URI로 변환 (display_px를 주면 표시 크기에 맞는 파생본 사용)"""
     if not path or pd.isna(path):
         return ""
-    try:
-        if os.path.exists(path):
-            with open(path, 'rb') as f:
-                data = base64.b64encode(f.read()).decode()
-                return f"data:image/png;base64,{data}"
-    except:
-        pass
-    return ""
+    # 캐릭터 데이터의 아이콘 경로는 프로젝트 기준 상대 경로
+    return icon_to_data_uri(BASE_DIR / path, default="", display_px=display_px)
 
-@st.cache_data
 def load_character_data():
-    """캐릭터 데이터 로드"""
+    """캐릭터 데이터 로드 (모든 페이지가 공유하는 읽기 전용 저장소의 데이터프레임)"""
     try:
-        df = pd.read_csv(CSV_DIR / "eden_quiz_data.csv", encoding='utf-8-sig')
-        return df.fillna('')
-    except:
+        repository = get_character_repository()
+    except Exception as e:
+        print(f"⚠️ 캐릭터 데이터 로드 실패: {e}")
+        repository = None
+    if repository is None:
         return pd.DataFrame()
+    return repository.df
 
 class QuickQuizGame:
     """간단한 퀴즈 게임 클래스"""
@@ -268,7 +268,7 @@ class QuickQuizGame:
         
         return {
             "question": q_config["question"],
-            "image": safe_icon_to_data_uri(correct_char.get(q_config["image_key"], "")),
+            "image": safe_icon_to_data_uri(correct_char.get(q_config["image_key"], ""), display_px=200),
             "options": [char.get(q_config["answer_key"], "N/A") for char in characters],
             "correct_answer": correct_char.get(q_config["answer_key"], "N/A"),
             "character_info": correct_char